@@ -9,6 +9,8 @@ export async function GET() {
     const rootDir = process.cwd();
     const analyticsPath = path.join(rootDir, 'data', 'analytics.json');
     const usNewsPath = path.join(rootDir, 'public', 'us-news-realtime.json');
+    // 크롤러 지표 스냅샷 (crawler/metrics.py가 작업 회차마다 기록, 엔진과 같은 서버에서 실행할 때만 존재)
+    const metricsDir = process.env.CRAWLER_METRICS_DIR || path.join(rootDir, 'crawler', 'cache', 'metrics');
 
     let statsData = {
         total_visitors: 0,
@@ -82,6 +84,68 @@ export async function GET() {
         console.error("News read failed:", error);
     }
 
+    let crawlerMetrics: any = null;
+    let aiLatency: number | null = null;
+
+    try {
+        const snapshots = fs.existsSync(metricsDir)
+            ? fs.readdirSync(metricsDir)
+                .filter(name => name.startsWith('metrics-') && name.endsWith('.json'))
+                .map(name => JSON.parse(fs.readFileSync(path.join(metricsDir, name), 'utf-8')))
+            : [];
+
+        if (snapshots.length > 0) {
+            const counters = snapshots.flatMap((s: any) => s.counters || []);
+            const summaries = snapshots.flatMap((s: any) => s.summaries || []);
+            const sumCounter = (name: string, match: (labels: any) => boolean = () => true) =>
+                counters.filter((c: any) => c.name === name && match(c.labels)).reduce((acc: number, c: any) => acc + c.value, 0);
+            const avgOf = (name: string, match: (labels: any) => boolean = () => true) => {
+                const rows = summaries.filter((s: any) => s.name === name && match(s.labels));
+                const count = rows.reduce((acc: number, s: any) => acc + s.count, 0);
+                return count > 0 ? rows.reduce((acc: number, s: any) => acc + s.sum, 0) / count : null;
+            };
+            const round = (value: number | null, digits = 3) => value === null ? null : Number(value.toFixed(digits));
+
+            const cacheNames = Array.from(new Set(counters.filter((c: any) => c.name === 'cache_requests_total').map((c: any) => c.labels.cache))) as string[];
+            const cacheHitRates: Record<string, number | null> = {};
+            cacheNames.forEach(cache => {
+                const hits = sumCounter('cache_requests_total', l => l.cache === cache && l.result === 'hit');
+                const total = sumCounter('cache_requests_total', l => l.cache === cache);
+                cacheHitRates[cache] = total > 0 ? round(hits / total) : null;
+            });
+
+            aiLatency = avgOf('llm_request_seconds');
+            crawlerMetrics = {
+                services: snapshots.map((s: any) => ({ service: s.service, updatedAt: s.updated_at })),
+                fetchLatency: summaries
+                    .filter((s: any) => s.name === 'news_fetch_seconds')
+                    .map((s: any) => ({ source: s.labels.source, avg: round(s.avg), max: round(s.max), count: s.count })),
+                fetchBytes: sumCounter('news_fetch_bytes_total'),
+                httpErrors: sumCounter('http_errors_total'),
+                cacheHitRates: cacheHitRates,
+                llm: {
+                    requests: sumCounter('llm_requests_total'),
+                    failed: sumCounter('llm_requests_total', l => l.result !== 'ok'),
+                    promptTokens: sumCounter('llm_tokens_total', l => l.kind === 'prompt'),
+                    completionTokens: sumCounter('llm_tokens_total', l => l.kind === 'completion'),
+                    avgLatency: round(aiLatency),
+                },
+                translationLatency: round(avgOf('translation_seconds')),
+                itemsFiltered: sumCounter('news_items_filtered_total'),
+                itemsDeduplicated: sumCounter('news_items_deduplicated_total'),
+                itemsPublished: sumCounter('news_items_published_total'),
+                publishTime: round(avgOf('publish_seconds')),
+                slowestTickers: summaries
+                    .filter((s: any) => s.name === 'alpha_ticker_seconds')
+                    .sort((a: any, b: any) => b.avg - a.avg)
+                    .slice(0, 5)
+                    .map((s: any) => ({ ticker: s.labels.ticker, avg: round(s.avg), max: round(s.max) })),
+            };
+        }
+    } catch (e) {
+        console.error("Crawler metrics read failed", e);
+    }
+
     const today = new Date().toISOString().split('T')[0];
     const month = today.substring(0, 7);
 
@@ -91,13 +155,15 @@ export async function GET() {
         weeklySignups: weeklySignups,
         monthlySignups: monthlySignups,
         activeCrawlers: 2,
-        aiLoad: `${(0.8 + Math.random() * 4 / 10).toFixed(2)}s`,
+        // 실측 LLM 평균 응답 시간 (지표가 없으면 기존 추정치)
+        aiLoad: aiLatency !== null ? `${aiLatency.toFixed(2)}s` : `${(0.8 + Math.random() * 4 / 10).toFixed(2)}s`,
         historyCount: totalNewsCount,
         timestamp: new Date().toISOString(),
         crawlerStatus: crawlerStatus,
         recentLogs: recentLogs,
         todayVisitors: statsData.daily_visitors[today] || 0,
-        monthlyVisitors: statsData.monthly_visitors[month] || 0
+        monthlyVisitors: statsData.monthly_visitors[month] || 0,
+        crawlerMetrics: crawlerMetrics
     };
 
     return NextResponse.json(stats);
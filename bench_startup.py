@@ -0,0 +1,157 @@
+"""
+Startup Benchmark (콜드 스타트 회귀 방지)
+- 진입점 모듈마다 새 인터프리터를 띄워 측정 (GitHub Actions / 엔진 재시작과 같은 조건)
+  import: 모듈 import 시간 / ready: import + 객체 생성 / first_fetch: 첫 네트워크 요청 완료까지
+- import 시점에 무거운 의존성(pandas, openai, deep_translator, bs4)이 로드되면 실패 (지연 로드 보장)
+- python -X importtime 결과에서 가장 무거운 import 상위 항목 출력
+- 기준 시간(초)을 넘거나 지연 로드가 깨지면 exit code 1
+  --warn-only: 시간 기준 초과는 경고만 (공유 CI 러너는 측정치가 들쭉날쭉), 지연 로드 위반은 그대로 실패
+
+사용법: python bench_startup.py [--repeat 3] [--no-fetch] [--warn-only] [--json PATH]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# budget: 단계별 허용 시간(초, 중앙값 기준). CI 러너가 느려도 통과하도록 로컬 측정치의 3~5배 여유
+ENTRY_POINTS = {
+    'crawler.us_news_crawler': {
+        'lazy': ('openai', 'deep_translator', 'bs4', 'pandas'),
+        'setup': "obj = target.StockNewsCrawler()",
+        'fetch': "obj.fetch_source(obj.sources[0], limit=5, timeout=10)",
+        'budget': {'import': 0.4, 'ready': 0.8, 'first_fetch': 8.0},
+    },
+    'crawler.alpha_analyzer': {
+        'lazy': ('pandas', 'openai', 'bs4'),
+        'setup': "obj = target.AlphaAnalyzer()",
+        'fetch': "obj.fetch_quotes(obj.tickers[:5])",
+        'budget': {'import': 0.5, 'ready': 0.8, 'first_fetch': 8.0},
+    },
+    'engine_start': {
+        'lazy': ('numpy', 'pandas', 'openai', 'deep_translator', 'bs4'),
+        'setup': "obj = target.build_scheduler(state_path=None)",
+        'fetch': None,
+        'budget': {'import': 0.25, 'ready': 0.8},
+    },
+}
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module} as target
+imported = time.perf_counter()
+loaded = [name for name in {lazy!r} if name in sys.modules]
+{setup}
+ready = time.perf_counter()
+{fetch}
+fetched = time.perf_counter()
+print("BENCH " + json.dumps({{'import': imported - started, 'ready': ready - started,
+                             'first_fetch': fetched - started if {has_fetch} else None, 'loaded': loaded}}))
+"""
+
+
+def run_probe(module, spec, fetch=True):
+    do_fetch = fetch and spec['fetch'] is not None
+    code = PROBE.format(module=module, lazy=spec['lazy'], setup=spec['setup'],
+                        fetch=spec['fetch'] if do_fetch else "pass", has_fetch=do_fetch)
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True,
+                          encoding='utf-8', errors='replace', timeout=120)
+    elapsed = time.perf_counter() - started
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith("BENCH "):
+            result = json.loads(line[len("BENCH "):])
+            result['process'] = elapsed
+            return result
+    raise RuntimeError(f"{module} probe failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+
+def import_profile(module, top=8):
+    """-X importtime 출력 -> 대상 모듈이 직접 import한 모듈 중 누적 시간 상위 (초)"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"], cwd=ROOT,
+                          capture_output=True, text=True, encoding='utf-8', errors='replace', timeout=120)
+    entries, children = [], []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split('|')
+        try:
+            cumulative = int(parts[1]) / 1e6
+        except (IndexError, ValueError):
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        # 자식 import가 부모보다 먼저 출력됨 -> 최상위(depth 0) 줄이 나올 때까지 모아 둠
+        if depth == 1:
+            children.append((cumulative, name.strip()))
+        elif depth == 0:
+            if name.strip() == module:
+                entries = [(cumulative, module)] + sorted(children, reverse=True)[:top]
+            children = []
+    return entries
+
+
+def benchmark(repeat=3, fetch=True):
+    report = {}
+    for module, spec in ENTRY_POINTS.items():
+        runs = [run_probe(module, spec, fetch=fetch) for _ in range(repeat)]
+        stats = {}
+        for stage in ('import', 'ready', 'first_fetch', 'process'):
+            values = [run[stage] for run in runs if run.get(stage) is not None]
+            if values:
+                stats[stage] = round(statistics.median(values), 4)
+        over_budget = [f"{stage} {stats[stage]}s > {budget}s" for stage, budget in spec['budget'].items()
+                       if stage in stats and stats[stage] > budget]
+        failures = []
+        loaded = sorted({name for run in runs for name in run['loaded']})
+        if loaded:
+            failures.append(f"loaded at import: {', '.join(loaded)}")
+        report[module] = {
+            'stats': stats,
+            'budget': spec['budget'],
+            'profile': [{'module': name, 'seconds': round(seconds, 4)} for seconds, name in import_profile(module)],
+            'over_budget': over_budget,
+            'failures': failures,
+        }
+    return report
+
+
+def print_report(report, warn_only=False):
+    for module, result in report.items():
+        print("-" * 60)
+        stats = result['stats']
+        print(f"{module}: " + " / ".join(f"{stage} {value}s" for stage, value in stats.items()))
+        for entry in result['profile']:
+            print(f"  {entry['seconds']:>8.4f}s  {entry['module']}")
+        for slow in result['over_budget']:
+            print(f"  [{'WARN' if warn_only else 'FAIL'}] {slow}")
+        for failure in result['failures']:
+            print(f"  [FAIL] {failure}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Crawler startup benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per entry point (median is reported)')
+    parser.add_argument('--no-fetch', action='store_true', help='Skip the network time-to-first-fetch stage')
+    parser.add_argument('--warn-only', action='store_true', help='Report time budget overruns without failing')
+    parser.add_argument('--json', metavar='PATH', help='Write the report as JSON')
+    args = parser.parse_args()
+
+    report = benchmark(repeat=args.repeat, fetch=not args.no_fetch)
+    print_report(report, warn_only=args.warn_only)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    failed = [module for module, result in report.items()
+              if result['failures'] or (result['over_budget'] and not args.warn_only)]
+    if failed:
+        print(f"[ERROR] Startup regression in: {', '.join(failed)}")
+        sys.exit(1)
+    print("[SUCCESS] Startup within budget.")
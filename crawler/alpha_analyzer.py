@@ -4,192 +4,475 @@ VVIP Alpha Analyzer v2.0 - Multi-Strategy Engine
 - Source: Empire Institutional Data
 """
 
-import requests
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timezone
+import threading
 import time
-import random
-import pandas as pd
+from urllib.parse import quote as url_quote
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from crawler.publisher import get_publisher
+    from crawler.rate_limit import AdaptiveRateLimiter
+    from crawler.http_client import get_client
+    from crawler.indicators import IndicatorState, load_states, save_states
+    from crawler.strategies import decide_row, get_strategy
+    from crawler.ohlcv_store import OhlcvStore, bars_from_chart, bar_from_quote, previous_weekday, STORE_DIR
+    from crawler.intraday_feed import LiveChartFeed, ReplayFeed
+    from crawler.signal_log import SignalDeltaLog, diff_signals, signal_id
+    from crawler.scheduler import Scheduler, MarketHoursTrigger
+    from crawler.metrics import get_metrics
+except ImportError:
+    from publisher import get_publisher
+    from rate_limit import AdaptiveRateLimiter
+    from http_client import get_client
+    from indicators import IndicatorState, load_states, save_states
+    from strategies import decide_row, get_strategy
+    from ohlcv_store import OhlcvStore, bars_from_chart, bar_from_quote, previous_weekday, STORE_DIR
+    from intraday_feed import LiveChartFeed, ReplayFeed
+    from signal_log import SignalDeltaLog, diff_signals, signal_id
+    from scheduler import Scheduler, MarketHoursTrigger
+    from metrics import get_metrics
+
+# 일봉 시그널: 정규장 5분, 프리/애프터마켓 30분, 휴장(야간/주말/NYSE 휴일)에는 쉬고 프리마켓 시작 시 재개
+ALPHA_TRIGGER = MarketHoursTrigger(regular=300, extended=1800, closed=None)
+
+# AWS 차단 방지를 위한 직접 API 호출 (Stealth Mode)
+YAHOO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Referer': 'https://finance.yahoo.com/'
+}
+# quote API는 쿠키(A3) + crumb가 없으면 401 (Invalid Crumb)
+# fc.yahoo.com이 쿠키를 설정하고(응답 자체는 404), 같은 세션으로 getcrumb를 호출해 crumb를 받음
+YAHOO_COOKIE_URL = "https://fc.yahoo.com"
+YAHOO_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+CRUMB_RETRY_SECONDS = 1800   # crumb 발급 실패 시 이 시간 동안은 quote 대신 chart로 보충
 
 class AlphaAnalyzer:
-    def __init__(self):
+    def __init__(self, publisher=None):
         self.tickers = [
             'NVDA', 'TSLA', 'PLTR', 'AAPL', 'AMD', 'MSFT', 'GOOGL', 'META', 'MSTR', 'COIN', 'NFLX', 'SMCI',
             'MARA', 'RIOT', 'SOFI', 'PATH', 'AI'
         ]
         self.output_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'public', 'alpha-signals.json')
+        self.intraday_output_path = os.path.join(os.path.dirname(self.output_path), 'alpha-signals-intraday.json')
+        # [변경 피드] 스냅샷 옆에 new / changed / expired 이벤트만 쌓는 append-only 로그
+        self.delta_log = SignalDeltaLog(os.path.join(os.path.dirname(self.output_path), 'alpha-signals-delta.jsonl'))
+        self.last_signals = self.load_signals()
+        self.intraday_min_bars = 20   # 장중 모드: SMA20이 채워진 뒤부터 시그널 평가
+        # [병렬 수집] 워커 수, 적응형 초당 요청 수 (429 시 자동 감속)
+        # 호스트별 동시 요청 제한 / 재시도 / 커넥션 재사용은 공용 HTTP 클라이언트가 담당
+        self.max_workers = 8
+        self.rate_limiter = AdaptiveRateLimiter(rate=4, min_rate=0.5, max_rate=10, capacity=4)
+        # [로컬 시세 저장소] 최초 1회만 긴 구간(backfill_range) 수집, 이후엔 마지막 봉 이후만 추가
+        self.store = OhlcvStore(interval='1d')
+        self.backfill_range = '1y'
+        self.lookback_bars = 260
+        # [일괄 시세] 이력이 있는 종목은 quote API 한 번에 quote_batch_size개씩 조회 (chart는 보충용)
+        self.quote_batch_size = 50
+        self._crumb = None
+        self._crumb_retry_at = 0.0
+        self._crumb_lock = threading.Lock()
+        # [증분 지표] 티커별 RSI/SMA 상태 - 새 봉만 O(1)로 반영, 실행 간 디스크에 유지
+        self.state_path = os.path.join(os.path.dirname(STORE_DIR), 'indicator_state_1d.json')
+        self.indicator_states = load_states(self.state_path)
+        # [GitHub 발행] 백그라운드 큐 - 분석 루프는 git을 기다리지 않음
+        self.publisher = publisher or get_publisher()
+
+    def chart_url(self, symbol):
+        """저장된 마지막 봉이 있으면 그 날부터 지금까지만, 없으면 backfill_range 전체 요청"""
+        last_ts = self.store.last_timestamp(symbol)
+        base = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d"
+        if last_ts is None:
+            return f"{base}&range={self.backfill_range}"
+        # 마지막 봉(장중 임시 봉일 수 있음)도 다시 받아 확정 값으로 교체
+        return f"{base}&period1={last_ts}&period2={int(time.time())}"
+
+    def request_json(self, url, label):
+        """Yahoo API GET (공용 커넥션 풀 + 적응형 속도 제한 적용). 실패 시 None"""
+        res = self.request(url)
+        if res.status_code != 200:
+            print(f"[WARN] {label}: Stealth fetch failed (Status {res.status_code})")
+            return None
+        return res.json()
+
+    def request(self, url):
+        self.rate_limiter.acquire()
+        res = get_client().get(url, headers=YAHOO_HEADERS, timeout=10, on_throttle=self.rate_limiter.on_throttle)
+        if res.status_code == 200:
+            self.rate_limiter.on_success()
+        return res
 
-    def calculate_rsi(self, data, window=14):
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        # Avoid division by zero
-        rs = gain / loss.replace(0, 0.001)
-        return 100 - (100 / (1 + rs))
+    def get_crumb(self, refresh=False):
+        """quote API용 crumb (프로세스 안에서 재사용, 만료(401) 시 refresh=True로 재발급). 실패 시 None"""
+        with self._crumb_lock:
+            if refresh:
+                self._crumb = None
+            if self._crumb is None and time.monotonic() >= self._crumb_retry_at:
+                try:
+                    # 쿠키 설정용 요청 -> 상태 코드는 확인하지 않음 (쿠키는 공용 세션에 저장됨)
+                    self.request(YAHOO_COOKIE_URL)
+                    res = self.request(YAHOO_CRUMB_URL)
+                    crumb = res.text.strip() if res.status_code == 200 else ''
+                except Exception as e:
+                    print(f"[WARN] Yahoo crumb request failed: {e}")
+                    crumb = ''
+                if crumb and '<' not in crumb and ' ' not in crumb:
+                    self._crumb = crumb
+                else:
+                    self._crumb_retry_at = time.monotonic() + CRUMB_RETRY_SECONDS
+                    print(f"[WARN] Yahoo crumb unavailable. Using chart requests for {CRUMB_RETRY_SECONDS // 60} min.")
+            return self._crumb
 
-    def analyze_stock(self, symbol):
+    def fetch_chart(self, symbol, url=None):
+        """Yahoo chart API 호출 (종목 하나의 봉 이력)"""
+        data = self.request_json(url or self.chart_url(symbol), symbol)
+        if data is None:
+            return None
+        if 'chart' in data and data['chart']['result']:
+            print(f"[SUCCESS] {symbol}: Stealth Fetch Success")
+            return data['chart']['result'][0]
+        print(f"[WARN] {symbol}: Unexpected API response format: {data}")
+        return None
+
+    def fetch_quotes(self, symbols):
+        """Yahoo quote API로 여러 종목 현재가를 요청 한 번에 조회. Returns: {SYMBOL: quote}"""
+        url = f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={','.join(symbols)}"
+        label = f"Quotes x{len(symbols)}"
+        data = None
+        try:
+            for attempt in range(2):
+                crumb = self.get_crumb(refresh=attempt > 0)
+                if crumb is None:
+                    return {}
+                res = self.request(f"{url}&crumb={url_quote(crumb, safe='')}")
+                if res.status_code == 401 and attempt == 0:
+                    # crumb/쿠키 만료 -> 한 번만 재발급 후 재시도
+                    continue
+                if res.status_code != 200:
+                    print(f"[WARN] {label}: Stealth fetch failed (Status {res.status_code})")
+                    return {}
+                data = res.json()
+                break
+        except Exception as e:
+            print(f"[ERROR] {label} Stealth Fetch Error: {e}")
+            return {}
+        results = ((data or {}).get('quoteResponse') or {}).get('result') or []
+        quotes = {quote['symbol'].upper(): quote for quote in results if quote.get('symbol')}
+        if quotes:
+            print(f"[SUCCESS] {label}: {len(quotes)} quote(s) received")
+        return quotes
+
+    def fetch_chart_safe(self, symbol):
         print(f"[{datetime.now().strftime('%H:%M:%S')}] Deep Analyzing {symbol} (Stealth Mode)...")
         try:
-            # AWS 차단 방지를 위한 직접 API 호출 (Stealth Mode)
-            import requests
-            url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=1mo"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Referer': 'https://finance.yahoo.com/'
-            }
-            
-            res = requests.get(url, headers=headers, timeout=10)
-            if res.status_code != 200:
-                print(f"[WARN] {symbol}: Stealth fetch failed (Status {res.status_code})")
-                return None
-                
-            data = res.json()
-            if 'chart' in data and data['chart']['result']:
-                chart_data = data['chart']['result'][0]
-            else:
-                print(f"[WARN] {symbol}: Unexpected API response format: {data}")
-                return None
-                
-            quotes = chart_data['indicators']['quote'][0]
-            timestamps = chart_data.get('timestamp', [])
-            
-            # Close 가격 리스트 추출
-            closes = quotes['close']
-            # None 값 제거 및 데이터 프레임화
-            valid_data = []
-            for i in range(len(closes)):
-                if closes[i] is not None:
-                    valid_data.append(closes[i])
-            
-            if len(valid_data) < 10:
-                print(f"[WARN] {symbol}: Not enough historical data.")
-                return None
-                
-            df = pd.DataFrame({'Close': valid_data})
-            curr_price = df['Close'].iloc[-1]
-            prev_price = df['Close'].iloc[-2]
-            change_pct = ((curr_price - prev_price) / prev_price) * 100
-            
-            print(f"[SUCCESS] {symbol}: Stealth Fetch Success (${curr_price})")
-            
-            # --- STRATEGY 1: RSI (Momentum) ---
-            df['RSI'] = self.calculate_rsi(df['Close'])
-            curr_rsi = df['RSI'].iloc[-1]
-            
-            # --- STRATEGY 2: SMA (Trend) ---
-            df['SMA20'] = df['Close'].rolling(window=20).mean()
-            df['SMA5'] = df['Close'].rolling(window=5).mean()
-            is_golden_cross = False
-            if len(df) >= 20:
-                is_golden_cross = df['SMA5'].iloc[-1] > df['SMA20'].iloc[-1] and df['SMA5'].iloc[-2] <= df['SMA20'].iloc[-2]
-            
-            # --- DECISION ENGINE ---
-            strategy_type = "GENERAL"
-            sentiment = "NEUTRAL"
-            impact_score = random.randint(50, 70)
-            reason = ""
-
-            if curr_rsi < 35:
-                # (생략: 기존 로직 유지)
-                strategy_type = "RSI 반등 (Oversold)"
-                sentiment = "BULLISH"
-                impact_score = 85 + random.randint(0, 10)
-                reason = f"RSI 수치가 {round(curr_rsi, 1)}로 과매도 구간입니다. 단기 반등 확률이 매우 높습니다."
-            elif is_golden_cross:
-                strategy_type = "골든크로스 (Trend)"
-                sentiment = "BULLISH"
-                impact_score = 90 + random.randint(0, 8)
-                reason = "5일 이동평균선이 20일선을 돌파하며 강력한 상승 추세로 진입했습니다."
-            elif change_pct < -3.0:
-                strategy_type = "낙폭 과대 (Risk)"
-                sentiment = "BEARISH"
-                impact_score = 92 + random.randint(0, 5)
-                reason = "단기 급락으로 인해 추가 하락 리스크가 존재합니다. 지지선 확인이 필요합니다."
-            else:
-                strategy_type = "추세 지속 (Neutral)"
-                sentiment = "BULLISH" if change_pct > 0 else "BEARISH"
-                impact_score = random.randint(60, 85)
-                reason = "현재 안정적인 흐름을 유지 중이며, 큰 변동성 시그널은 포착되지 않았습니다."
-
-            target_price = curr_price * (1.15 if sentiment == "BULLISH" else 0.92)
-            stop_loss = curr_price * (0.92 if sentiment == "BULLISH" else 1.05)
-
-            support = round(curr_price * 0.95, 2)
-            resistance = round(curr_price * 1.08, 2)
-            unit = "$"
-            
-            tech_report = f"기술적 지표상 RSI는 {round(curr_rsi, 1)}로 {'과열' if curr_rsi > 70 else '과매도' if curr_rsi < 35 else '안정'}권에 위치하며, 1차 지지선 {unit}{support} 상단에서 강한 하방 경직성을 확보했습니다."
-            fund_report = f"Stock Empire 실시간 감시 엔진이 {symbol}의 수급 변화를 포착했습니다. 현재 {strategy_type} 전략 기반 유의미한 시그널이 발생한 상태입니다."
-            action_plan = f"단기 목표가 {unit}{round(target_price, 2)} 도달 시 분할 익절, {unit}{round(stop_loss, 2)} 이탈 시 선제적 리스크 관리를 권장합니다."
-
-            return {
-                'id': f"{symbol}-{int(time.time())}",
-                'ticker': symbol,
-                'name': symbol,
-                'strategy': strategy_type,
-                'price': round(curr_price, 2),
-                'change_pct': round(change_pct, 2),
-                'sentiment': sentiment,
-                'impact_score': impact_score,
-                'target_price': round(target_price, 2),
-                'stop_loss': round(stop_loss, 2),
-                'ai_reason': reason,
-                'technical_analysis': tech_report,
-                'fundamental_analysis': fund_report,
-                'action_plan': action_plan,
-                'is_real_time': True,
-                'source': 'Stock Empire Stealth AI',
-                'updated_at': datetime.now().isoformat()
-            }
+            return self.fetch_chart(symbol)
         except Exception as e:
             print(f"[ERROR] {symbol} Stealth Fetch Error: {e}")
             return None
 
-    def run_pipeline(self):
+    def update_store(self, symbol):
+        """신규 구간만 받아 로컬 저장소에 추가. Returns: 성공 여부"""
+        chart_data = self.fetch_chart_safe(symbol)
+        if chart_data is None:
+            return False
+        try:
+            self.store.append(symbol, bars_from_chart(chart_data, interval='1d'))
+            return True
+        except Exception as e:
+            print(f"[ERROR] {symbol} OHLCV store update failed: {e}")
+            return False
+
+    def merge_quote(self, symbol, quote):
+        """
+        quote를 오늘 봉으로 저장소에 병합. 저장된 마지막 봉이 직전 거래일보다 오래됐으면
+        (빈 구간이 생기므로) 병합하지 않고 False -> chart로 보충
+        """
+        bars = bar_from_quote(quote, interval='1d')
+        last_ts = self.store.last_timestamp(symbol)
+        if bars is None or last_ts is None:
+            return False
+        bar_ts = int(bars['ts'][0])
+        if bar_ts < last_ts or last_ts < previous_weekday(bar_ts):
+            return False
+        try:
+            self.store.append(symbol, bars)
+            return True
+        except Exception as e:
+            print(f"[ERROR] {symbol} OHLCV store update failed: {e}")
+            return False
+
+    def refresh_store(self, symbols):
+        """
+        저장소 갱신 (요청 수: 종목 수 -> 종목 수 / quote_batch_size)
+        1) 이력이 있는 종목은 quote API로 일괄 조회해 오늘 봉만 병합
+        2) 이력이 없거나 빈 구간이 있는 종목, quote 조회에 실패한 종목만 chart API로 보충
+        Returns: 갱신에 성공한 종목 (입력 순서 유지)
+        """
+        known = [symbol for symbol in symbols if self.store.last_timestamp(symbol) is not None]
+        batches = [known[i:i + self.quote_batch_size] for i in range(0, len(known), self.quote_batch_size)]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='alpha') as executor:
+            quotes = {}
+            for batch_quotes in executor.map(self.fetch_quotes, batches):
+                quotes.update(batch_quotes)
+
+            updated = set()
+            needs_chart = []
+            for symbol in symbols:
+                quote = quotes.get(symbol.upper())
+                if quote is not None and self.merge_quote(symbol, quote):
+                    updated.add(symbol)
+                else:
+                    needs_chart.append(symbol)
+
+            if needs_chart:
+                print(f"[INFO] Chart backfill for {len(needs_chart)} ticker(s): {', '.join(needs_chart)}")
+                for symbol, ok in zip(needs_chart, executor.map(self.update_store, needs_chart)):
+                    if ok:
+                        updated.add(symbol)
+        return [symbol for symbol in symbols if symbol in updated]
+
+    def sync_state(self, symbol):
+        """
+        저장소에서 상태의 마지막 봉 이후(마지막 봉 포함 - 확정 값으로 교체)만 읽어 증분 갱신.
+        상태가 없는 종목은 최근 lookback_bars 봉으로 한 번만 초기화합니다.
+        """
+        bars = self.store.load(symbol)
+        state = self.indicator_states.get(symbol)
+        if state is None or (len(bars) and state.last_ts is not None and int(bars['ts'][-1]) < state.last_ts):
+            # 신규 종목 또는 저장소가 다시 만들어진 경우
+            state = IndicatorState()
+            self.indicator_states[symbol] = state
+            bars = bars[-self.lookback_bars:]
+        elif state.last_ts is not None:
+            bars = bars[np.searchsorted(bars['ts'], state.last_ts):]
+        for ts, close, volume, high, low in zip(bars['ts'], bars['close'], bars['volume'], bars['high'], bars['low']):
+            state.update(ts, close, volume, high, low)
+            # 봉마다 전략을 평가해 조건이 처음 참이 된 봉을 추적 (시그널 id = 발생 봉)
+            state.mark_strategy(decide_row(state.snapshot()))
+        return state
+
+    def analyze_states(self, symbols):
+        """증분 지표 상태의 최신 값으로 시그널 생성 (과거 봉 재계산 없음)"""
+        metrics = get_metrics()
         results = []
-        # Randomize order to make it look live
-        shuffled = self.tickers.copy()
-        random.shuffle(shuffled)
-        
-        for symbol in shuffled:
-            data = self.analyze_stock(symbol)
-            if data: results.append(data)
-            time.sleep(1)
-            
-        # Sort by impact score descending
-        results.sort(key=lambda x: x['impact_score'], reverse=True)
+        for symbol in symbols:
+            with metrics.timer('alpha_ticker_seconds', ticker=symbol):
+                try:
+                    state = self.sync_state(symbol)
+                    row = state.snapshot()
+                    row['strategy'] = decide_row(row)
+                    row['strategy_ts'] = state.mark_strategy(row['strategy'])
+                except Exception as e:
+                    print(f"[ERROR] {symbol} Indicator State Error: {e}")
+                    metrics.inc('alpha_ticker_errors_total', ticker=symbol)
+                    continue
+                if row['bars'] < 10:
+                    print(f"[WARN] {symbol}: Not enough historical data.")
+                    continue
+                try:
+                    results.append(self.build_signal(symbol, row))
+                except Exception as e:
+                    print(f"[ERROR] {symbol} Signal Build Error: {e}")
+                    metrics.inc('alpha_ticker_errors_total', ticker=symbol)
+        return results
+
+    def build_signal(self, symbol, row):
+        curr_price = float(row['close'])
+        change_pct = float(row['change_pct'])
+        curr_rsi = float(row['rsi'])
+        bar_ts = int(row['ts'])
+        # 전략 조건이 처음 참이 된 봉 (추적 정보가 없으면 현재 봉)
+        since_ts = row.get('strategy_ts')
+        since_ts = bar_ts if since_ts is None or since_ts != since_ts else int(since_ts)
+
+        # --- DECISION ENGINE (전략 코드는 IndicatorState 피처에 strategies.decide_row로 평가) ---
+        strategy = get_strategy(int(row['strategy']))
+        strategy_type = strategy.name
+        sentiment = strategy.sentiment(row)
+        impact_score = strategy.score(row)
+        reason = strategy.reason(row)
+        # 목표가/손절가: ATR14 배수 (ATR 없으면 고정 비율)
+        target_price, stop_loss = strategy.levels(row, sentiment)
+
+        support = round(curr_price * 0.95, 2)
+        resistance = round(curr_price * 1.08, 2)
+        unit = "$"
+
+        tech_report = f"기술적 지표상 RSI는 {round(curr_rsi, 1)}로 {'과열' if curr_rsi > 70 else '과매도' if curr_rsi < 35 else '안정'}권에 위치하며, 1차 지지선 {unit}{support} 상단에서 강한 하방 경직성을 확보했습니다."
+        fund_report = f"Stock Empire 실시간 감시 엔진이 {symbol}의 수급 변화를 포착했습니다. 현재 {strategy_type} 전략 기반 유의미한 시그널이 발생한 상태입니다."
+        action_plan = f"단기 목표가 {unit}{round(target_price, 2)} 도달 시 분할 익절, {unit}{round(stop_loss, 2)} 이탈 시 선제적 리스크 관리를 권장합니다."
+
+        return {
+            # id = 티커:전략:발생 봉 날짜 (같은 전략이 이어지면 diff 단계에서 최초 id 유지)
+            # updated_at은 봉 시각 기준 -> 시세가 그대로면 출력도 바이트 단위로 동일
+            'id': signal_id(symbol, strategy.slug, since_ts),
+            'ticker': symbol,
+            'name': symbol,
+            'strategy': strategy_type,
+            'price': round(curr_price, 2),
+            'change_pct': round(change_pct, 2),
+            'sentiment': sentiment,
+            'impact_score': impact_score,
+            'target_price': round(target_price, 2),
+            'stop_loss': round(stop_loss, 2),
+            'ai_reason': reason,
+            'technical_analysis': tech_report,
+            'fundamental_analysis': fund_report,
+            'action_plan': action_plan,
+            'is_real_time': True,
+            'source': 'Stock Empire Stealth AI',
+            'updated_at': datetime.fromtimestamp(bar_ts, timezone.utc).isoformat()
+        }
+
+    def run_pipeline(self):
+        with get_metrics().span('alpha.pipeline') as attrs:
+            self._run_pipeline(attrs)
+
+    def _run_pipeline(self, attrs):
+        tickers = list(self.tickers)
+        attrs['tickers'] = len(tickers)
+
+        # [일괄 수집] quote API 배치 조회 + 필요한 종목만 chart 병렬 보충
+        started = time.monotonic()
+        symbols = self.refresh_store(tickers)
+
+        # [증분 분석] 새로 들어온 봉만 티커별 지표 상태에 반영 후 결정 규칙 적용
+        results = self.analyze_states(symbols)
+        try:
+            save_states(self.state_path, self.indicator_states)
+        except Exception as e:
+            print(f"[WARN] Failed to save indicator states: {e}")
+        print(f"[INFO] Analyzed {len(results)}/{len(tickers)} tickers in {round(time.monotonic() - started, 2)}s")
+
+        # 이번 회차에 갱신/분석하지 못한 종목은 직전 시그널 유지 (일시적 수집 실패를 expired로 보지 않음)
+        fresh = {signal['ticker'] for signal in results}
+        carried = [signal for signal in self.last_signals if signal['ticker'] in tickers and signal['ticker'] not in fresh]
+        if carried:
+            print(f"[INFO] Keeping previous signals for {len(carried)} ticker(s) not refreshed: {', '.join(s['ticker'] for s in carried)}")
+            results.extend(carried)
+
+        # Sort by impact score descending (동점은 티커 순 -> 실행마다 순서가 바뀌지 않음)
+        results.sort(key=lambda x: (-x['impact_score'], x['ticker']))
+
+        # [변경 감지] 직전 스냅샷과 비교해 시그널 자체(전략/방향/목표가/손절가)가 바뀐 경우만 이벤트로 발행
+        # 시세만 바뀐 경우는 스냅샷만 갱신
+        results, events = diff_signals(self.last_signals, results)
+        attrs.update(signals=len(results), events=len(events))
+        get_metrics().set_gauge('alpha_signals', len(results))
+        for event_type, _ in events:
+            get_metrics().inc('alpha_signal_events_total', type=event_type)
+        if results == self.last_signals:
+            print("[INFO] No signal changes. Skipping publish.")
+            return
+        counts = {kind: sum(1 for event_type, _ in events if event_type == kind) for kind in ('new', 'changed', 'expired')}
+        print(f"[INFO] Signal delta: {counts['new']} new, {counts['changed']} changed, {counts['expired']} expired")
         self.save(results)
+        if events:
+            self.delta_log.append(events)
+            self.publisher.mark_dirty(self.delta_log.path, "Alpha signal delta")
+        self.last_signals = results
 
-    def save(self, data):
-        os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-        with open(self.output_path, 'w', encoding='utf-8') as f:
+    def run_intraday(self, feed, output_path=None, publish=True):
+        """
+        장중 모드 (1m/5m 봉)
+        - 티커별 증분 지표 상태(메모리 내 롤링 윈도우)에 봉이 들어올 때마다 결정 규칙 평가
+        - 전략 코드가 바뀐 종목만 다시 만들어 파일 갱신 / 발행 (변화 없으면 쓰기 없음)
+        Returns: 변경 이벤트 목록 [(ts, symbol, signal), ...] (feed가 끝나는 경우 - 재생 모드)
+        """
+        states = {}
+        keys = {}
+        signals = {}
+        events = []
+        for batch in feed:
+            latest = {}
+            for symbol, ts, close, volume, high, low in batch:
+                state = states.setdefault(symbol, IndicatorState())
+                state.update(ts, close, volume, high, low)
+                if state.bars < self.intraday_min_bars:
+                    continue
+                row = state.snapshot()
+                row['strategy'] = decide_row(row)
+                row['strategy_ts'] = state.mark_strategy(row['strategy'])
+                # 중립 구간의 봉마다 바뀌는 등락 방향은 발행 사유로 보지 않음
+                key = int(row['strategy'])
+                if keys.get(symbol) != key:
+                    keys[symbol] = key
+                    latest[symbol] = (ts, row)
+                elif symbol in latest:
+                    # 같은 배치에서 바뀐 뒤 같은 상태로 이어지면 최신 값으로
+                    latest[symbol] = (ts, row)
+
+            if not latest:
+                continue
+            for symbol, (ts, row) in latest.items():
+                try:
+                    signal = self.build_signal(symbol, row)
+                except Exception as e:
+                    print(f"[ERROR] {symbol} Signal Build Error: {e}")
+                    continue
+                signals[symbol] = signal
+                events.append((ts, symbol, signal))
+                print(f"[SIGNAL] {symbol} @ {datetime.fromtimestamp(ts).strftime('%H:%M')}: {signal['strategy']} ({signal['sentiment']})")
+
+            if output_path:
+                ranked = sorted(signals.values(), key=lambda x: (-x['impact_score'], x['ticker']))
+                self.save(ranked, path=output_path, message="Alpha intraday signals", publish=publish)
+        return events
+
+    def load_signals(self):
+        """직전 실행이 남긴 스냅샷 (변경 감지 기준)"""
+        if not os.path.exists(self.output_path):
+            return []
+        try:
+            with open(self.output_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return [signal for signal in data if isinstance(signal, dict) and signal.get('ticker')]
+        except Exception as e:
+            print(f"[WARN] Failed to load previous alpha signals ({e}).")
+            return []
+
+    def save(self, data, path=None, message="Alpha signals", publish=True):
+        path = path or self.output_path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Alpha Signals (Multi-Strategy) updated.")
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message} (Multi-Strategy) updated.")
 
         # ------------------------------------------------------------------
         # [웹사이트 동기화] Vercel 자동 업데이트를 위한 GitHub Push
         # ------------------------------------------------------------------
-        try:
-            print("[INFO] Syncing alpha data to GitHub...")
-            os.system('git add public/alpha-signals.json')
-            os.system('git commit -m "update: Alpha signals [skip ci]"')
-            os.system('git push origin main')
-            print("[SUCCESS] Alpha data synced.")
-        except Exception as e:
-            print(f"[WARN] Git sync failed: {e}")
+        if publish:
+            self.publisher.mark_dirty(path, message)
+            print("[INFO] Queued alpha data for GitHub sync.")
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='VVIP Alpha Analyzer')
+    parser.add_argument('--intraday', action='store_true', help='Evaluate signals on every new 1m/5m bar')
+    parser.add_argument('--interval', default='5m', choices=['1m', '5m'], help='Intraday bar interval')
+    parser.add_argument('--replay', metavar='FIXTURE', help='Replay a recorded intraday fixture instead of the live feed')
+    parser.add_argument('--record', metavar='FIXTURE', help='Record live intraday chart responses to a fixture file')
+    args = parser.parse_args()
+
     analyzer = AlphaAnalyzer()
     print("=" * 60)
     print("VVIP Alpha Analyzer v2.0: MULTI-STRATEGY ENGINE")
     print("=" * 60)
-    
-    while True:
-        try:
-            analyzer.run_pipeline()
-        except Exception as e:
-            print(f"[CRITICAL] {e}")
-        print(f"\nNext update in 10 minutes...")
-        time.sleep(600)
+
+    if args.replay:
+        events = analyzer.run_intraday(ReplayFeed(args.replay))
+        print(f"[INFO] Replay finished: {len(events)} signal change(s).")
+        raise SystemExit(0)
+    if args.intraday:
+        feed = LiveChartFeed(analyzer, analyzer.tickers, interval=args.interval, record_path=args.record)
+        analyzer.run_intraday(feed, output_path=analyzer.intraday_output_path)
+        raise SystemExit(0)
+
+    scheduler = Scheduler()
+    scheduler.add("VVIP Alpha Analyzer", analyzer.run_pipeline, ALPHA_TRIGGER, run_at_start=True)
+    scheduler.run_forever()
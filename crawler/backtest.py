@@ -0,0 +1,209 @@
+"""
+Vectorized Strategy Backtester
+- 로컬 OHLCV 저장소의 일봉 전체(관심 종목 전부)를 날짜 x 티커 행렬로 로드
+- strategies.decide()와 같은 전략 목록으로 모든 날짜/티커의 시그널을 한 번에 계산
+- 시그널 발생 봉 종가에 진입 -> 이후 horizon개 봉 안에서 목표가/손절가(ATR 배수) 도달 여부를
+  (horizon x 날짜 x 티커) NumPy 배열로 한꺼번에 판정 (티커/날짜 루프 없음)
+- 전략별 적중률, 수익률 분포, 목표가 도달까지 걸린 봉 수 리포트
+
+사용법: python crawler/backtest.py [--backfill 5y] [--horizon 20] [--rsi 35] [--drop -3]
+"""
+
+import json
+import time
+import numpy as np
+import pandas as pd
+
+try:
+    from crawler.indicators import build_price_matrix, compute_indicators, align_right
+    from crawler.strategies import decide, default_strategies, RSI_OVERSOLD, SHARP_DROP_PCT, VOLUME_SPIKE_Z
+    from crawler.ohlcv_store import bars_from_chart
+except ImportError:
+    from indicators import build_price_matrix, compute_indicators, align_right
+    from strategies import decide, default_strategies, RSI_OVERSOLD, SHARP_DROP_PCT, VOLUME_SPIKE_Z
+    from ohlcv_store import bars_from_chart
+
+
+def load_matrices(store, symbols):
+    """
+    저장소 -> 원본(날짜 정렬) 행렬 dict와, align_right로 종가와 같은 배치로 맞춘 고가/저가 행렬
+    """
+    fields = {name: {} for name in ('close', 'high', 'low', 'volume')}
+    for symbol in symbols:
+        bars = store.load(symbol)
+        if len(bars) == 0:
+            continue
+        ts = np.array(bars['ts'])
+        for name in fields:
+            fields[name][symbol] = pd.Series(np.array(bars[name]), index=ts)
+
+    matrices = {name: build_price_matrix(values) for name, values in fields.items()}
+    close = matrices['close']
+    # 고가/저가가 비어 있는 봉은 종가로 대신 -> 결측 위치가 종가와 같아져 같은 순서로 정렬됨
+    high = matrices['high'].reindex_like(close).fillna(close).where(close.notna())
+    low = matrices['low'].reindex_like(close).fillna(close).where(close.notna())
+    return matrices, align_right(high), align_right(low)
+
+
+def simulate(features, high, low, codes, strategies, horizon=20, every_bar=False):
+    """
+    features: compute_indicators() 결과 (align_right된 날짜 x 티커 행렬), high/low: 같은 배치의 ndarray
+    codes: 같은 모양의 전략 코드 ndarray
+    Returns: {strategy name: {'outcome', 'returns', 'bars_to_target'}} (거래 단위 1차원 배열)
+    """
+    close = features['close'].to_numpy()
+    atr = features['atr14'].to_numpy()
+    n_rows = close.shape[0]
+    # 봉 수가 horizon 이하이면 음수 슬라이스가 되지 않도록 0에서 멈춤 (진입 가능한 봉 없음)
+    last_entry = max(n_rows - horizon, 0)
+    # future[k-1, t] = t+k 봉 값 (k = 1..horizon), 범위를 벗어나면 NaN
+    future_high = np.full((horizon,) + close.shape, np.nan)
+    future_low = np.full((horizon,) + close.shape, np.nan)
+    for k in range(1, min(horizon, n_rows - 1) + 1):
+        future_high[k - 1, :n_rows - k] = high[k:]
+        future_low[k - 1, :n_rows - k] = low[k:]
+    exit_close = np.full(close.shape, np.nan)
+    exit_close[:last_entry] = close[horizon:]
+
+    # horizon 전체를 관찰할 수 있는 봉에서만 진입
+    observable = np.zeros(close.shape, dtype=bool)
+    observable[:last_entry] = True
+    observable &= ~np.isnan(close)
+
+    prev_codes = np.vstack([np.full((1, codes.shape[1]), -1), codes[:-1]])
+    results = {}
+    for strategy in strategies:
+        entries = (codes == strategy.code) & observable
+        if not every_bar:
+            # 같은 시그널이 며칠 이어져도 첫 봉에서만 진입
+            entries &= prev_codes != strategy.code
+
+        # 목표가/손절가는 실시간 시그널과 같은 규칙 (ATR 배수, ATR 없으면 고정 비율)
+        direction = np.broadcast_to(np.asarray(strategy.direction(features), dtype='float64'), close.shape)
+        bullish = direction > 0
+        target_move, stop_move = strategy.moves(close, atr, bullish)
+        hit_target = np.where(bullish, future_high >= close + target_move, future_low <= close - target_move)
+        hit_stop = np.where(bullish, future_low <= close - stop_move, future_high >= close + stop_move)
+
+        # 처음 도달한 봉 번호 (1..horizon), 도달하지 않으면 horizon + 1
+        never = horizon + 1
+        first_target = np.where(hit_target.any(axis=0), hit_target.argmax(axis=0) + 1, never)
+        first_stop = np.where(hit_stop.any(axis=0), hit_stop.argmax(axis=0) + 1, never)
+
+        # 같은 봉에서 둘 다 닿으면 보수적으로 손절 처리
+        win = first_target < first_stop
+        loss = (first_stop <= first_target) & (first_stop < never)
+        timeout_return = direction * (exit_close / close - 1)
+        returns = np.select([win, loss], [target_move / close, -stop_move / close], default=timeout_return)
+        outcome = np.select([win, loss], [1, -1], default=0)
+
+        results[strategy.name] = {
+            'outcome': outcome[entries],
+            'returns': returns[entries],
+            'bars_to_target': first_target[entries & win],
+        }
+    return results
+
+
+def summarize(results):
+    """전략별 리포트 (적중률 / 손절률 / 수익률 분포 / 목표가 도달 봉 수)"""
+    report = {}
+    for name, data in results.items():
+        trades = len(data['outcome'])
+        if trades == 0:
+            report[name] = {'trades': 0}
+            continue
+        returns = data['returns'] * 100
+        bars_to_target = data['bars_to_target']
+        report[name] = {
+            'trades': trades,
+            'hit_rate': round(float(np.mean(data['outcome'] == 1)) * 100, 1),
+            'stop_rate': round(float(np.mean(data['outcome'] == -1)) * 100, 1),
+            'timeout_rate': round(float(np.mean(data['outcome'] == 0)) * 100, 1),
+            'avg_return_pct': round(float(np.mean(returns)), 2),
+            'return_pct_percentiles': {
+                f"p{q}": round(float(np.percentile(returns, q)), 2) for q in (10, 25, 50, 75, 90)
+            },
+            'bars_to_target': {
+                'mean': round(float(np.mean(bars_to_target)), 1) if len(bars_to_target) else None,
+                'median': float(np.median(bars_to_target)) if len(bars_to_target) else None,
+            },
+        }
+    return report
+
+
+def run_backtest(store, symbols, horizon=20, rsi_oversold=RSI_OVERSOLD, sharp_drop_pct=SHARP_DROP_PCT,
+                 volume_spike_z=VOLUME_SPIKE_Z, every_bar=False):
+    matrices, high, low = load_matrices(store, symbols)
+    # horizon보다 봉이 적은 티커는 진입 후 결과를 판정할 수 없으므로 제외
+    enough = matrices['close'].notna().sum() > horizon
+    for symbol in enough.index[~enough]:
+        print(f"[WARN] {symbol}: only {int(matrices['close'][symbol].notna().sum())} bar(s) (<= horizon {horizon}). Skipping.")
+    if not enough.any():
+        return {}
+    columns = enough.index[enough]
+    matrices = {name: matrix.reindex(columns=columns) for name, matrix in matrices.items()}
+    high, low = high[columns], low[columns]
+    features = compute_indicators(matrices['close'], volume=matrices['volume'], high=matrices['high'],
+                                  low=matrices['low'])
+    strategies = default_strategies(rsi_oversold=rsi_oversold, sharp_drop_pct=sharp_drop_pct,
+                                    volume_spike_z=volume_spike_z)
+    codes = decide(features, strategies).to_numpy()
+    results = simulate(features, high.to_numpy(), low.to_numpy(), codes, strategies,
+                       horizon=horizon, every_bar=every_bar)
+    return summarize(results)
+
+
+def backfill(analyzer, symbols, range_='5y'):
+    """백테스트용 장기 일봉 수집 (저장소에 이미 있는 구간은 병합 시 덮어씀)"""
+    for symbol in symbols:
+        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range={range_}"
+        try:
+            chart_data = analyzer.fetch_chart(symbol, url=url)
+            if chart_data is not None:
+                count = analyzer.store.append(symbol, bars_from_chart(chart_data, interval='1d'))
+                print(f"[INFO] {symbol}: {count} daily bars stored")
+        except Exception as e:
+            print(f"[ERROR] {symbol} Backfill Error: {e}")
+
+
+def print_report(report):
+    for name, stats in report.items():
+        print("-" * 60)
+        print(f"{name}: {stats['trades']} trade(s)")
+        if not stats['trades']:
+            continue
+        dist = stats['return_pct_percentiles']
+        print(f"  hit {stats['hit_rate']}% / stop {stats['stop_rate']}% / timeout {stats['timeout_rate']}%")
+        print(f"  avg return {stats['avg_return_pct']}% (p10 {dist['p10']} / p50 {dist['p50']} / p90 {dist['p90']})")
+        print(f"  bars to target: mean {stats['bars_to_target']['mean']}, median {stats['bars_to_target']['median']}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Alpha strategy backtester')
+    parser.add_argument('--backfill', metavar='RANGE', help='Fetch long daily history first (e.g. 5y)')
+    parser.add_argument('--horizon', type=int, default=20, help='Bars to wait for target/stop')
+    parser.add_argument('--rsi', type=float, default=RSI_OVERSOLD, help='RSI oversold threshold')
+    parser.add_argument('--drop', type=float, default=SHARP_DROP_PCT, help='Sharp drop threshold (%%)')
+    parser.add_argument('--volume-z', type=float, default=VOLUME_SPIKE_Z, help='Volume spike z-score threshold')
+    parser.add_argument('--every-bar', action='store_true', help='Enter on every signal bar, not only the first')
+    parser.add_argument('--json', metavar='PATH', help='Write the report as JSON')
+    args = parser.parse_args()
+
+    try:
+        from crawler.alpha_analyzer import AlphaAnalyzer
+    except ImportError:
+        from alpha_analyzer import AlphaAnalyzer
+    analyzer = AlphaAnalyzer()
+    if args.backfill:
+        backfill(analyzer, analyzer.tickers, args.backfill)
+
+    started = time.monotonic()
+    report = run_backtest(analyzer.store, analyzer.tickers, horizon=args.horizon, rsi_oversold=args.rsi,
+                          sharp_drop_pct=args.drop, volume_spike_z=args.volume_z, every_bar=args.every_bar)
+    print_report(report)
+    print(f"[INFO] Backtest finished in {round(time.monotonic() - started, 2)}s")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
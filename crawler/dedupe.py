@@ -0,0 +1,111 @@
+"""
+Near-Duplicate News Detector (MinHash + LSH)
+- Yahoo / Investing.com이 같은 통신사 기사를 다른 링크로 싣는 경우를 번역/분석 전에 제거
+- 정규화된 제목의 단어 shingle -> MinHash 서명 -> LSH 밴드 버킷으로 후보 검색
+- 후보는 실제 Jaccard 유사도로 최종 확인
+- 최근 기사(개수/시간 제한) 슬라이딩 윈도우만 메모리에 유지
+"""
+
+import random
+import re
+import time
+import zlib
+from collections import deque
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_STOPWORDS = {'a', 'an', 'the', 'to', 'of', 'in', 'on', 'for', 'and', 'as', 'at', 'by', 'with', 'is', 'are'}
+
+
+def normalize_title(title):
+    title = title.lower()
+    title = re.sub(r"[^a-z0-9%$ ]+", " ", title)
+    return [w for w in title.split() if w not in _STOPWORDS]
+
+
+def shingles(title):
+    """단어 unigram + bigram 집합 (짧은 헤드라인에서도 순서 정보를 약간 반영)"""
+    words = normalize_title(title)
+    grams = set(words)
+    grams.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return grams
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    def __init__(self, num_perm=32, bands=16, threshold=0.5, max_items=500, max_age=6 * 3600):
+        assert num_perm % bands == 0
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_items = max_items
+        self.max_age = max_age
+
+        # 고정 시드 해시 계수: 실행마다 같은 서명
+        rng = random.Random(num_perm)
+        self._coeffs = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                        for _ in range(num_perm)]
+        self._buckets = {}          # (band, band_signature) -> set(item_id)
+        self._entries = {}          # item_id -> (shingles, band_keys, canonical_id)
+        self._window = deque()      # (added_at, item_id)
+
+    def _signature(self, grams):
+        hashes = [zlib.crc32(g.encode('utf-8')) for g in grams]
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._coeffs]
+
+    def _band_keys(self, signature):
+        return [(band, tuple(signature[band * self.rows:(band + 1) * self.rows])) for band in range(self.bands)]
+
+    def _expire(self, now):
+        while self._window and (len(self._window) > self.max_items or now - self._window[0][0] > self.max_age):
+            _, item_id = self._window.popleft()
+            entry = self._entries.pop(item_id, None)
+            if not entry:
+                continue
+            for key in entry[1]:
+                bucket = self._buckets.get(key)
+                if bucket:
+                    bucket.discard(item_id)
+                    if not bucket:
+                        del self._buckets[key]
+
+    def find(self, title, exclude_id=None):
+        """가장 비슷한 최근 기사의 대표(canonical) id, 없으면 None"""
+        grams = shingles(title)
+        if not grams:
+            return None
+        best_id, best_score = None, 0.0
+        candidates = set()
+        for key in self._band_keys(self._signature(grams)):
+            candidates |= self._buckets.get(key, set())
+        for cand_id in candidates:
+            if cand_id == exclude_id:
+                continue
+            score = jaccard(grams, self._entries[cand_id][0])
+            if score >= self.threshold and score > best_score:
+                best_id, best_score = self._entries[cand_id][2], score
+        return best_id
+
+    def add(self, item_id, title, canonical_id=None, now=None):
+        now = now or time.time()
+        self._expire(now)
+        if item_id in self._entries:
+            return
+        grams = shingles(title)
+        if not grams:
+            return
+        keys = self._band_keys(self._signature(grams))
+        for key in keys:
+            self._buckets.setdefault(key, set()).add(item_id)
+        self._entries[item_id] = (grams, keys, canonical_id or item_id)
+        self._window.append((now, item_id))
+        # 추가 후에도 개수 제한 유지 (max_items개 초과분 제거)
+        self._expire(now)
+
+    def __len__(self):
+        return len(self._entries)
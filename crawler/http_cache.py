@@ -0,0 +1,98 @@
+"""
+HTTP Validator Cache (Conditional GET)
+- URL별 ETag / Last-Modified 저장 후 If-None-Match / If-Modified-Since 전송
+- 304 응답이면 본문 다운로드/파싱을 통째로 생략
+- 검증 헤더를 무시하는 서버는 본문 해시(sha1)로 변경 여부 판단
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+try:
+    from crawler.http_client import get_client
+except ImportError:
+    from http_client import get_client
+
+
+class HttpValidatorCache:
+    def __init__(self, path=None):
+        self.path = path or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'http_validators.json')
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except:
+                return {}
+        return {}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def conditional_headers(self, url):
+        entry = self.entries.get(url) or {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def fetch(self, url, headers=None, timeout=10):
+        """
+        조건부 GET을 수행합니다.
+        Returns: (content, validators)
+          - 변경 없음(304 또는 동일 해시): content = None
+          - 새 본문: content = bytes, 본문의 기사가 모두 처리된 뒤 remember(url, validators) 호출
+        """
+        req_headers = {**(headers or {}), **self.conditional_headers(url)}
+        res = get_client().get(url, headers=req_headers, timeout=timeout)
+
+        if res.status_code == 304:
+            return None, None
+        if res.status_code != 200:
+            raise RuntimeError(f"HTTP {res.status_code}")
+
+        validators = {
+            'etag': res.headers.get('ETag'),
+            'last_modified': res.headers.get('Last-Modified'),
+            'content_hash': hashlib.sha1(res.content).hexdigest(),
+        }
+        entry = self.entries.get(url) or {}
+        if entry.get('content_hash') == validators['content_hash']:
+            # 서버가 검증 헤더를 무시했지만 본문은 그대로
+            self.remember(url, validators)
+            return None, None
+        return res.content, validators
+
+    def remember(self, url, validators):
+        """끝까지 처리된 응답만 기록 (처리 못 한 본문을 '변경 없음'으로 건너뛰지 않도록)"""
+        if not validators:
+            return
+        with self._lock:
+            if self.entries.get(url) == validators:
+                return
+            self.entries[url] = validators
+            try:
+                self._save()
+            except Exception as e:
+                print(f"[WARN] HTTP validator cache save failed: {e}")
+
+
+_default_cache = None
+
+
+def get_default_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = HttpValidatorCache()
+    return _default_cache
@@ -0,0 +1,113 @@
+"""
+Shared HTTP Client (Connection Pool)
+- 프로세스 공용 세션 하나로 keep-alive 커넥션 재사용 -> 요청마다 TCP/TLS 핸드셰이크 반복 안 함
+- httpx + h2가 설치되어 있으면 HTTP/2, 없으면 requests.Session(HTTPAdapter 풀)
+- 429 / 5xx / 연결 오류는 지수 백오프 + 지터로 재시도 (Retry-After 헤더 우선)
+- 호스트별 동시 요청 수 제한 (HostConcurrencyLimiter)
+- 응답 객체는 라이브러리 기본 객체 그대로 (status_code / content / headers / json())
+- 호스트별 지표: 요청 소요 시간 / 상태 코드 / 응답 바이트 / 재시도 / 연결 오류 (crawler/metrics.py)
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+try:
+    from crawler.rate_limit import HostConcurrencyLimiter
+    from crawler.metrics import get_metrics
+except ImportError:
+    from rate_limit import HostConcurrencyLimiter
+    from metrics import get_metrics
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class HttpClient:
+    def __init__(self, max_retries=3, backoff=0.5, max_backoff=30, per_host=4, pool_size=20, http2=True):
+        self.max_retries = max_retries
+        self.backoff = backoff            # 첫 재시도 대기(초), 이후 2배씩
+        self.max_backoff = max_backoff
+        self.host_limiter = HostConcurrencyLimiter(per_host=per_host)
+        self.pool_size = pool_size
+        self.backend, self.session, self.retry_errors = self._build_session(http2)
+
+    def _build_session(self, http2):
+        if http2:
+            try:
+                import httpx
+                import h2  # noqa: F401  (HTTP/2 지원 여부 확인용)
+                limits = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+                session = httpx.Client(http2=True, follow_redirects=True, limits=limits)
+                return 'httpx', session, (httpx.TransportError,)
+            except ImportError:
+                pass
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return 'requests', session, (requests.ConnectionError, requests.Timeout)
+
+    def _retry_delay(self, attempt, res=None):
+        retry_after = res.headers.get('Retry-After') if res is not None else None
+        if retry_after:
+            try:
+                return min(self.max_backoff, float(retry_after))
+            except ValueError:
+                pass
+        return min(self.max_backoff, self.backoff * (2 ** attempt)) + random.uniform(0, self.backoff)
+
+    def get(self, url, headers=None, timeout=10, retries=None, on_throttle=None):
+        """
+        GET 요청 (재시도 포함). 재시도가 끝난 뒤의 마지막 응답을 그대로 반환하므로
+        상태 코드 처리는 호출하는 쪽에서 합니다. on_throttle: 429/403을 받을 때마다 호출
+        """
+        retries = self.max_retries if retries is None else retries
+        metrics = get_metrics()
+        host = urlsplit(url).hostname or 'unknown'
+        for attempt in range(retries + 1):
+            try:
+                with self.host_limiter.slot(url):
+                    started = time.perf_counter()
+                    res = self.session.get(url, headers=headers, timeout=timeout)
+                    metrics.observe('http_request_seconds', time.perf_counter() - started, host=host)
+            except self.retry_errors as e:
+                metrics.inc('http_errors_total', host=host, error=type(e).__name__)
+                if attempt == retries:
+                    raise
+                metrics.inc('http_retries_total', host=host, reason='error')
+                delay = self._retry_delay(attempt)
+                print(f"[WARN] HTTP {type(e).__name__} for {url} (attempt {attempt + 1}). Retrying in {round(delay, 1)}s")
+                time.sleep(delay)
+                continue
+
+            metrics.inc('http_responses_total', host=host, status=res.status_code)
+            metrics.inc('http_response_bytes_total', len(res.content), host=host)
+            if res.status_code in (429, 403) and on_throttle:
+                on_throttle()
+            if res.status_code not in RETRY_STATUS or attempt == retries:
+                return res
+            metrics.inc('http_retries_total', host=host, reason=res.status_code)
+            delay = self._retry_delay(attempt, res)
+            print(f"[WARN] HTTP {res.status_code} for {url} (attempt {attempt + 1}). Retrying in {round(delay, 1)}s")
+            time.sleep(delay)
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스 공용 HTTP 클라이언트 (뉴스 크롤러 / 알파 분석기 / 포스터가 같은 커넥션 풀 공유)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+            print(f"[INFO] Shared HTTP client ready ({_client.backend})")
+        return _client
@@ -0,0 +1,427 @@
+"""
+Vectorized Multi-Ticker Feature Engine
+- 입력: 가격 행렬 (행 = 날짜, 열 = 티커)
+- RSI / SMA(5·20·50·200) / 골든크로스 / 등락률 / ATR14 / 거래량 z-score를
+  모든 티커에 대해 한 번의 pandas 연산으로 계산 -> 모든 전략이 공유하는 피처 프레임
+- 결정 규칙(전략)은 strategies.py에서 이 피처 프레임 위에 np.select로 한 번에 적용
+  -> 관심 종목이 17개에서 2,000개로 늘어도 티커별 루프 없이 처리
+- IndicatorState: 새 봉 하나당 O(1)로 갱신되는 티커별 증분 피처 상태 (디스크에 저장/복원)
+  실시간 시그널(일봉 / 장중)은 IndicatorState, 과거 구간 전체가 필요한 백테스트는 compute_indicators 사용
+- pandas는 행렬 함수가 처음 호출될 때 로드 (증분 경로는 pandas 없이 동작 -> 빠른 시작)
+"""
+
+import json
+import math
+import os
+import tempfile
+from collections import deque
+import numpy as np
+
+RSI_WINDOW = 14
+ATR_WINDOW = 14
+VOLUME_WINDOW = 20
+SMA_WINDOWS = (5, 20, 50, 200)
+
+# 피처 프레임의 키 (IndicatorState.snapshot()도 같은 키를 사용)
+FEATURES = ('close', 'prev_close', 'change_pct', 'rsi', 'sma5', 'sma20', 'sma50', 'sma200',
+            'golden_cross', 'atr14', 'volume_z')
+
+# IndicatorState.snapshot() 값의 소수 자릿수
+# 누적 합계(증분) / 다시 합산(_resync) / 전체 재계산 사이의 마지막 자리 오차(~1e-14)가
+# 전략 판정이나 출력 파일로 새어 나가지 않도록 반올림
+FEATURE_DIGITS = 10
+
+
+def build_price_matrix(series_by_ticker):
+    """
+    {ticker: {timestamp: close} 또는 pd.Series} -> 날짜 x 티커 DataFrame
+    일봉 타임스탬프는 날짜(UTC 자정) 단위로 맞춰 티커 간 행을 정렬합니다.
+    """
+    import pandas as pd
+    columns = {}
+    for ticker, points in series_by_ticker.items():
+        series = pd.Series(points, dtype='float64')
+        series.index = np.asarray(series.index, dtype='int64') // 86400 * 86400
+        columns[ticker] = series[~series.index.duplicated(keep='last')]
+    frame = pd.DataFrame(columns).sort_index()
+    frame.index.name = 'timestamp'
+    return frame
+
+
+def align_right(frame, like=None):
+    """
+    결측치(None/NaN)를 티커별로 제거하고 값들을 아래쪽(최신)으로 붙입니다.
+    기존 단일 종목 로직(None 제거 후 계산)과 동일한 결과를 내기 위한 처리이며,
+    행 인덱스는 '끝에서부터 n번째 봉'으로 해석합니다.
+    like가 주어지면 그 행렬(보통 종가)의 결측 위치 기준으로 같은 순서로 재배치합니다.
+    """
+    import pandas as pd
+    values = frame.to_numpy(dtype='float64')
+    reference = values if like is None else like.to_numpy(dtype='float64')
+    order = np.argsort(~np.isnan(reference), axis=0, kind='stable')
+    aligned = np.take_along_axis(values, order, axis=0)
+    return pd.DataFrame(aligned, index=frame.index, columns=frame.columns)
+
+
+def rolling_rsi(close, window=14):
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+    # Avoid division by zero
+    rs = gain / loss.replace(0, 0.001)
+    rsi = 100 - (100 / (1 + rs))
+    # 앞쪽 빈 칸(NaN)이 0으로 채워져 계산된 값은 버림 (실제 봉이 window개 이상일 때만 유효)
+    return rsi.where(close.notna().cumsum() >= window)
+
+
+def rolling_zscore(values, window=VOLUME_WINDOW):
+    """최근 window개 봉(현재 봉 포함) 대비 표준점수 (모표준편차, 분산 0이면 NaN)"""
+    mean = values.rolling(window=window).mean()
+    std = values.rolling(window=window).std(ddof=0)
+    return (values - mean) / std.where(std > 0)
+
+
+def rolling_atr(high, low, close, window=ATR_WINDOW):
+    """True Range의 단순 이동평균 (첫 봉은 고가 - 저가)"""
+    prev_close = close.shift(1)
+    true_range = np.fmax(high - low, np.fmax((high - prev_close).abs(), (low - prev_close).abs()))
+    return true_range.rolling(window=window).mean()
+
+
+def _align_field(frame, raw_close):
+    """고가/저가 등 보조 행렬을 종가와 같은 배치로 정렬 (빈 값은 종가로 대신)"""
+    if frame is None:
+        return align_right(raw_close)
+    frame = frame.reindex_like(raw_close).fillna(raw_close).where(raw_close.notna())
+    return align_right(frame, like=raw_close)
+
+
+def compute_indicators(close, volume=None, high=None, low=None):
+    """
+    close(/volume/high/low): 날짜 x 티커 행렬 -> 피처 행렬 dict
+    고가/저가가 없으면 종가로 대신 (ATR = 종가 변동폭 평균)
+    """
+    import pandas as pd
+    raw_close = close
+    close = align_right(raw_close)
+    prev_close = close.shift(1)
+    sma = {window: close.rolling(window=window).mean() for window in SMA_WINDOWS}
+    golden_cross = (sma[5] > sma[20]) & (sma[5].shift(1) <= sma[20].shift(1))
+    if volume is not None:
+        volume_z = rolling_zscore(align_right(volume.reindex_like(raw_close), like=raw_close))
+    else:
+        volume_z = pd.DataFrame(np.nan, index=close.index, columns=close.columns)
+    return {
+        'close': close,
+        'prev_close': prev_close,
+        'change_pct': (close - prev_close) / prev_close * 100,
+        'rsi': rolling_rsi(close),
+        'sma5': sma[5],
+        'sma20': sma[20],
+        'sma50': sma[50],
+        'sma200': sma[200],
+        'golden_cross': golden_cross,
+        'atr14': rolling_atr(_align_field(high, raw_close), _align_field(low, raw_close), close),
+        'volume_z': volume_z,
+        'bars': close.notna().sum(),
+        'ts': raw_close.apply(pd.Series.last_valid_index),
+    }
+
+
+class IndicatorState:
+    """
+    티커 하나의 증분(streaming) 피처 상태
+    - 새 봉마다 O(1)로 RSI(단순 이동평균 방식) / SMA(5·20·50·200) / 골든크로스 / ATR14 /
+      거래량 z-score 갱신 (윈도우별 누적 합계만 더하고 뺌)
+    - 같은 타임스탬프 봉이 다시 들어오면(장중 임시 봉 갱신) 마지막 봉만 교체
+    - compute_indicators()와 같은 값을 내도록 같은 정의를 사용
+    """
+
+    VERSION = 3
+    RESYNC_EVERY = 500  # 누적 합계의 부동소수점 오차 보정 주기
+
+    def __init__(self):
+        self.last_ts = None
+        self.bars = 0
+        self.prev_close = None      # 마지막 봉 직전 종가
+        self.closes = deque(maxlen=max(SMA_WINDOWS))
+        self.sma_sums = {window: 0.0 for window in SMA_WINDOWS}
+        self.gains = deque(maxlen=RSI_WINDOW)
+        self.losses = deque(maxlen=RSI_WINDOW)
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.prev_sma5 = None       # 마지막 봉 직전 SMA (골든크로스 판정용)
+        self.prev_sma20 = None
+        self.ranges = deque(maxlen=ATR_WINDOW)      # True Range
+        self.range_sum = 0.0
+        self.volumes = deque(maxlen=VOLUME_WINDOW)  # 거래량 없는 봉은 NaN
+        self.volume_sum = 0.0
+        self.volume_sq_sum = 0.0
+        self.volume_missing = 0     # 윈도우 안의 NaN 개수 (하나라도 있으면 z-score 없음)
+        self.strategy = None        # 마지막 봉에서 평가한 전략 코드
+        self.strategy_ts = None     # 그 전략 조건이 처음 참이 된 봉 (시그널 id 기준)
+        self._updates = 0
+
+    # ------------------------------------------------------------------
+    def sma(self, window):
+        return self.sma_sums[window] / window if len(self.closes) >= window else None
+
+    @property
+    def close(self):
+        return self.closes[-1] if self.closes else None
+
+    @property
+    def rsi(self):
+        if self.bars < RSI_WINDOW:
+            return None
+        gain = self.gain_sum / RSI_WINDOW
+        loss = self.loss_sum / RSI_WINDOW
+        # Avoid division by zero (rolling_rsi와 동일)
+        rs = gain / (loss if loss != 0 else 0.001)
+        return 100 - (100 / (1 + rs))
+
+    @property
+    def atr(self):
+        return self.range_sum / ATR_WINDOW if len(self.ranges) >= ATR_WINDOW else None
+
+    @property
+    def change_pct(self):
+        if self.prev_close is None or self.close is None:
+            return None
+        return (self.close - self.prev_close) / self.prev_close * 100
+
+    @property
+    def volume_z(self):
+        if len(self.volumes) < VOLUME_WINDOW or self.volume_missing:
+            return None
+        mean = self.volume_sum / VOLUME_WINDOW
+        variance = self.volume_sq_sum / VOLUME_WINDOW - mean * mean
+        if variance <= 1e-12 * max(1.0, mean * mean):
+            return None
+        return (self.volumes[-1] - mean) / math.sqrt(variance)
+
+    @property
+    def golden_cross(self):
+        sma5, sma20 = self.sma(5), self.sma(20)
+        if None in (sma5, sma20, self.prev_sma5, self.prev_sma20):
+            return False
+        return sma5 > sma20 and self.prev_sma5 <= self.prev_sma20
+
+    # ------------------------------------------------------------------
+    def _delta(self, close):
+        if self.prev_close is None:
+            return 0.0, 0.0   # 첫 봉: diff NaN -> gain/loss 0 (pandas where와 동일)
+        delta = close - self.prev_close
+        return max(delta, 0.0), max(-delta, 0.0)
+
+    def _true_range(self, high, low):
+        if self.prev_close is None:
+            return high - low
+        return max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+
+    def _push(self, close, high, low):
+        self.prev_sma5, self.prev_sma20 = self.sma(5), self.sma(20)
+        self.prev_close = self.close
+
+        for window in SMA_WINDOWS:
+            if len(self.closes) >= window:
+                self.sma_sums[window] -= self.closes[-window]
+            self.sma_sums[window] += close
+        self.closes.append(close)
+
+        gain, loss = self._delta(close)
+        if len(self.gains) == RSI_WINDOW:
+            self.gain_sum -= self.gains[0]
+            self.loss_sum -= self.losses[0]
+        self.gains.append(gain)
+        self.losses.append(loss)
+        self.gain_sum += gain
+        self.loss_sum += loss
+
+        true_range = self._true_range(high, low)
+        if len(self.ranges) == ATR_WINDOW:
+            self.range_sum -= self.ranges[0]
+        self.ranges.append(true_range)
+        self.range_sum += true_range
+        self.bars += 1
+
+    def _revise(self, close, high, low):
+        old = self.closes[-1]
+        self.closes[-1] = close
+        for window in SMA_WINDOWS:
+            self.sma_sums[window] += close - old
+
+        gain, loss = self._delta(close)
+        self.gain_sum += gain - self.gains[-1]
+        self.loss_sum += loss - self.losses[-1]
+        self.gains[-1] = gain
+        self.losses[-1] = loss
+
+        true_range = self._true_range(high, low)
+        self.range_sum += true_range - self.ranges[-1]
+        self.ranges[-1] = true_range
+
+    def _add_volume(self, volume, sign):
+        if volume != volume:
+            self.volume_missing += sign
+        else:
+            self.volume_sum += sign * volume
+            self.volume_sq_sum += sign * volume * volume
+
+    def _push_volume(self, volume):
+        if len(self.volumes) == VOLUME_WINDOW:
+            self._add_volume(self.volumes[0], -1)
+        self.volumes.append(volume)
+        self._add_volume(volume, 1)
+
+    def _revise_volume(self, volume):
+        self._add_volume(self.volumes[-1], -1)
+        self.volumes[-1] = volume
+        self._add_volume(volume, 1)
+
+    @staticmethod
+    def _value(value, default):
+        return default if value is None or value != value else float(value)
+
+    def update(self, ts, close, volume=None, high=None, low=None):
+        """새 봉 반영 (고가/저가가 없으면 종가로 대신). Returns: 새 봉이면 True, 갱신/과거 봉이면 False"""
+        if close is None or close != close:
+            return False
+        ts = int(ts)
+        if self.last_ts is not None and ts < self.last_ts:
+            return False
+        close = float(close)
+        high, low = self._value(high, close), self._value(low, close)
+        volume = self._value(volume, float('nan'))
+        is_new = self.last_ts is None or ts > self.last_ts
+        if is_new:
+            self._push(close, high, low)
+            self._push_volume(volume)
+            self.last_ts = ts
+        else:
+            self._revise(close, high, low)
+            self._revise_volume(volume)
+
+        self._updates += 1
+        if self._updates % self.RESYNC_EVERY == 0:
+            self._resync()
+        return is_new
+
+    def _resync(self):
+        closes = list(self.closes)
+        for window in SMA_WINDOWS:
+            self.sma_sums[window] = sum(closes[-window:])
+        self.gain_sum = sum(self.gains)
+        self.loss_sum = sum(self.losses)
+        self.range_sum = sum(self.ranges)
+        valid = [v for v in self.volumes if v == v]
+        self.volume_sum = sum(valid)
+        self.volume_sq_sum = sum(v * v for v in valid)
+        self.volume_missing = len(self.volumes) - len(valid)
+
+    def snapshot(self):
+        """compute_indicators() 피처 행렬의 마지막 행과 같은 키의 피처 dict (값이 없으면 NaN, 전략 코드는 strategies에서)"""
+        row = {
+            'close': self.close,
+            'prev_close': self.prev_close,
+            'change_pct': self.change_pct,
+            'rsi': self.rsi,
+            'sma5': self.sma(5),
+            'sma20': self.sma(20),
+            'sma50': self.sma(50),
+            'sma200': self.sma(200),
+            'golden_cross': self.golden_cross,
+            'atr14': self.atr,
+            'volume_z': self.volume_z,
+            'bars': self.bars,
+            'ts': self.last_ts,
+        }
+        return {name: np.nan if value is None else round(value, FEATURE_DIGITS) if isinstance(value, float) else value
+                for name, value in row.items()}
+
+    def mark_strategy(self, code):
+        """마지막 봉의 전략 코드 기록. 코드가 바뀐 봉을 발생 봉으로 유지. Returns: 발생 봉 ts"""
+        if code != self.strategy:
+            self.strategy = code
+            self.strategy_ts = self.last_ts
+        return self.strategy_ts
+
+    # ------------------------------------------------------------------
+    def to_dict(self):
+        return {
+            'version': self.VERSION,
+            'last_ts': self.last_ts, 'bars': self.bars, 'prev_close': self.prev_close,
+            'closes': list(self.closes), 'gains': list(self.gains), 'losses': list(self.losses),
+            'ranges': list(self.ranges),
+            'prev_sma5': self.prev_sma5, 'prev_sma20': self.prev_sma20,
+            'strategy': self.strategy, 'strategy_ts': self.strategy_ts,
+            # JSON에는 NaN이 없으므로 None으로 저장
+            'volumes': [None if v != v else v for v in self.volumes],
+            # 누적 합계와 보정 주기 위치도 그대로 저장 -> 재시작 후에도 끊김 없이 실행한 것과 비트 단위로 같은 값
+            'sums': {
+                'sma': {str(window): total for window, total in self.sma_sums.items()},
+                'gain': self.gain_sum, 'loss': self.loss_sum, 'range': self.range_sum,
+                'volume': self.volume_sum, 'volume_sq': self.volume_sq_sum, 'volume_missing': self.volume_missing,
+            },
+            'updates': self._updates,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') not in (2, cls.VERSION):
+            raise ValueError(f"indicator state version {data.get('version')} != {cls.VERSION}")
+        state = cls()
+        state.last_ts = data['last_ts']
+        state.bars = data['bars']
+        state.prev_close = data['prev_close']
+        state.closes.extend(data['closes'])
+        state.gains.extend(data['gains'])
+        state.losses.extend(data['losses'])
+        state.ranges.extend(data['ranges'])
+        state.prev_sma5 = data['prev_sma5']
+        state.prev_sma20 = data['prev_sma20']
+        # 이전 버전 파일에는 없음 -> 다음 봉부터 다시 추적
+        state.strategy = data.get('strategy')
+        state.strategy_ts = data.get('strategy_ts')
+        state.volumes.extend(float('nan') if v is None else v for v in data['volumes'])
+        sums = data.get('sums')
+        if sums is None:
+            # 버전 2 파일: 합계가 없으므로 윈도우에서 다시 합산
+            state._resync()
+            return state
+        state.sma_sums = {window: sums['sma'][str(window)] for window in SMA_WINDOWS}
+        state.gain_sum = sums['gain']
+        state.loss_sum = sums['loss']
+        state.range_sum = sums['range']
+        state.volume_sum = sums['volume']
+        state.volume_sq_sum = sums['volume_sq']
+        state.volume_missing = sums['volume_missing']
+        state._updates = data['updates']
+        return state
+
+
+def load_states(path):
+    """save_states()로 저장한 파일 -> {symbol: IndicatorState}"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {symbol: IndicatorState.from_dict(data) for symbol, data in json.load(f).items()}
+    except Exception as e:
+        print(f"[WARN] Failed to load indicator states ({e}). Rebuilding.")
+        return {}
+
+
+def save_states(path, states):
+    """티커별 상태를 JSON 하나로 원자적 저장 (다음 실행 때 이어서 갱신)"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.indicator-state-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({symbol: state.to_dict() for symbol, state in states.items()}, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
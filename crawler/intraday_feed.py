@@ -0,0 +1,107 @@
+"""
+Intraday Bar Feeds (1m / 5m)
+- LiveChartFeed: 봉 간격마다 Yahoo chart(range=1d)를 폴링해 새 봉/갱신된 현재 봉만 전달
+- ReplayFeed: 녹화해 둔 chart 응답(fixture)을 타임스탬프 순서대로 한 봉씩 재생 (실시간 피드 대체/검증용)
+- 두 피드 모두 배치 단위로 [(symbol, ts, close, volume, high, low), ...] 를 yield
+"""
+
+import json
+import os
+import tempfile
+import time
+
+INTERVAL_SECONDS = {'1m': 60, '5m': 300}
+
+
+def bars_from_intraday_chart(chart_data):
+    """chart 응답 -> [(ts, close, volume, high, low), ...] (종가 없는 봉 제외, 시간순, 값이 없으면 None)"""
+    timestamps = chart_data.get('timestamp') or []
+    quote = chart_data['indicators']['quote'][0]
+    empty = [None] * len(timestamps)
+    rows = zip(timestamps, quote['close'], quote.get('volume') or empty, quote.get('high') or empty,
+               quote.get('low') or empty)
+    return [(int(ts), close, volume, high, low) for ts, close, volume, high, low in rows if close is not None]
+
+
+class LiveChartFeed:
+    def __init__(self, analyzer, tickers, interval='5m', record_path=None):
+        if interval not in INTERVAL_SECONDS:
+            raise ValueError(f"Unsupported intraday interval: {interval}")
+        self.analyzer = analyzer
+        self.tickers = list(tickers)
+        self.interval = interval
+        self.poll_seconds = INTERVAL_SECONDS[interval]
+        self.record_path = record_path   # 지정하면 마지막 응답을 ReplayFeed용 fixture로 저장
+        self._last_ts = {}
+        self._recorded = {}
+
+    def chart_url(self, symbol):
+        return f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval={self.interval}&range=1d"
+
+    def poll(self):
+        """전 종목 1회 폴링 -> 마지막으로 본 봉(갱신 가능) 이후의 봉 목록"""
+        batch = []
+        for symbol in self.tickers:
+            try:
+                chart_data = self.analyzer.fetch_chart(symbol, url=self.chart_url(symbol))
+            except Exception as e:
+                print(f"[ERROR] {symbol} Intraday Fetch Error: {e}")
+                continue
+            if chart_data is None:
+                continue
+            if self.record_path:
+                self._recorded[symbol] = chart_data
+            last_ts = self._last_ts.get(symbol)
+            for ts, *bar in bars_from_intraday_chart(chart_data):
+                if last_ts is None or ts >= last_ts:
+                    batch.append((symbol, ts, *bar))
+                    self._last_ts[symbol] = ts
+        if self.record_path and self._recorded:
+            self._save_recording()
+        batch.sort(key=lambda bar: bar[1])
+        return batch
+
+    def _save_recording(self):
+        directory = os.path.dirname(os.path.abspath(self.record_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.intraday-', suffix='.tmp', dir=directory)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'interval': self.interval, 'charts': self._recorded}, f)
+        os.replace(tmp_path, self.record_path)
+
+    def __iter__(self):
+        while True:
+            started = time.monotonic()
+            yield self.poll()
+            # 다음 봉이 생길 때까지 대기 (폴링에 걸린 시간은 제외)
+            time.sleep(max(1.0, self.poll_seconds - (time.monotonic() - started)))
+
+
+class ReplayFeed:
+    """LiveChartFeed(record_path=...)로 저장한 fixture를 봉 하나(타임스탬프 하나)씩 재생"""
+
+    def __init__(self, path, speed=0):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.interval = data.get('interval', '5m')
+        self.tickers = list(data['charts'])
+        self.speed = speed               # 0이면 대기 없이 재생, 1이면 실제 봉 간격
+        self.bars = sorted(
+            ((ts, symbol, *bar)
+             for symbol, chart_data in data['charts'].items()
+             for ts, *bar in bars_from_intraday_chart(chart_data)),
+            key=lambda bar: (bar[0], bar[1]),
+        )
+
+    def __iter__(self):
+        batch, batch_ts = [], None
+        for ts, symbol, *bar in self.bars:
+            if batch and ts != batch_ts:
+                yield batch
+                batch = []
+                if self.speed:
+                    time.sleep(INTERVAL_SECONDS.get(self.interval, 300) / self.speed)
+            batch_ts = ts
+            batch.append((symbol, ts, *bar))
+        if batch:
+            yield batch
@@ -0,0 +1,97 @@
+"""
+Disk-backed Key-Value Cache (SQLite)
+- 번역 / AI 분석 결과처럼 '같은 입력 = 같은 결과'인 작업의 재사용용
+- TTL 만료 + LRU(최근 사용 순) 개수 제한으로 파일 크기 관리
+- 여러 스레드에서 동시에 사용 가능 (단일 커넥션 + Lock)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    from crawler.metrics import get_metrics
+except ImportError:
+    from metrics import get_metrics
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+
+
+class SqliteCache:
+    def __init__(self, path, ttl=None, max_entries=None, evict_every=100):
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]   # 지표 라벨 (translations / ai_analysis ...)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS kv_last_used ON kv(last_used)")
+        self._conn.commit()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created_at FROM kv WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                get_metrics().inc('cache_requests_total', cache=self.name, result='miss')
+                return None
+            value, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                get_metrics().inc('cache_requests_total', cache=self.name, result='miss')
+                return None
+            self._conn.execute("UPDATE kv SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        get_metrics().inc('cache_requests_total', cache=self.name, result='hit')
+        return json.loads(value)
+
+    def set(self, key, value):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        if self.ttl is not None:
+            self._conn.execute("DELETE FROM kv WHERE created_at < ?", (now - self.ttl,))
+        if self.max_entries is not None:
+            # 가장 오래 사용되지 않은 항목부터 삭제
+            self._conn.execute(
+                "DELETE FROM kv WHERE key IN ("
+                " SELECT key FROM kv ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
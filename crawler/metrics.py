@@ -0,0 +1,220 @@
+"""
+Crawler Metrics & Tracing
+- 카운터 / 게이지 / 요약(count, sum, max) 지표를 프로세스 안에서 집계 (스레드 안전, 호출 비용 = 락 + dict 갱신)
+- span(): 한 단계의 소요 시간과 속성을 JSON-lines 트레이스로 기록 + '<이름>_seconds' 요약 지표로도 집계
+  같은 스레드 안에서 중첩된 span은 trace_id를 공유하고 parent_id로 연결됨
+- flush(): crawler/cache/metrics/ 에 저장 (스케줄러 작업이 끝날 때마다 + 프로세스 종료 시)
+    metrics-<service>.prom : Prometheus 텍스트 형식 (node_exporter textfile collector로 수집 가능)
+    metrics-<service>.json : 관리자 대시보드(app/api/admin/stats)용 스냅샷
+    traces.jsonl           : span 기록 (max_trace_bytes를 넘으면 traces.jsonl.1로 교체)
+- 계측 실패는 경고만 출력하고 파이프라인을 멈추지 않음
+"""
+
+import atexit
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# kv_cache도 이 모듈로 계측하므로 CACHE_DIR을 import하지 않고 같은 경로를 직접 계산 (순환 import 방지)
+METRICS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'metrics')
+METRIC_PREFIX = 'stock_empire_'
+
+
+def _labels_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items() if value is not None))
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class MetricsRegistry:
+    def __init__(self, service, directory=METRICS_DIR, max_trace_bytes=20 * 1024 * 1024):
+        self.service = service
+        self.directory = directory
+        self.max_trace_bytes = max_trace_bytes
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._counters = {}       # (name, labels) -> value
+        self._gauges = {}         # (name, labels) -> value
+        self._summaries = {}      # (name, labels) -> [count, sum, max]
+        self._traces = []         # flush 전까지 모아 둔 span 기록
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    def inc(self, name, value=1, **labels):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        with self._lock:
+            self._gauges[(name, _labels_key(labels))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is None:
+                self._summaries[key] = [1, value, value]
+            else:
+                summary[0] += 1
+                summary[1] += value
+                summary[2] = max(summary[2], value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    @contextmanager
+    def span(self, name, labels=None, **attrs):
+        """
+        labels: 요약 지표('<이름>_seconds')와 트레이스에 모두 붙는 값 (종류가 적은 값만: source, model ...)
+        attrs: 트레이스에만 기록 (with 블록 안에서 yield된 dict에 추가 가능)
+        """
+        stack = self._local.__dict__.setdefault('stack', [])
+        parent = stack[-1] if stack else None
+        record = {
+            'ts': datetime.now(timezone.utc).isoformat(),
+            'service': self.service,
+            'trace_id': parent['trace_id'] if parent else uuid.uuid4().hex[:16],
+            'span_id': uuid.uuid4().hex[:8],
+            'parent_id': parent['span_id'] if parent else None,
+            'name': name,
+        }
+        labels = labels or {}
+        span_attrs = {**labels, **attrs}
+        stack.append(record)
+        started = time.perf_counter()
+        status = 'ok'
+        try:
+            yield span_attrs
+        except BaseException as e:
+            status = 'error'
+            record['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            stack.pop()
+            duration = time.perf_counter() - started
+            record.update(duration_ms=round(duration * 1000, 3), status=status, attrs=span_attrs)
+            self.observe(name.replace('.', '_') + '_seconds', duration, **labels)
+            with self._lock:
+                self._traces.append(record)
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+    def snapshot(self):
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            summaries = {key: list(value) for key, value in self._summaries.items()}
+        return counters, gauges, summaries
+
+    def render_prometheus(self):
+        counters, gauges, summaries = self.snapshot()
+        service = ('service', self.service)
+        families = {}   # metric name -> (type, [(sample name, labels, value), ...])
+        for (name, labels), value in counters.items():
+            families.setdefault(name, ('counter', []))[1].append((name, labels, value))
+        for (name, labels), value in gauges.items():
+            families.setdefault(name, ('gauge', []))[1].append((name, labels, value))
+        for (name, labels), (count, total, maximum) in summaries.items():
+            samples = families.setdefault(name, ('summary', []))[1]
+            samples.append((name + '_count', labels, count))
+            samples.append((name + '_sum', labels, round(total, 6)))
+            families.setdefault(name + '_max', ('gauge', []))[1].append((name + '_max', labels, round(maximum, 6)))
+        families['last_flush_timestamp_seconds'] = ('gauge', [('last_flush_timestamp_seconds', (), round(time.time(), 3))])
+
+        lines = []
+        for name, (kind, samples) in sorted(families.items()):
+            lines.append(f"# TYPE {METRIC_PREFIX}{name} {kind}")
+            for sample, labels, value in sorted(samples, key=lambda s: (s[1], s[0])):
+                lines.append(f"{METRIC_PREFIX}{sample}{_format_labels((service,) + labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def render_json(self):
+        counters, gauges, summaries = self.snapshot()
+        return {
+            'service': self.service,
+            'started_at': datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            'updated_at': datetime.now(timezone.utc).isoformat(),
+            'counters': [{'name': name, 'labels': dict(labels), 'value': value}
+                         for (name, labels), value in sorted(counters.items())],
+            'gauges': [{'name': name, 'labels': dict(labels), 'value': value}
+                       for (name, labels), value in sorted(gauges.items())],
+            'summaries': [{'name': name, 'labels': dict(labels), 'count': count, 'sum': round(total, 6),
+                           'avg': round(total / count, 6), 'max': round(maximum, 6)}
+                          for (name, labels), (count, total, maximum) in sorted(summaries.items())],
+        }
+
+    def _write_atomic(self, filename, content):
+        fd, tmp_path = tempfile.mkstemp(prefix='.metrics-', suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, os.path.join(self.directory, filename))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _append_traces(self, traces):
+        path = os.path.join(self.directory, 'traces.jsonl')
+        if os.path.exists(path) and os.path.getsize(path) > self.max_trace_bytes:
+            os.replace(path, path + '.1')
+        with open(path, 'a', encoding='utf-8') as f:
+            for record in traces:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    def flush(self):
+        with self._lock:
+            traces = self._traces
+            self._traces = []
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write_atomic(f"metrics-{self.service}.prom", self.render_prometheus())
+            self._write_atomic(f"metrics-{self.service}.json",
+                               json.dumps(self.render_json(), ensure_ascii=False, indent=1, default=str))
+            if traces:
+                self._append_traces(traces)
+        except Exception as e:
+            print(f"[WARN] Metrics flush failed: {e}")
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def _service_name():
+    """실행한 스크립트 이름 (engine_start / us_news_crawler / alpha_analyzer ...)"""
+    script = os.path.splitext(os.path.basename(sys.argv[0] if sys.argv and sys.argv[0] else ''))[0]
+    return script if script and not script.startswith('-') else 'python'
+
+
+def get_metrics():
+    """프로세스 공용 지표 레지스트리 (오케스트레이터 안에서는 뉴스/알파 작업이 같은 파일에 기록)"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = MetricsRegistry(_service_name())
+            atexit.register(_metrics.flush)
+        return _metrics
@@ -0,0 +1,229 @@
+"""
+News Source Registry (Plug-in)
+- 각 소스가 URL, 파서, 폴링 주기, 동시 요청 제한, 백오프 정책을 직접 선언
+- StockNewsCrawler는 전역 sleep 대신 소스별 주기에 맞춰 수집
+- 새 소스 추가: 파서 함수 작성 후 register_source(NewsSource(...))
+"""
+
+import hashlib
+import threading
+import time
+
+try:
+    from crawler.http_client import get_client
+    from crawler.metrics import get_metrics
+except ImportError:
+    from http_client import get_client
+    from metrics import get_metrics
+
+
+class BackoffPolicy:
+    """실패가 연속될수록 다음 폴링을 지수적으로 늦춤 (poll_interval * factor^failures)"""
+
+    def __init__(self, factor=2.0, max_delay=1800):
+        self.factor = factor
+        self.max_delay = max_delay
+
+    def delay(self, poll_interval, failures):
+        if failures <= 0:
+            return poll_interval
+        return min(self.max_delay, poll_interval * (self.factor ** failures))
+
+
+class NewsSource:
+    def __init__(self, name, url, parser, poll_interval=300, max_concurrency=1,
+                 backoff=None, timeout=10, headers=None):
+        self.name = name
+        self.url = url
+        self.parser = parser
+        self.poll_interval = poll_interval
+        self.max_concurrency = max_concurrency
+        self.backoff = backoff or BackoffPolicy()
+        self.timeout = timeout
+        self.headers = headers or {}
+
+        # 스케줄 상태
+        self.failures = 0
+        self.next_due = 0.0
+        self.due_slack = min(5.0, poll_interval * 0.1)
+        self.not_modified = False
+        self.skipped = False             # 동시 요청 제한으로 이번 회차를 건너뜀 (성공도 실패도 아님)
+        self.pending_validators = None   # (세대, 이번 응답의 검증 헤더) - 사이클 처리가 끝난 뒤 commit_validators
+        self.generation = 0              # 시간 초과로 포기할 때마다 증가 -> 이전 세대 요청의 늦은 결과는 무시
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def is_due(self, now=None):
+        # 스케줄러 틱이 poll_interval과 같을 때 틱 지연(수십 ms)만큼 늦게 시작한 직전 수집 때문에
+        # 한 틱을 통째로 건너뛰지 않도록 약간의 여유를 둠
+        now = time.monotonic() if now is None else now
+        return now + self.due_slack >= self.next_due
+
+    def fetch(self, headers=None, limit=10, timeout=None, cache=None):
+        """
+        소스를 한 번 수집합니다. 실패 시 예외를 그대로 올려 백오프가 적용되도록 합니다.
+        cache(HttpValidatorCache)가 있으면 조건부 GET을 사용하고,
+        변경이 없으면 파싱 없이 빈 목록을 반환합니다 (self.not_modified = True).
+        이전 요청이 아직 진행 중이면 요청하지 않고 빈 목록을 반환합니다 (self.skipped = True).
+        새 응답의 검증 헤더는 바로 기록하지 않고 pending_validators에 보관합니다
+        -> 번역/분석까지 끝난 뒤 commit_validators()로 기록 (중간에 빠진 기사는 다음 폴링 때 다시 처리)
+        """
+        generation = self.generation
+        self.not_modified = False
+        self.skipped = False
+        self.pending_validators = None
+        if not self._slots.acquire(blocking=False):
+            # 이전 요청이 아직 끝나지 않음 (동시 요청 제한) -> 다음 폴링 시점은 그대로 두고 다음 회차에 다시 시도
+            print(f"[WARN] {self.name}: {self.max_concurrency} request(s) already in flight. Skipping.")
+            self.skipped = True
+            get_metrics().inc('news_fetch_total', source=self.name, result='skipped')
+            return []
+        metrics = get_metrics()
+        result = 'error'
+        try:
+            with metrics.span('news.fetch', labels={'source': self.name}) as attrs:
+                req_headers = {**(headers or {}), **self.headers}
+                if cache is None:
+                    res = get_client().get(self.url, headers=req_headers, timeout=timeout or self.timeout)
+                    attrs['status'] = res.status_code
+                    if res.status_code != 200:
+                        raise RuntimeError(f"HTTP {res.status_code}")
+                    content = res.content
+                else:
+                    content, validators = cache.fetch(self.url, headers=req_headers, timeout=timeout or self.timeout)
+                    if content is None:
+                        self.not_modified = True
+                        result = 'not_modified'
+                        return []
+                items = self.parser(content, limit)
+                if cache is not None:
+                    self.pending_validators = (generation, validators)
+                attrs.update(bytes=len(content), items=len(items))
+                metrics.inc('news_fetch_bytes_total', len(content), source=self.name)
+                metrics.inc('news_items_fetched_total', len(items), source=self.name)
+                result = 'ok'
+                return items
+        finally:
+            metrics.inc('news_fetch_total', source=self.name, result=result)
+            self._slots.release()
+
+    def commit_validators(self, cache):
+        """이번 사이클에서 이 소스의 기사가 모두 처리된 경우에만 호출 -> 다음 폴링부터 304/해시로 건너뜀"""
+        pending, self.pending_validators = self.pending_validators, None
+        if cache is not None and pending and pending[0] == self.generation:
+            cache.remember(self.url, pending[1])
+
+    def cancel(self):
+        """시간 초과로 포기한 요청 -> 스레드가 나중에 끝나도 그 결과(성공 표시/검증 헤더)는 반영하지 않음"""
+        self.generation += 1
+        self.pending_validators = None
+
+    def mark_success(self, now=None):
+        """now: 수집을 시작한 시각 (끝난 시각 기준이면 수집 시간만큼 주기가 계속 밀림)"""
+        self.failures = 0
+        self.next_due = (time.monotonic() if now is None else now) + self.poll_interval
+
+    def mark_failure(self, now=None):
+        self.failures += 1
+        delay = self.backoff.delay(self.poll_interval, self.failures)
+        self.next_due = (time.monotonic() if now is None else now) + delay
+        print(f"[WARN] {self.name}: failure #{self.failures}, backing off {int(delay)}s")
+
+
+SOURCE_REGISTRY = {}
+
+
+def register_source(source):
+    SOURCE_REGISTRY[source.name] = source
+    return source
+
+
+def get_sources(names=None):
+    if names is None:
+        return list(SOURCE_REGISTRY.values())
+    return [SOURCE_REGISTRY[n] for n in names if n in SOURCE_REGISTRY]
+
+
+# ----------------------------------------------------------------------
+# Parsers
+# ----------------------------------------------------------------------
+
+def parse_yahoo_rss(content, limit=10):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'xml')
+    news_items = []
+    for item in soup.find_all('item')[:limit]:
+        title = item.title.text
+        link = item.link.text
+        pub_date = item.pubDate.text
+        description = item.description.text if item.description else ""
+
+        # Use stable MD5 hash for ID
+        link_hash = hashlib.md5(link.encode()).hexdigest()[:12]
+
+        news_items.append({
+            'id': f"yh_{link_hash}",
+            'source': 'Yahoo Finance',
+            'title': title,
+            'excerpt': description,
+            'link': link,
+            'time': pub_date,
+            'is_breaking': 'breaking' in title.lower() or 'urgent' in title.lower()
+        })
+    return news_items
+
+
+def parse_investing_html(content, limit=10):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'html.parser')
+    news_items = []
+    for article in soup.find_all('article', class_='articleItem')[:limit]:
+        text_div = article.find('div', class_='textDiv')
+        if not text_div: continue
+
+        a_tag = text_div.find('a', class_='title')
+        title = a_tag.text.strip()
+        link = "https://www.investing.com" + a_tag['href']
+        excerpt = text_div.find('p').text.strip()
+        time_span = text_div.find('span', class_='date')
+        pub_time = time_span.text if time_span else ""
+
+        # Use stable MD5 hash for ID
+        link_hash = hashlib.md5(link.encode()).hexdigest()[:12]
+
+        news_items.append({
+            'id': f"iv_{link_hash}",
+            'source': 'Investing.com',
+            'title': title,
+            'excerpt': excerpt,
+            'link': link,
+            'time': pub_time,
+            'is_breaking': False
+        })
+    return news_items
+
+
+# ----------------------------------------------------------------------
+# Registered sources (등록 순서 = 결과 병합 순서)
+# ----------------------------------------------------------------------
+
+# RSS: 가볍고 빠름 -> 짧은 주기
+register_source(NewsSource(
+    name='Yahoo Finance',
+    url="https://finance.yahoo.com/news/rssindex",
+    parser=parse_yahoo_rss,
+    poll_interval=60,
+    max_concurrency=2,
+    backoff=BackoffPolicy(factor=2.0, max_delay=900),
+    headers={'Accept': 'application/rss+xml, application/xml, text/xml, */*'},
+))
+
+# HTML: 무겁고 차단 위험 -> 긴 주기
+register_source(NewsSource(
+    name='Investing.com',
+    url="https://www.investing.com/news/stock-market-news",
+    parser=parse_investing_html,
+    poll_interval=600,
+    max_concurrency=1,
+    backoff=BackoffPolicy(factor=2.0, max_delay=3600),
+    headers={'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'},
+))
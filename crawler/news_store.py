@@ -0,0 +1,109 @@
+"""
+Rolling News Store (us-news-realtime.json)
+- 매 사이클 결과로 파일을 덮어쓰지 않고, id 기준으로 기존 목록에 병합
+- 개수(max_items) / 나이(max_age_hours) 제한으로 오래된 기사는 자동 제거
+- 이후 사이클에 다른 출처로 들어온 같은 기사는 저장된 기사의 sources에 추가 (add_source)
+- 임시 파일에 쓴 뒤 rename -> 읽는 쪽은 절대 반쯤 쓰인 파일을 보지 않음
+"""
+
+import json
+import os
+import stat
+import tempfile
+from datetime import datetime, timedelta
+
+
+class RollingNewsStore:
+    def __init__(self, path, max_items=100, max_age_hours=48):
+        self.path = path
+        self.max_items = max_items
+        self.max_age_hours = max_age_hours
+        self.items = self._load()
+        self.dirty = False   # merge 없이 바뀐 내용(add_source)이 있어 저장이 필요한지
+
+    def _load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                return [item for item in data if isinstance(item, dict) and item.get('id')]
+            except Exception as e:
+                print(f"[WARN] Failed to load news store ({e}). Starting empty.")
+        return []
+
+    def __contains__(self, item_id):
+        return any(item['id'] == item_id for item in self.items)
+
+    def known_ids(self):
+        return {item['id'] for item in self.items}
+
+    def add_source(self, item_id, source, link):
+        """저장된 기사에 출처 추가. Returns: 새로 추가됐으면 True (기사가 없거나 이미 있는 링크면 False)"""
+        for item in self.items:
+            if item['id'] != item_id:
+                continue
+            sources = item.setdefault('sources', [{'source': item.get('source'), 'link': item.get('link')}])
+            if any(entry.get('link') == link for entry in sources):
+                return False
+            sources.append({'source': source, 'link': link})
+            self.dirty = True
+            return True
+        return False
+
+    def merge(self, new_items):
+        """
+        새 기사를 앞쪽에(피드 순서 유지), 기존 기사는 그 뒤에 배치합니다.
+        이미 있는 id는 내용만 갱신하고 최초 crawled_at은 유지합니다.
+        Returns: 실제로 새로 추가된 기사 수
+        """
+        existing = {item['id']: item for item in self.items}
+        merged = []
+        seen = set()
+        added = 0
+        for item in new_items:
+            if not item or item['id'] in seen:
+                continue
+            seen.add(item['id'])
+            old = existing.get(item['id'])
+            if old is None:
+                added += 1
+            elif old.get('crawled_at'):
+                item = {**item, 'crawled_at': old['crawled_at']}
+            merged.append(item)
+        merged.extend(item for item in self.items if item['id'] not in seen)
+
+        self.items = self._prune(merged)
+        return added
+
+    def _prune(self, items):
+        cutoff = datetime.now() - timedelta(hours=self.max_age_hours)
+        kept = []
+        for item in items:
+            try:
+                if datetime.fromisoformat(item.get('crawled_at') or '') < cutoff:
+                    continue
+            except (TypeError, ValueError):
+                # 시각이 없거나 형식이 다른 기사는 개수 제한으로만 정리
+                pass
+            kept.append(item)
+        return kept[:self.max_items]
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.us-news-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.items, f, ensure_ascii=False, indent=2)
+            # mkstemp는 0600으로 만듦 -> 공개 파일 권한 유지 (기존 파일 권한, 없으면 0644)
+            try:
+                mode = stat.S_IMODE(os.stat(self.path).st_mode)
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
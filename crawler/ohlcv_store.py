@@ -0,0 +1,132 @@
+"""
+Local OHLCV Time-Series Store
+- 티커별 NumPy 구조화 배열(.npy) 파일 하나 (ts, open, high, low, close, volume)
+- 읽기는 memory-map(np.load mmap_mode='r') -> 수천 종목도 필요한 부분만 로드
+- 새 봉은 타임스탬프 기준으로 병합(같은 ts는 최신 값으로 교체) 후 원자적으로 교체 저장
+- 다음 수집 때는 마지막 저장 봉 이후 구간만 요청 (1mo 전체 재다운로드 불필요)
+- quote API 응답(종목별 현재가)도 오늘 봉 하나로 변환해 병합 가능
+"""
+
+import os
+import tempfile
+import time
+import numpy as np
+
+OHLCV_DTYPE = np.dtype([
+    ('ts', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+
+STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'ohlcv')
+
+
+def normalize_ts(ts, interval):
+    """일봉은 날짜(UTC 자정) 단위로 맞춤 -> 장중 임시 봉과 확정 봉이 같은 키를 가짐"""
+    if interval == '1d':
+        return int(ts) // 86400 * 86400
+    return int(ts)
+
+
+def bars_from_chart(chart_data, interval='1d'):
+    """Yahoo chart 응답 -> OHLCV 구조화 배열 (종가 없는 봉 제외)"""
+    timestamps = chart_data.get('timestamp') or []
+    quote = chart_data['indicators']['quote'][0]
+    rows = []
+    for i, ts in enumerate(timestamps):
+        close = quote['close'][i]
+        if close is None:
+            continue
+
+        def field(name):
+            values = quote.get(name) or []
+            value = values[i] if i < len(values) else None
+            return np.nan if value is None else value
+
+        rows.append((normalize_ts(ts, interval), field('open'), field('high'), field('low'), close, field('volume')))
+    return np.array(rows, dtype=OHLCV_DTYPE)
+
+
+def bar_from_quote(quote, interval='1d'):
+    """Yahoo quote 응답의 종목 하나 -> 오늘(장중이면 임시) 봉 하나짜리 배열. 시세가 없으면 None"""
+    price = quote.get('regularMarketPrice')
+    market_time = quote.get('regularMarketTime')
+    if price is None or market_time is None:
+        return None
+
+    def field(name):
+        value = quote.get(name)
+        return np.nan if value is None else value
+
+    row = (normalize_ts(market_time, interval), field('regularMarketOpen'), field('regularMarketDayHigh'),
+           field('regularMarketDayLow'), price, field('regularMarketVolume'))
+    return np.array([row], dtype=OHLCV_DTYPE)
+
+
+def previous_weekday(day_ts):
+    """일봉 타임스탬프(UTC 자정) 기준 직전 평일 (휴장일은 고려하지 않음 -> 휴장 다음날은 chart로 보충될 뿐)"""
+    day_ts = int(day_ts) - 86400
+    while time.gmtime(day_ts).tm_wday >= 5:
+        day_ts -= 86400
+    return day_ts
+
+
+class OhlcvStore:
+    def __init__(self, root=STORE_DIR, interval='1d'):
+        self.interval = interval
+        self.root = os.path.join(root, interval)
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, symbol):
+        return os.path.join(self.root, f"{symbol.upper()}.npy")
+
+    def load(self, symbol, mmap=True):
+        path = self.path(symbol)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=OHLCV_DTYPE)
+        try:
+            return np.load(path, mmap_mode='r' if mmap else None)
+        except Exception as e:
+            print(f"[WARN] {symbol}: corrupted OHLCV file ({e}). Rebuilding from scratch.")
+            return np.empty(0, dtype=OHLCV_DTYPE)
+
+    def last_timestamp(self, symbol):
+        bars = self.load(symbol)
+        return int(bars['ts'][-1]) if len(bars) else None
+
+    def append(self, symbol, new_bars):
+        """새 봉 병합 (같은 ts는 새 값 우선). Returns: 저장 후 전체 봉 개수"""
+        if len(new_bars) == 0:
+            return len(self.load(symbol))
+        existing = np.array(self.load(symbol, mmap=False))
+        merged = np.concatenate([existing, new_bars.astype(OHLCV_DTYPE)])
+        # 뒤쪽(새 값)을 남기기 위해 역순에서 unique -> 다시 시간순 정렬
+        _, last_idx = np.unique(merged['ts'][::-1], return_index=True)
+        merged = merged[::-1][last_idx]
+        merged.sort(order='ts')
+
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{symbol}-", suffix='.npy', dir=self.root)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, merged)
+            os.replace(tmp_path, self.path(symbol))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return len(merged)
+
+    def load_series(self, symbols, field='close', lookback=None):
+        """{symbol: pd.Series(field, index=ts)} - 최근 lookback개 봉만"""
+        import pandas as pd
+        series = {}
+        for symbol in symbols:
+            bars = self.load(symbol)
+            if lookback:
+                bars = bars[-lookback:]
+            if len(bars):
+                series[symbol] = pd.Series(np.array(bars[field]), index=np.array(bars['ts']), dtype='float64')
+        return series
@@ -0,0 +1,129 @@
+"""
+Staged Async Pipeline
+- 단계(Stage)마다 asyncio.Queue로 연결, 단계별 동시 실행 수 제한
+- 블로킹 작업(HTTP, 번역, OpenAI SDK)은 전용 스레드 풀에서 실행 -> 이벤트 루프는 막히지 않음
+- 앞 단계 결과가 나오는 즉시 다음 단계가 시작됨 (예: 번역이 끝난 기사부터 분석)
+
+사용 예:
+    stages = [
+        Stage('translate', translate_fn, concurrency=4),
+        Stage('analyze', analyze_fn, concurrency=2, batch_size=8),
+    ]
+    results = asyncio.run(run_stages(items, stages))
+
+각 단계 함수는 출력 목록(list)을 반환합니다. 빈 목록이면 해당 항목은 다음 단계로 넘어가지 않습니다.
+batch_size가 있는 단계는 항목 목록(list)을 입력으로 받습니다.
+단계별 처리 시간(pipeline_stage_seconds)과 시간 초과 / 오류 수는 crawler/metrics.py에 기록됩니다.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from crawler.metrics import get_metrics
+except ImportError:
+    from metrics import get_metrics
+
+_DONE = object()
+
+
+class Stage:
+    def __init__(self, name, fn, concurrency=1, batch_size=None, timeout=None, on_timeout=None, blocking=True):
+        self.name = name
+        self.fn = fn
+        self.concurrency = max(1, concurrency)
+        self.batch_size = batch_size
+        # timeout: 초 단위 숫자 또는 job -> 초 를 반환하는 함수
+        self.timeout = timeout
+        self.on_timeout = on_timeout
+        self.blocking = blocking
+
+    def _timeout_for(self, job):
+        if callable(self.timeout):
+            return self.timeout(job)
+        return self.timeout
+
+    async def _call(self, job, executor):
+        if not self.blocking:
+            return self.fn(job)
+        call = asyncio.get_running_loop().run_in_executor(executor, self.fn, job)
+        timeout = self._timeout_for(job)
+        if timeout is None:
+            return await call
+        return await asyncio.wait_for(call, timeout=max(0, timeout))
+
+    async def _worker(self, inq, outq, executor):
+        metrics = get_metrics()
+        while True:
+            job = await inq.get()
+            if job is _DONE:
+                await inq.put(_DONE)
+                return
+            started = time.perf_counter()
+            try:
+                outputs = await self._call(job, executor)
+            except asyncio.TimeoutError:
+                print(f"[WARN] Pipeline stage '{self.name}' timed out. Dropping job.")
+                metrics.inc('pipeline_stage_errors_total', stage=self.name, kind='timeout')
+                if self.on_timeout:
+                    self.on_timeout(job)
+                continue
+            except Exception as e:
+                print(f"[ERROR] Pipeline stage '{self.name}' failed: {e}")
+                metrics.inc('pipeline_stage_errors_total', stage=self.name, kind='error')
+                continue
+            finally:
+                metrics.observe('pipeline_stage_seconds', time.perf_counter() - started, stage=self.name)
+            for out in outputs or []:
+                await outq.put(out)
+
+    async def _batcher(self, inq, batchq):
+        batch = []
+        while True:
+            item = await inq.get()
+            if item is _DONE:
+                break
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                await batchq.put(batch)
+                batch = []
+        if batch:
+            await batchq.put(batch)
+        await batchq.put(_DONE)
+
+    async def run(self, inq, outq, executor):
+        if self.batch_size:
+            batchq = asyncio.Queue()
+            batcher = asyncio.create_task(self._batcher(inq, batchq))
+            workers = [asyncio.create_task(self._worker(batchq, outq, executor)) for _ in range(self.concurrency)]
+            await asyncio.gather(batcher, *workers)
+        else:
+            workers = [asyncio.create_task(self._worker(inq, outq, executor)) for _ in range(self.concurrency)]
+            await asyncio.gather(*workers)
+        await outq.put(_DONE)
+
+
+async def run_stages(items, stages):
+    queues = [asyncio.Queue() for _ in range(len(stages) + 1)]
+    for item in items:
+        queues[0].put_nowait(item)
+    queues[0].put_nowait(_DONE)
+
+    # 전용 스레드 풀: 시간 초과로 포기한 작업이 끝나기를 기다리지 않고 종료하기 위함
+    # (asyncio 기본 executor는 asyncio.run 종료 시 모든 스레드를 기다림)
+    executor = ThreadPoolExecutor(max_workers=sum(s.concurrency for s in stages if s.blocking) or 1,
+                                  thread_name_prefix='pipeline')
+    try:
+        tasks = [asyncio.create_task(stage.run(queues[i], queues[i + 1], executor)) for i, stage in enumerate(stages)]
+        await asyncio.gather(*tasks)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    while True:
+        out = queues[-1].get_nowait()
+        if out is _DONE:
+            break
+        results.append(out)
+    return results
@@ -0,0 +1,287 @@
+"""
+Background Git Publisher (Vercel 자동 업데이트용)
+- save()마다 git add/commit/push를 동기 실행하지 않고, 변경된 파일만 표시(mark_dirty)
+- 백그라운드 스레드가 디바운스 창(debounce) 동안 모아서 한 번에 커밋/푸시
+- 실제 내용이 바뀐 파일만 커밋 (해시 비교), 실패 시 지수 백오프 + 지터로 재시도
+- 파일 잠금으로 여러 프로세스가 동시에 git을 건드리지 않도록 단일 작성자 보장
+- 작업 트리가 self.branch 위에 있을 때만 커밋/푸시 (detached HEAD / rebase 중이면 발행 보류)
+- 원격이 앞서 있으면 rebase 후 재시도, rebase가 실패하면 abort해서 작업 트리를 원래 상태로 복구
+- 성공 보고는 마지막 커밋이 원격 브랜치에 실제로 포함된 경우에만
+"""
+
+import atexit
+import hashlib
+import os
+import random
+import subprocess
+import threading
+import time
+
+try:
+    from crawler.metrics import get_metrics
+except ImportError:
+    from metrics import get_metrics
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class GitPublisher:
+    def __init__(self, repo_dir=REPO_DIR, remote='origin', branch='main', debounce=60, max_delay=300,
+                 max_retries=4, lock_timeout=600):
+        self.repo_dir = repo_dir
+        self.remote = remote
+        self.branch = branch
+        self.debounce = debounce          # 마지막 변경 후 이만큼 조용하면 발행
+        self.max_delay = max_delay        # 변경이 계속 들어와도 최대 이 시간 안에는 발행
+        self.max_retries = max_retries
+        self.lock_timeout = lock_timeout  # 이보다 오래된 잠금 파일은 비정상 종료로 간주
+        self.lock_path = os.path.join(repo_dir, '.git', 'stock-empire-publish.lock')
+
+        self._dirty = {}                  # rel_path -> commit message
+        self._first_mark = None
+        self._last_mark = None
+        self._published_hashes = {}
+        self._unpushed = False
+        self._last_commit = None          # 마지막으로 만든 발행 커밋 (푸시 확인용)
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopping = False
+        self._atexit_registered = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def mark_dirty(self, path, message):
+        """발행 대상 파일 등록 (즉시 반환, git을 기다리지 않음)"""
+        rel_path = os.path.relpath(os.path.abspath(path), self.repo_dir)
+        with self._cond:
+            now = time.monotonic()
+            self._dirty[rel_path] = message
+            self._first_mark = self._first_mark or now
+            self._last_mark = now
+            self._cond.notify()
+        self.start()
+
+    def start(self):
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name='git-publisher', daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+
+    def flush(self):
+        """대기 중인 변경을 즉시 발행 (프로세스 종료 / 단발 실행용)"""
+        with self._cond:
+            dirty = self._take_dirty()
+        if dirty or self._unpushed:
+            self._publish(dirty)
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    def _take_dirty(self):
+        dirty = self._dirty
+        self._dirty = {}
+        self._first_mark = None
+        self._last_mark = None
+        return dirty
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopping:
+                    if self._dirty:
+                        now = time.monotonic()
+                        wait = min(self._last_mark + self.debounce, self._first_mark + self.max_delay) - now
+                        if wait <= 0:
+                            break
+                        self._cond.wait(timeout=wait)
+                    else:
+                        self._cond.wait()
+                if self._stopping:
+                    return
+                dirty = self._take_dirty()
+            try:
+                self._publish(dirty)
+            except Exception as e:
+                print(f"[WARN] Git publish failed: {e}")
+
+    def _git(self, *args):
+        return subprocess.run(['git', *args], cwd=self.repo_dir, capture_output=True, text=True)
+
+    def _file_hash(self, rel_path):
+        try:
+            with open(os.path.join(self.repo_dir, rel_path), 'rb') as f:
+                return hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def _requeue(self, changed):
+        """발행하지 못한 파일을 다시 대기열에 넣음 (다음 디바운스 창에서 재시도)"""
+        with self._cond:
+            for rel_path, (message, _) in changed.items():
+                self._dirty.setdefault(rel_path, message)
+            if changed:
+                now = time.monotonic()
+                self._first_mark = self._first_mark or now
+                self._last_mark = now
+
+    def _git_dir(self):
+        res = self._git('rev-parse', '--git-dir')
+        return os.path.join(self.repo_dir, res.stdout.strip()) if res.returncode == 0 else None
+
+    def _on_branch(self):
+        """self.branch가 체크아웃되어 있고 rebase/merge 중이 아니면 True"""
+        res = self._git('symbolic-ref', '--quiet', '--short', 'HEAD')
+        if res.returncode != 0 or res.stdout.strip() != self.branch:
+            print(f"[WARN] Git publish skipped: working tree is not on '{self.branch}' "
+                  f"({res.stdout.strip() or 'detached HEAD'}).")
+            return False
+        git_dir = self._git_dir()
+        if git_dir and any(os.path.exists(os.path.join(git_dir, name))
+                           for name in ('rebase-merge', 'rebase-apply', 'MERGE_HEAD')):
+            print("[WARN] Git publish skipped: a rebase or merge is in progress.")
+            return False
+        return True
+
+    def _acquire_lock(self):
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_path) > self.lock_timeout:
+                        os.remove(self.lock_path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    return False
+                time.sleep(1)
+
+    def _release_lock(self):
+        try:
+            os.remove(self.lock_path)
+        except OSError:
+            pass
+
+    def _publish(self, dirty):
+        # 내용이 실제로 바뀐 파일만
+        changed = {}
+        for rel_path, message in dirty.items():
+            digest = self._file_hash(rel_path)
+            if digest and digest != self._published_hashes.get(rel_path):
+                changed[rel_path] = (message, digest)
+        if not changed and not self._unpushed:
+            return
+
+        if not self._acquire_lock():
+            print("[WARN] Git publish lock busy. Re-queueing changes.")
+            get_metrics().inc('publish_total', result='lock_busy')
+            self._requeue(changed)
+            return
+
+        metrics = get_metrics()
+        started = time.monotonic()
+        result = 'error'
+        try:
+            with metrics.span('publish', files=len(changed)) as attrs:
+                if not self._on_branch():
+                    self._requeue(changed)
+                    result = attrs['result'] = 'wrong_branch'
+                    return
+                if changed:
+                    paths = sorted(changed)
+                    self._git('add', '--', *paths)
+                    if self._git('diff', '--cached', '--quiet', '--', *paths).returncode != 0:
+                        messages = sorted({message for message, _ in changed.values()})
+                        summary = ", ".join(m for m in messages)
+                        res = self._git('commit', '-m', f"update: {summary} [skip ci]", '--', *paths)
+                        if res.returncode != 0:
+                            print(f"[WARN] Git commit failed: {res.stderr.strip() or res.stdout.strip()}")
+                            self._requeue(changed)
+                            result = attrs['result'] = 'commit_failed'
+                            return
+                        self._unpushed = True
+                        self._last_commit = self._git('rev-parse', 'HEAD').stdout.strip() or None
+                    for rel_path, (_, digest) in changed.items():
+                        self._published_hashes[rel_path] = digest
+
+                result = 'unchanged'
+                if self._unpushed:
+                    result = 'ok' if self._push() else 'push_failed'
+                    if result == 'ok':
+                        print(f"[SUCCESS] Published {len(changed)} file(s) to GitHub in {round(time.monotonic() - started, 2)}s")
+                attrs['result'] = result
+        finally:
+            metrics.inc('publish_total', result=result)
+            self._release_lock()
+
+    def _pushed(self):
+        """마지막 발행 커밋(rebase됐으면 현재 브랜치 끝)이 원격 브랜치에 포함되어 있는지"""
+        commit = self._last_commit or self.branch
+        remote_ref = f"{self.remote}/{self.branch}"
+        return self._git('merge-base', '--is-ancestor', commit, remote_ref).returncode == 0
+
+    def _rebase(self):
+        """
+        원격 변경 위로 로컬 커밋 재적용. 충돌 내용은 이번에 새로 만든 데이터가 우선
+        (rebase에서 -X theirs = 재적용되는 로컬 커밋 쪽). 그래도 실패하면 abort 후 False
+        """
+        res = self._git('pull', '--rebase', '--autostash', '-X', 'theirs', self.remote, self.branch)
+        if res.returncode == 0:
+            # 재적용된 커밋은 해시가 바뀜 -> 현재 브랜치 끝을 기준으로 확인
+            self._last_commit = self._git('rev-parse', self.branch).stdout.strip() or None
+            return True
+        print(f"[WARN] Git rebase onto {self.remote}/{self.branch} failed: {res.stderr.strip() or res.stdout.strip()}")
+        self._git('rebase', '--abort')
+        return False
+
+    def _push(self):
+        ref = f"refs/heads/{self.branch}"
+        for attempt in range(self.max_retries + 1):
+            res = self._git('push', self.remote, f"{ref}:{ref}")
+            if res.returncode == 0:
+                if self._pushed():
+                    self._unpushed = False
+                    return True
+                print(f"[WARN] Git push reported success but {self.remote}/{self.branch} does not contain the publish commit.")
+                return False
+            print(f"[WARN] Git push failed (attempt {attempt + 1}): {res.stderr.strip()}")
+            if attempt == self.max_retries:
+                break
+            # 원격이 앞서 있으면 rebase 후 재시도 (충돌이 남으면 같은 시도를 반복하지 않음)
+            if not self._rebase():
+                break
+            time.sleep(min(60, 2 ** attempt) + random.uniform(0, 1))
+        # 커밋은 로컬 브랜치에 남아 있으므로 다음 발행 때 다시 푸시
+        return False
+
+
+_publisher = None
+_publisher_lock = threading.Lock()
+
+
+def get_publisher():
+    """프로세스 공용 Publisher (뉴스 크롤러와 알파 분석기가 같은 큐를 공유)"""
+    global _publisher
+    with _publisher_lock:
+        if _publisher is None:
+            _publisher = GitPublisher()
+        return _publisher
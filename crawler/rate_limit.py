@@ -0,0 +1,82 @@
+"""
+Token Bucket Rate Limiter
+- 고정 time.sleep(1) 대신 공급자 한도(초당 요청 수)에 맞춰 요청 속도 제어
+- 여러 스레드에서 공유 가능 (acquire는 필요한 만큼만 대기)
+- AdaptiveRateLimiter: 차단(429) 응답에 맞춰 속도를 자동 조절
+- HostConcurrencyLimiter: 호스트별 동시 요청 수 제한
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=None):
+        """rate: 초당 충전되는 토큰 수, capacity: 최대 버스트 크기"""
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens=1):
+        """토큰을 예약하고, 사용 가능해질 때까지 기다려야 하는 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens=1):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    AIMD 방식 적응형 속도 제한
+    - 성공할 때마다 초당 요청 수를 조금씩 올림 (additive increase)
+    - 429/차단 응답을 받으면 절반으로 낮춤 (multiplicative decrease)
+    """
+
+    def __init__(self, rate, min_rate=0.5, max_rate=10, increase=0.1, capacity=None):
+        super().__init__(rate, capacity=capacity)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.increase = float(increase)
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            # 이미 쌓인 버스트도 비움
+            self._tokens = min(self._tokens, 0.0)
+        print(f"[WARN] Throttled by upstream. Rate limit lowered to {round(self.rate, 2)} req/s")
+
+
+class HostConcurrencyLimiter:
+    """호스트별 동시 요청 수 제한 (같은 서버에 한꺼번에 몰리지 않도록)"""
+
+    def __init__(self, per_host=4):
+        self.per_host = per_host
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def slot(self, url):
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._slots[host]
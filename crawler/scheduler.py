@@ -0,0 +1,500 @@
+"""
+Job Scheduler (Interval / Cron / US Market Hours)
+- IntervalTrigger: 고정 간격
+- CronTrigger: 5필드 cron 식 ("분 시 일 월 요일", *, */n, a-b, a-b/n, 목록), 로컬 시간 또는 뉴욕 시간 기준
+- MarketHoursTrigger: 미국 정규장 / 프리·애프터마켓 / 휴장(주말·NYSE 휴일)마다 다른 주기 (None이면 그 구간은 쉼)
+  -> 구간이 바뀌는 순간(예: 09:30 ET 개장)에 바로 한 번 실행
+- 놓친 실행 catch-up: 프로그램이 꺼져 있었거나 작업이 길어져 지나간 실행은 catch_up 초 이내면 한 번만 실행
+- 중복 실행 방지: 같은 작업이 아직 돌고 있으면 그 회차는 건너뜀
+- 뉴욕 시간: zoneinfo(America/New_York), tzdata가 없으면 미국 서머타임 규칙으로 직접 계산
+"""
+
+import calendar
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, date, timedelta, timezone, time as dtime
+from functools import lru_cache
+
+try:
+    from crawler.metrics import get_metrics
+except ImportError:
+    from metrics import get_metrics
+
+try:
+    from zoneinfo import ZoneInfo
+    MARKET_TZ = ZoneInfo('America/New_York')
+except Exception:  # Python < 3.9 또는 tzdata 없는 Windows
+    MARKET_TZ = None
+
+PRE_MARKET_OPEN = dtime(4, 0)
+MARKET_OPEN = dtime(9, 30)
+MARKET_CLOSE = dtime(16, 0)
+EARLY_CLOSE = dtime(13, 0)
+AFTER_HOURS_CLOSE = dtime(20, 0)
+EARLY_AFTER_HOURS_CLOSE = dtime(17, 0)
+
+
+# ----------------------------------------------------------------------
+# Clocks (타임스탬프 <-> 해당 지역 시각, tzinfo 없는 datetime)
+# ----------------------------------------------------------------------
+class LocalClock:
+    def to_local(self, ts):
+        return datetime.fromtimestamp(ts)
+
+    def to_ts(self, local):
+        return local.timestamp()
+
+
+class MarketClock:
+    """뉴욕 시각 (EST -5h / EDT -4h)"""
+
+    def to_local(self, ts):
+        if MARKET_TZ is not None:
+            return datetime.fromtimestamp(ts, MARKET_TZ).replace(tzinfo=None)
+        utc = datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+        return utc + timedelta(hours=self._utc_offset(utc))
+
+    def to_ts(self, local):
+        if MARKET_TZ is not None:
+            return local.replace(tzinfo=MARKET_TZ).timestamp()
+        for offset in (-4, -5):
+            ts = (local - timedelta(hours=offset)).replace(tzinfo=timezone.utc).timestamp()
+            if self.to_local(ts) == local:
+                return ts
+        # 서머타임 시작 시 존재하지 않는 시각 (02:00~03:00) -> 표준시로 해석
+        return (local + timedelta(hours=5)).replace(tzinfo=timezone.utc).timestamp()
+
+    @staticmethod
+    def _utc_offset(utc):
+        """미국 서머타임: 3월 둘째 일요일 02:00 EST ~ 11월 첫째 일요일 02:00 EDT"""
+        start = datetime.combine(nth_weekday(utc.year, 3, calendar.SUNDAY, 2), dtime(7, 0))
+        end = datetime.combine(nth_weekday(utc.year, 11, calendar.SUNDAY, 1), dtime(6, 0))
+        return -4 if start <= utc < end else -5
+
+
+LOCAL_CLOCK = LocalClock()
+MARKET_CLOCK = MarketClock()
+
+
+# ----------------------------------------------------------------------
+# NYSE Calendar
+# ----------------------------------------------------------------------
+def nth_weekday(year, month, weekday, n):
+    """n번째 요일 (n=-1이면 마지막)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year, month, calendar.monthrange(year, month)[1])
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def easter(year):
+    """부활절 (그레고리력, Anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 19 * l) // 433
+    month = (h + l - 7 * m + 90) // 25
+    return date(year, month, (h + l - 7 * m + 33 * month + 19) % 32)
+
+
+def _observed(day):
+    """토요일 휴일 -> 금요일, 일요일 휴일 -> 월요일"""
+    if day.weekday() == calendar.SATURDAY:
+        return day - timedelta(days=1)
+    if day.weekday() == calendar.SUNDAY:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=None)
+def nyse_holidays(year):
+    new_year = date(year, 1, 1)
+    holidays = {
+        nth_weekday(year, 1, calendar.MONDAY, 3),         # Martin Luther King Jr. Day
+        nth_weekday(year, 2, calendar.MONDAY, 3),         # Washington's Birthday
+        easter(year) - timedelta(days=2),                 # Good Friday
+        nth_weekday(year, 5, calendar.MONDAY, -1),        # Memorial Day
+        _observed(date(year, 7, 4)),                      # Independence Day
+        nth_weekday(year, 9, calendar.MONDAY, 1),         # Labor Day
+        nth_weekday(year, 11, calendar.THURSDAY, 4),      # Thanksgiving
+        _observed(date(year, 12, 25)),                    # Christmas
+    }
+    # 새해가 토요일이면 전년도 12/31은 휴장하지 않음 (NYSE 규칙)
+    if new_year.weekday() != calendar.SATURDAY:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))        # Juneteenth
+    return frozenset(holidays)
+
+
+@lru_cache(maxsize=None)
+def nyse_early_closes(year):
+    """13:00 조기 폐장일 (독립기념일 전날, 추수감사절 다음날, 크리스마스 이브)"""
+    candidates = [date(year, 7, 3), nth_weekday(year, 11, calendar.THURSDAY, 4) + timedelta(days=1),
+                  date(year, 12, 24)]
+    return frozenset(day for day in candidates if is_trading_day(day))
+
+
+def is_trading_day(day):
+    return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+
+def next_trading_day(day):
+    """day 당일 포함, 가장 가까운 거래일"""
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    return day
+
+
+def _sessions(day):
+    early = day in nyse_early_closes(day.year)
+    close = EARLY_CLOSE if early else MARKET_CLOSE
+    after_close = EARLY_AFTER_HOURS_CLOSE if early else AFTER_HOURS_CLOSE
+    return [('pre', PRE_MARKET_OPEN, MARKET_OPEN), ('regular', MARKET_OPEN, close), ('post', close, after_close)]
+
+
+def market_session(ts):
+    """
+    Returns: (구간, 구간이 끝나는 타임스탬프)
+    구간: 'pre' (04:00~09:30 ET) / 'regular' (09:30~16:00) / 'post' (~20:00) / 'closed'
+    """
+    now = MARKET_CLOCK.to_local(ts)
+    today = now.date()
+    if is_trading_day(today):
+        for name, start, end in _sessions(today):
+            if now < datetime.combine(today, start):
+                return 'closed', MARKET_CLOCK.to_ts(datetime.combine(today, start))
+            if now < datetime.combine(today, end):
+                return name, MARKET_CLOCK.to_ts(datetime.combine(today, end))
+    reopen = next_trading_day(today + timedelta(days=1))
+    return 'closed', MARKET_CLOCK.to_ts(datetime.combine(reopen, PRE_MARKET_OPEN))
+
+
+# ----------------------------------------------------------------------
+# Triggers (next_time(after): after 이후 첫 실행 시각, 타임스탬프)
+# ----------------------------------------------------------------------
+class IntervalTrigger:
+    def __init__(self, seconds):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+
+    def next_time(self, after):
+        return after + self.seconds
+
+    def __repr__(self):
+        return f"every {self.seconds}s"
+
+
+CRON_FIELDS = (('minute', 0, 59), ('hour', 0, 23), ('day', 1, 31), ('month', 1, 12), ('weekday', 0, 7))
+
+
+def parse_cron_field(expr, low, high):
+    values = set()
+    for part in expr.split(','):
+        value_range, _, step = part.partition('/')
+        step = int(step) if step else 1
+        if value_range == '*':
+            start, end = low, high
+        elif '-' in value_range:
+            start, end = (int(v) for v in value_range.split('-', 1))
+        else:
+            start = int(value_range)
+            end = high if step > 1 else start
+        if step < 1 or start < low or end > high or start > end:
+            raise ValueError(f"Invalid cron field: {expr}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronExpression:
+    def __init__(self, expr):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expr}")
+        self.expr = expr
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            parse_cron_field(part, low, high) for part, (_, low, high) in zip(parts, CRON_FIELDS))
+        if 7 in self.weekdays:
+            # 요일 7 = 일요일(0)
+            self.weekdays = (self.weekdays - {7}) | {0}
+        self.any_day = parts[2] == '*'
+        self.any_weekday = parts[4] == '*'
+
+    def matches_day(self, day):
+        day_match = day.day in self.days
+        weekday_match = (day.weekday() + 1) % 7 in self.weekdays
+        # 일/요일이 둘 다 지정되면 둘 중 하나만 맞아도 실행 (표준 cron 규칙)
+        if not self.any_day and not self.any_weekday:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def next_after(self, local):
+        """local 이후 첫 실행 시각 (분 단위, tzinfo 없는 datetime)"""
+        t = local.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+        while t < limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self.matches_day(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f"Cron expression never fires: {self.expr}")
+
+
+class CronTrigger:
+    """여러 cron 식 중 가장 빠른 시각. clock=MARKET_CLOCK이면 뉴욕 시간 기준"""
+
+    def __init__(self, *expressions, clock=LOCAL_CLOCK):
+        if not expressions:
+            raise ValueError("At least one cron expression is required")
+        self.expressions = [CronExpression(expr) for expr in expressions]
+        self.clock = clock
+
+    def next_time(self, after):
+        candidates = []
+        for expr in self.expressions:
+            local = expr.next_after(self.clock.to_local(after))
+            ts = self.clock.to_ts(local)
+            while ts <= after:  # 서머타임 해제로 같은 시각이 반복되는 경우
+                local = expr.next_after(local)
+                ts = self.clock.to_ts(local)
+            candidates.append(ts)
+        return min(candidates)
+
+    def __repr__(self):
+        return "cron " + " | ".join(expr.expr for expr in self.expressions)
+
+
+class MarketHoursTrigger:
+    """
+    regular / extended(프리·애프터) / closed 구간별 실행 간격(초). None이면 그 구간에는 실행하지 않고
+    다음 구간이 시작될 때 실행
+    """
+
+    def __init__(self, regular, extended=None, closed=None):
+        self.intervals = {'regular': regular, 'pre': extended, 'post': extended, 'closed': closed}
+
+    def next_time(self, after):
+        session, end = market_session(after)
+        interval = self.intervals[session]
+        if interval is not None:
+            # 구간 경계(예: 09:30 개장)를 넘기지 않음 -> 경계 시각에 바로 실행
+            return min(after + interval, end)
+        for _ in range(32):
+            session, next_end = market_session(end)
+            if self.intervals[session] is not None:
+                return end
+            end = next_end
+        raise ValueError("MarketHoursTrigger never fires")
+
+    def __repr__(self):
+        i = self.intervals
+        return f"market hours (regular={i['regular']}, extended={i['pre']}, closed={i['closed']})"
+
+
+# ----------------------------------------------------------------------
+# Scheduler
+# ----------------------------------------------------------------------
+def _fmt(ts):
+    return datetime.fromtimestamp(ts).strftime('%m-%d %H:%M:%S')
+
+
+class ScheduledJob:
+    """
+    catch_up: 놓친 실행이 이 시간(초) 이내면 즉시 한 번 실행 (여러 번 놓쳐도 한 번으로 합침), 0이면 건너뜀
+    run_at_start: 이전 실행 기록이 없을 때 시작하자마자 한 번 실행
+    min_backoff: 지정하면 실패한 작업을 다음 예정 시각 대신 지수 백오프(+ 지터) 후 재시도 (최대 max_backoff)
+    """
+
+    def __init__(self, name, func, trigger, catch_up=0, run_at_start=False, min_backoff=None, max_backoff=600):
+        self.name = name
+        self.func = func
+        self.trigger = trigger
+        self.catch_up = catch_up
+        self.run_at_start = run_at_start
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.next_run = None
+        self.last_run = None
+        self.running = False
+        self.failures = 0   # 연속 실패 횟수
+
+    def backoff(self):
+        """연속 실패 횟수 기준 지수 백오프 + 지터 (여러 작업이 동시에 재시도하지 않도록)"""
+        delay = min(self.max_backoff, self.min_backoff * (2 ** (self.failures - 1)))
+        return delay + random.uniform(0, delay / 2)
+
+    def plan(self, now, last_run=None):
+        """시작 시 첫 실행 시각 결정 (last_run: 이전 실행 기록)"""
+        self.last_run = last_run
+        if last_run is None:
+            self.next_run = now if self.run_at_start else self.trigger.next_time(now)
+        else:
+            self.next_run = self._catch_up(self.trigger.next_time(last_run), now)
+        return self.next_run
+
+    def reschedule(self, scheduled, now):
+        """실행이 끝난 뒤 다음 실행 시각 (예정 시각 기준 -> 실행 시간만큼 밀리지 않음)"""
+        self.last_run = scheduled
+        self.next_run = self._catch_up(self.trigger.next_time(scheduled), now)
+        return self.next_run
+
+    def _catch_up(self, missed, now):
+        if missed > now:
+            return missed
+        if self.catch_up and now - missed <= self.catch_up:
+            print(f"[CATCH-UP] {self.name}: missed run at {_fmt(missed)}. Running now.")
+            return now
+        return self.trigger.next_time(now)
+
+
+class Scheduler:
+    """
+    run_forever(): 등록 순서대로 한 스레드에서 순차 실행 (셀레니움처럼 동시에 돌면 안 되는 작업용)
+    run_async(): 작업마다 asyncio.to_thread로 동시 실행 (같은 작업은 겹치지 않음, engine_start.py가 사용)
+    state_path: 작업별 마지막 실행 시각 저장 -> 재시작 후에도 놓친 실행 catch-up
+    """
+
+    def __init__(self, state_path=None, max_sleep=60):
+        self.jobs = []
+        self.state_path = state_path
+        self.max_sleep = max_sleep     # 시스템 절전/시계 변경에 대비해 최대 이만큼씩 나눠서 대기
+
+    def add(self, name, func, trigger, catch_up=0, run_at_start=False, min_backoff=None, max_backoff=600):
+        job = ScheduledJob(name, func, trigger, catch_up=catch_up, run_at_start=run_at_start,
+                           min_backoff=min_backoff, max_backoff=max_backoff)
+        self.jobs.append(job)
+        return job
+
+    def _load_state(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Failed to load scheduler state ({e}).")
+            return {}
+
+    def _save_state(self):
+        if not self.state_path:
+            return
+        directory = os.path.dirname(self.state_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.scheduler-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({job.name: job.last_run for job in self.jobs if job.last_run is not None}, f)
+            os.replace(tmp_path, self.state_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def start(self):
+        now = time.time()
+        state = self._load_state()
+        for job in self.jobs:
+            job.plan(now, state.get(job.name))
+            print(f"[INFO] Scheduled {job.name} ({job.trigger}). Next run: {_fmt(job.next_run)}")
+
+    def _record(self, job, scheduled):
+        job.running = False
+        job.last_run = scheduled
+        self._save_state()
+
+    def _call(self, job):
+        """작업 1회 실행 (예외는 기록 후 삼킴 -> 다른 작업은 계속). Returns: 성공 여부"""
+        metrics = get_metrics()
+        started = time.perf_counter()
+        ok = False
+        try:
+            job.func()
+            ok = True
+        except Exception as e:
+            job.failures += 1
+            print(f"[ERROR] {job.name} failed ({type(e).__name__}: {e}). Consecutive failures: {job.failures}")
+            metrics.inc('job_failures_total', job=job.name, error=type(e).__name__)
+        finally:
+            if ok:
+                job.failures = 0
+            metrics.observe('job_seconds', time.perf_counter() - started, job=job.name)
+            metrics.inc('job_runs_total', job=job.name, result='ok' if ok else 'error')
+            metrics.set_gauge('job_consecutive_failures', job.failures, job=job.name)
+            # 작업 회차마다 지표 파일 갱신 (대시보드 / textfile collector가 최신 값을 읽음)
+            metrics.flush()
+        return ok
+
+    def _retry(self, job, now):
+        """실패한 작업은 (min_backoff가 있으면) 예정 시각 대신 백오프 후 재시도"""
+        if job.failures and job.min_backoff:
+            delay = job.backoff()
+            job.next_run = now + delay
+            print(f"[INFO] Retrying {job.name} in {round(delay, 1)}s")
+
+    def seconds_until_next(self):
+        return max(0.0, min(job.next_run for job in self.jobs) - time.time())
+
+    def run_pending(self):
+        """지금 실행할 작업을 순차 실행. Returns: 다음 실행까지 남은 초"""
+        for job in self.jobs:
+            if job.next_run <= time.time():
+                scheduled = job.next_run
+                self._call(job)
+                job.reschedule(scheduled, time.time())
+                self._retry(job, time.time())
+                self._save_state()
+        return self.seconds_until_next()
+
+    def run_forever(self):
+        self.start()
+        while True:
+            time.sleep(min(self.max_sleep, self.run_pending()))
+
+    async def _run_job(self, job, scheduled):
+        import asyncio
+        try:
+            await asyncio.to_thread(self._call, job)
+            self._retry(job, time.time())
+        finally:
+            self._record(job, scheduled)
+
+    async def run_async(self, stop_event=None):
+        import asyncio  # 순차 실행(run_forever)만 쓰는 진입점은 asyncio를 로드하지 않음
+        self.start()
+        stop_event = stop_event or asyncio.Event()
+        tasks = set()
+        while not stop_event.is_set():
+            now = time.time()
+            for job in self.jobs:
+                if job.next_run > now:
+                    continue
+                scheduled = job.next_run
+                job.next_run = job.trigger.next_time(max(scheduled, now))
+                if job.running:
+                    # 이전 회차가 아직 실행 중 -> 이번 회차는 건너뜀
+                    print(f"[WARN] {job.name} is still running. Skipping run at {_fmt(scheduled)}")
+                    continue
+                job.running = True
+                task = asyncio.create_task(self._run_job(job, scheduled))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=max(0.05, min(self.max_sleep, self.seconds_until_next())))
+            except asyncio.TimeoutError:
+                pass
+        if tasks:
+            await asyncio.gather(*tasks)
@@ -0,0 +1,135 @@
+"""
+Alpha Signal Change Detection + Delta Log
+- 시그널 식별자: "티커:전략:시그널이 처음 발생한 봉 날짜" (같은 전략이 이어지는 동안 id 유지)
+- 이전 스냅샷(alpha-signals.json)과 비교해 new / changed / expired 이벤트만 추출
+  changed = 시그널을 정의하는 필드(SIGNAL_FIELDS)가 바뀐 경우만 (시세/문구만 바뀐 경우는 이벤트 없음)
+  목표가/손절가는 시그널이 발생한 시점 값으로 고정 (방향이 바뀌면 다시 계산)
+- 이벤트는 seq 번호를 붙여 append-only JSONL(alpha-signals-delta.jsonl)에 추가
+  -> 클라이언트/숏폼 봇은 마지막으로 본 seq 이후 줄만 읽으면 됨 (전체 파일 재비교 불필요)
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+
+
+def signal_id(ticker, strategy_slug, bar_ts):
+    bar_date = datetime.fromtimestamp(int(bar_ts), timezone.utc).strftime('%Y-%m-%d')
+    return f"{ticker}:{strategy_slug}:{bar_date}"
+
+
+# 시그널을 정의하는 필드 (price / change_pct / 설명 문구는 제외)
+SIGNAL_FIELDS = ('strategy', 'sentiment', 'target_price', 'stop_loss')
+LEVEL_FIELDS = ('target_price', 'stop_loss', 'action_plan')   # action_plan 문구에 목표가/손절가 포함
+
+
+def signal_fields(signal):
+    return tuple(signal.get(name) for name in SIGNAL_FIELDS)
+
+
+def signal_key(signal):
+    """같은 시그널인지 판단하는 기준 (티커 + 전략)"""
+    return signal['ticker'], signal['strategy']
+
+
+def _id_prefix(value):
+    """'티커:전략:날짜' -> '티커:전략'"""
+    return str(value).rsplit(':', 1)[0]
+
+
+def diff_signals(previous, current):
+    """
+    previous / current: 시그널 목록
+    - 이전에도 같은 (티커, 전략)이 있으면 이전 id를 이어받음 (발생 봉 기준 id 유지)
+    Returns: (id가 정리된 current, 이벤트 목록 [(type, signal), ...])
+    """
+    previous_by_key = {signal_key(signal): signal for signal in previous}
+    current_keys = set()
+    stable = []
+    events = []
+    for signal in current:
+        key = signal_key(signal)
+        current_keys.add(key)
+        old = previous_by_key.get(key)
+        if old is None:
+            events.append(('new', signal))
+        else:
+            if _id_prefix(old['id']) == _id_prefix(signal['id']):
+                # 이전 형식 id(티커-타임스탬프)는 이어받지 않음
+                signal = {**signal, 'id': old['id']}
+                if signal.get('sentiment') == old.get('sentiment'):
+                    signal.update({name: old[name] for name in LEVEL_FIELDS if name in old})
+            if signal['id'] != old['id'] or signal_fields(signal) != signal_fields(old):
+                events.append(('changed', signal))
+        stable.append(signal)
+
+    for key, old in previous_by_key.items():
+        if key not in current_keys:
+            events.append(('expired', old))
+    return stable, events
+
+
+class SignalDeltaLog:
+    def __init__(self, path, max_lines=5000):
+        self.path = path
+        self.max_lines = max_lines   # 넘으면 오래된 줄부터 정리 (seq는 계속 증가)
+        self.seq, self.lines = self._load_tail()
+
+    def _load_tail(self):
+        if not os.path.exists(self.path):
+            return 0, 0
+        seq = 0
+        lines = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    lines += 1
+                    try:
+                        seq = max(seq, int(json.loads(line).get('seq', 0)))
+                    except (ValueError, AttributeError):
+                        continue
+        except OSError as e:
+            print(f"[WARN] Failed to read signal delta log ({e}).")
+        return seq, lines
+
+    def append(self, events):
+        """이벤트를 seq 순서대로 추가. Returns: 추가된 레코드 목록"""
+        if not events:
+            return []
+        emitted_at = datetime.now(timezone.utc).isoformat()
+        records = []
+        for event_type, signal in events:
+            self.seq += 1
+            record = {'seq': self.seq, 'type': event_type, 'id': signal['id'], 'ticker': signal['ticker'],
+                      'emitted_at': emitted_at}
+            if event_type != 'expired':
+                record['signal'] = signal
+            records.append(record)
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.lines += len(records)
+        if self.lines > self.max_lines:
+            self._compact()
+        return records
+
+    def _compact(self):
+        """마지막 max_lines 줄만 남기고 원자적으로 교체"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            kept = [line for line in f if line.strip()][-self.max_lines:]
+        directory = os.path.dirname(self.path)
+        fd, tmp_path = tempfile.mkstemp(prefix='.alpha-delta-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.writelines(kept)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.lines = len(kept)
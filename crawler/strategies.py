@@ -0,0 +1,275 @@
+"""
+Pluggable Alpha Strategies
+- 모든 전략은 indicators.py가 한 번 계산한 공용 피처 프레임(compute_indicators / IndicatorState.snapshot)만 사용
+  -> 전략마다 지표를 따로 계산하지 않음
+- condition(): 피처 행렬(날짜 x 티커, DataFrame 또는 ndarray) -> bool 행렬. 1x1 배열을 넣으면 한 종목 한 봉 평가
+- 우선순위 = 등록 순서 (앞쪽 전략이 먼저 매칭, 아무것도 아니면 중립)
+- 목표가/손절가: ATR14 배수, ATR이 없으면 고정 비율
+- 새 전략 추가: Strategy 상속 후 register_strategy(...)
+"""
+
+import numpy as np
+
+try:
+    from crawler.indicators import FEATURES
+except ImportError:
+    from indicators import FEATURES
+
+# 전략 코드 (출력/백테스트/상태 비교에 쓰이는 고정 번호)
+STRATEGY_NEUTRAL = 0
+STRATEGY_RSI_REBOUND = 1
+STRATEGY_GOLDEN_CROSS = 2
+STRATEGY_SHARP_DROP = 3
+STRATEGY_VOLUME_SPIKE = 4
+STRATEGY_VALUE_GROWTH = 5
+
+RSI_OVERSOLD = 35
+SHARP_DROP_PCT = -3.0
+VOLUME_SPIKE_Z = 2.5
+
+
+def unit(value):
+    """0~1로 자르기 (NaN -> 0)"""
+    value = float(value)
+    return 0.0 if value != value else min(1.0, max(0.0, value))
+
+
+class Strategy:
+    code = STRATEGY_NEUTRAL
+    slug = "neutral"      # 시그널 id에 쓰이는 고정 식별자
+    name = ""
+    score_range = (60, 85)
+    # 목표가/손절가 = 현재가 ± ATR 배수 (ATR 없으면 기존 고정 비율: 매수 +15%/-8%, 매도 -8%/+5%)
+    target_atr = 3.0
+    stop_atr = 1.5
+    fixed_pct = {"BULLISH": (0.15, 0.08), "BEARISH": (0.08, 0.05)}
+
+    def condition(self, f):
+        """f: {피처 이름: 날짜 x 티커 DataFrame/ndarray} -> 같은 모양의 bool 행렬"""
+        raise NotImplementedError
+
+    def sentiment(self, row):
+        return "BULLISH"
+
+    def direction(self, f):
+        """sentiment()의 벡터 버전 (+1 매수 / -1 매도, 백테스트용)"""
+        return np.ones(f['close'].shape)
+
+    def strength(self, row):
+        """전략 강도 0~1 (impact_score 계산용)"""
+        return 0.0
+
+    def reason(self, row):
+        return ""
+
+    def score(self, row):
+        """
+        피처 기반 결정적 점수 (같은 봉 데이터 -> 항상 같은 점수)
+        - 전략 강도 (70%) + 거래량 z-score (30%, 평소보다 거래가 몰릴수록 가산)
+        """
+        low, high = self.score_range
+        return int(round(low + (high - low) * (0.7 * unit(self.strength(row)) + 0.3 * unit(row['volume_z'] / 3))))
+
+    def moves(self, price, atr, bullish):
+        """(목표까지 이동폭, 손절까지 이동폭) - 스칼라/배열 모두 가능"""
+        bull_target, bull_stop = self.fixed_pct["BULLISH"]
+        bear_target, bear_stop = self.fixed_pct["BEARISH"]
+        has_atr = np.nan_to_num(atr) > 0
+        target = np.where(has_atr, atr * self.target_atr, price * np.where(bullish, bull_target, bear_target))
+        stop = np.where(has_atr, atr * self.stop_atr, price * np.where(bullish, bull_stop, bear_stop))
+        return target, stop
+
+    def levels(self, row, sentiment):
+        """(목표가, 손절가) - BEARISH만 하락 방향, BULLISH / NEUTRAL은 상승 방향"""
+        price = float(row['close'])
+        bullish = sentiment != "BEARISH"
+        target_move, stop_move = (float(move) for move in self.moves(price, float(row['atr14']), bullish))
+        if bullish:
+            return price + target_move, price - stop_move
+        return max(price - target_move, 0.0), price + stop_move
+
+
+class NeutralStrategy(Strategy):
+    name = "추세 지속 (Neutral)"
+
+    def condition(self, f):
+        return np.ones(np.shape(f['close']), dtype=bool)
+
+    def sentiment(self, row):
+        # 등락률 부호를 따르면 0% 부근을 오갈 때마다 변경 이벤트/발행이 생김 -> 고정값
+        return "NEUTRAL"
+
+    def strength(self, row):
+        return abs(float(row['change_pct'])) / 3
+
+    def reason(self, row):
+        return "현재 안정적인 흐름을 유지 중이며, 큰 변동성 시그널은 포착되지 않았습니다."
+
+
+class RsiRebound(Strategy):
+    code = STRATEGY_RSI_REBOUND
+    slug = "rsi-rebound"
+    name = "RSI 반등 (Oversold)"
+    score_range = (85, 95)
+
+    def __init__(self, oversold=RSI_OVERSOLD):
+        self.oversold = oversold
+
+    def condition(self, f):
+        return f['rsi'] < self.oversold
+
+    def strength(self, row):
+        return (self.oversold - float(row['rsi'])) / 15
+
+    def reason(self, row):
+        return f"RSI 수치가 {round(float(row['rsi']), 1)}로 과매도 구간입니다. 단기 반등 확률이 매우 높습니다."
+
+
+class GoldenCross(Strategy):
+    code = STRATEGY_GOLDEN_CROSS
+    slug = "golden-cross"
+    name = "골든크로스 (Trend)"
+    score_range = (90, 98)
+
+    def condition(self, f):
+        return f['golden_cross'].astype(bool)
+
+    def strength(self, row):
+        # 5일선-20일선 이격 2%면 최대
+        return (float(row['sma5']) / float(row['sma20']) - 1) * 100 / 2
+
+    def reason(self, row):
+        return "5일 이동평균선이 20일선을 돌파하며 강력한 상승 추세로 진입했습니다."
+
+
+class SharpDrop(Strategy):
+    code = STRATEGY_SHARP_DROP
+    slug = "sharp-drop"
+    name = "낙폭 과대 (Risk)"
+    score_range = (92, 97)
+    target_atr = 2.0
+    stop_atr = 1.0
+
+    def __init__(self, threshold=SHARP_DROP_PCT):
+        self.threshold = threshold
+
+    def condition(self, f):
+        return f['change_pct'] < self.threshold
+
+    def sentiment(self, row):
+        return "BEARISH"
+
+    def direction(self, f):
+        return -np.ones(f['close'].shape)
+
+    def strength(self, row):
+        return (self.threshold - float(row['change_pct'])) / 7
+
+    def reason(self, row):
+        return "단기 급락으로 인해 추가 하락 리스크가 존재합니다. 지지선 확인이 필요합니다."
+
+
+class VolumeSpike(Strategy):
+    """거래량이 최근 20봉 평균 대비 z-score 기준 이상 급증 (방향은 당일 등락)"""
+    code = STRATEGY_VOLUME_SPIKE
+    slug = "volume-spike"
+    name = "거래량 급증 (Volume Spike)"
+    score_range = (80, 94)
+    target_atr = 2.5
+    stop_atr = 1.25
+
+    def __init__(self, min_z=VOLUME_SPIKE_Z):
+        self.min_z = min_z
+
+    def condition(self, f):
+        return f['volume_z'] >= self.min_z
+
+    def sentiment(self, row):
+        return "BULLISH" if row['change_pct'] >= 0 else "BEARISH"
+
+    def direction(self, f):
+        return np.where(f['change_pct'].to_numpy() >= 0, 1.0, -1.0)
+
+    def strength(self, row):
+        return (float(row['volume_z']) - self.min_z) / 3
+
+    def score(self, row):
+        # 거래량 자체가 시그널이므로 강도 = 거래량 z-score + 가격 변동 폭
+        low, high = self.score_range
+        move = abs(float(row['change_pct'])) / 5
+        return int(round(low + (high - low) * (0.6 * unit(self.strength(row)) + 0.4 * unit(move))))
+
+    def reason(self, row):
+        return (f"거래량이 최근 20일 평균 대비 {round(float(row['volume_z']), 1)} 표준편차 급증했습니다. "
+                f"{'매수' if row['change_pct'] >= 0 else '매도'} 수급 유입을 주시하세요.")
+
+
+class ValueGrowth(Strategy):
+    """장기 상승 추세(50일선 > 200일선, 종가 > 200일선) 안에서 20일선 아래로 눌림"""
+    code = STRATEGY_VALUE_GROWTH
+    slug = "value-growth"
+    name = "가치 성장 (Value Growth)"
+    score_range = (75, 90)
+    target_atr = 4.0
+    stop_atr = 2.0
+
+    def condition(self, f):
+        return (f['sma50'] > f['sma200']) & (f['close'] > f['sma200']) & (f['close'] < f['sma20'])
+
+    def strength(self, row):
+        # 장기 추세 강도(50일선/200일선 이격 10%면 최대)와 눌림 깊이(20일선 대비 5%면 최대)
+        trend = (float(row['sma50']) / float(row['sma200']) - 1) * 10
+        pullback = (1 - float(row['close']) / float(row['sma20'])) * 20
+        return (unit(trend) + unit(pullback)) / 2
+
+    def reason(self, row):
+        return "장기 상승 추세(50일선 > 200일선)가 유지되는 가운데 단기 조정으로 20일선 아래에서 매수 기회가 열렸습니다."
+
+
+NEUTRAL = NeutralStrategy()
+STRATEGIES = []
+
+
+def register_strategy(strategy):
+    STRATEGIES.append(strategy)
+    return strategy
+
+
+def default_strategies(rsi_oversold=RSI_OVERSOLD, sharp_drop_pct=SHARP_DROP_PCT, volume_spike_z=VOLUME_SPIKE_Z):
+    """우선순위 순서의 기본 전략 목록 (임계값은 백테스트에서 조정 가능)"""
+    return [RsiRebound(rsi_oversold), GoldenCross(), SharpDrop(sharp_drop_pct), VolumeSpike(volume_spike_z),
+            ValueGrowth()]
+
+
+for _strategy in default_strategies():
+    register_strategy(_strategy)
+
+
+def get_strategy(code, strategies=None):
+    for strategy in strategies or STRATEGIES:
+        if strategy.code == code:
+            return strategy
+    return NEUTRAL
+
+
+def select_codes(features, strategies=None):
+    """전략 코드 ndarray (등록 순서 = 우선순위)"""
+    strategies = strategies or STRATEGIES
+    return np.select(
+        [np.asarray(strategy.condition(features), dtype=bool) for strategy in strategies],
+        [strategy.code for strategy in strategies],
+        default=STRATEGY_NEUTRAL,
+    )
+
+
+def decide(features, strategies=None):
+    """모든 날짜 x 티커에 대해 전략 코드를 계산 -> 피처 행렬과 같은 인덱스의 DataFrame"""
+    import pandas as pd
+    close = features['close']
+    return pd.DataFrame(select_codes(features, strategies), index=close.index, columns=close.columns)
+
+
+def decide_row(row, strategies=None):
+    """피처 dict 한 줄(IndicatorState.snapshot) -> 전략 코드 (같은 condition을 1x1 배열로 평가, pandas 불필요)"""
+    features = {name: np.array([[row[name]]], dtype='float64') for name in FEATURES}
+    return int(select_codes(features, strategies)[0, 0])
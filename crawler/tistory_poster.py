@@ -11,6 +11,13 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
+import json
+from datetime import datetime
+
+try:
+    from crawler.http_client import get_client
+except ImportError:
+    from http_client import get_client
 
 # Force UTF-8 encoding for stdout/stderr to avoid CP949 errors on Windows
 if sys.platform == "win32":
@@ -753,6 +760,25 @@ class TistoryAutoPoster:
             self.driver.quit()
 
 
+HISTORY_FILE = "posted_news_history.json"
+
+def load_history():
+    if os.path.exists(HISTORY_FILE):
+        try:
+            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except:
+            return []
+    return []
+
+def save_history(history):
+    try:
+        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
+            json.dump(history[-300:], f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"[ERROR] Failed to save history: {e}")
+
+
 def process_news_batch():
     """뉴스 크롤링 및 포스팅 배치 작업 실행"""
     print(f"\n[INFO] 배치 작업 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -763,7 +789,7 @@ def process_news_batch():
     # 2. 서버에서 뉴스 가져오기
     try:
         print("[INFO] 서버에서 뉴스 데이터 확인 중...")
-        res = requests.get("https://stock-empire.vercel.app/us-news-realtime.json", timeout=15)
+        res = get_client().get("https://stock-empire.vercel.app/us-news-realtime.json", timeout=15)
         if res.status_code != 200:
             print(f"[WARN] 서버 응답 오류 ({res.status_code}), 다음 주기에 재시도합니다.")
             return
@@ -949,136 +975,80 @@ def process_news_batch():
 
 
 if __name__ == "__main__":
-    import requests
-    import json
-    from datetime import datetime
-    import time
     import random
+    try:
+        from crawler.scheduler import Scheduler, CronTrigger
+        from crawler.kv_cache import CACHE_DIR
+    except ImportError:
+        from scheduler import Scheduler, CronTrigger
+        from kv_cache import CACHE_DIR
     
-    HISTORY_FILE = "posted_news_history.json"
-    
-    def load_history():
-        if os.path.exists(HISTORY_FILE):
-            try:
-                with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except:
-                return []
-        return []
 
-    def save_history(history):
+    # --- 스케줄 설정 (24시간 형식, 로컬 시간) ---
+    SCHEDULE_TIMES = ["23:00", "03:30", "07:00", "12:00", "17:00"]
+
+    def scan_urgent_news():
+        """긴급 지표/속보 체크 (5분마다)"""
+        current_time_str = datetime.now().strftime("%H:%M")
+        print(f"[MONITOR] {current_time_str} - 긴급 이슈 스캔 중...", end='\r')
         try:
-            with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-                json.dump(history[-300:], f, ensure_ascii=False, indent=2)
+            res = get_client().get("https://stock-empire.vercel.app/us-news-realtime.json", timeout=10)
+            if res.status_code == 200:
+                news_list = res.json()
+                history = load_history()
+                
+                urgent_news = []
+                for news in news_list:
+                    # 이미 처리한 뉴스는 패스
+                    if (news.get('link') or news.get('title')) in history:
+                        continue
+                        
+                    # 긴급 조건 확인 (breaking or indicator)
+                    is_breaking = news.get('is_breaking', False)
+                    is_indicator = False
+                    
+                    # vip_tier 내부의 is_indicator 체크
+                    vip_data = news.get('vip_tier', {})
+                    if vip_data and isinstance(vip_data, dict):
+                        ai_data = vip_data.get('ai_analysis', {})
+                        if ai_data and isinstance(ai_data, dict):
+                             if ai_data.get('is_indicator', False):
+                                 is_indicator = True
+                    
+                    if is_breaking or is_indicator:
+                        urgent_news.append(news)
+                
+                if urgent_news:
+                    print(f"\n[URGENT] 🚨 긴급 특보 {len(urgent_news)}건 감지! 즉시 포스팅합니다.")
+                    process_news_batch() # 배치 실행
+                    print(f"[WAIT] 긴급 처리 완료. 다시 모니터링 모드로 복귀합니다.\n")
         except Exception as e:
-            print(f"[ERROR] Failed to save history: {e}")
+            print(f"[WARN] 모니터링 중 네트워크 오류 (무시됨): {e}")
 
+    def run_briefing():
+        print(f"\n[SCHEDULE] ⏰ 정기 브리핑 시간입니다 ({datetime.now().strftime('%H:%M')}). 작업을 시작합니다.")
+        process_news_batch()
+        print(f"[DONE] 브리핑 완료. 다음 스케줄을 기다립니다.\n")
 
-    # --- 스케줄 설정 (24시간 형식) ---
-    SCHEDULE_TIMES = ["23:00", "03:30", "07:00", "12:00", "17:00"]
-    
-    # 마지막 실행 기록 (중복 실행 방지)
-    last_run_date = None
-    last_run_time_slot = None
+    # 한 스레드에서 순차 실행 (브라우저 작업이 겹치지 않음)
+    # 정기 브리핑은 PC가 꺼져 있었거나 늦어져도 30분 이내면 한 번 실행 (catch-up, 재시작 후에도 유지)
+    scheduler = Scheduler(state_path=os.path.join(CACHE_DIR, 'scheduler_tistory.json'))
+    scheduler.add("Tistory briefing", run_briefing,
+                  CronTrigger(*(f"{int(t[3:])} {int(t[:2])} * * *" for t in SCHEDULE_TIMES)), catch_up=1800)
+    scheduler.add("Urgent news scan", scan_urgent_news, CronTrigger("*/5 * * * *"))
 
     print("\n" + "="*60)
     print("   Stock Empire 인텔리전스 스케줄러 (Smart Mode)   ")
     print("   - 정기 브리핑: 23:00, 03:30, 07:00, 12:00, 17:00   ")
     print("   - 긴급 특보: 주요 지표/속보 발생 시 즉시 가동      ")
-    print("   - 상태: 1분 단위로 모니터링 중... (Ctrl+C로 중단)  ")
+    print("   - 상태: 5분 단위로 모니터링 중... (Ctrl+C로 중단)  ")
     print("="*60 + "\n")
 
     print("[START] 시작과 동시에 최신 뉴스 유무를 먼저 확인합니다...")
     process_news_batch()
     print("\n[INFO] 초기 점검 완료. 실시간 모니터링 체제로 전환합니다.\n")
 
-    while True:
-        try:
-            now = datetime.now()
-            current_time_str = now.strftime("%H:%M")
-            current_date_str = now.strftime("%Y-%m-%d")
-            
-            # --- 1. 긴급 지표/속보 체크 (우선순위 최상) ---
-            # 5분마다 한 번씩만 체크 (너무 잦은 요청 방지)
-            if now.minute % 5 == 0:
-                print(f"[MONITOR] {current_time_str} - 긴급 이슈 스캔 중...", end='\r')
-                try:
-                    res = requests.get("https://stock-empire.vercel.app/us-news-realtime.json", timeout=10)
-                    if res.status_code == 200:
-                        news_list = res.json()
-                        history = load_history()
-                        
-                        urgent_news = []
-                        for news in news_list:
-                            # 이미 처리한 뉴스는 패스
-                            if (news.get('link') or news.get('title')) in history:
-                                continue
-                                
-                            # 긴급 조건 확인 (breaking or indicator)
-                            is_breaking = news.get('is_breaking', False)
-                            is_indicator = False
-                            
-                            # vip_tier 내부의 is_indicator 체크
-                            vip_data = news.get('vip_tier', {})
-                            if vip_data and isinstance(vip_data, dict):
-                                ai_data = vip_data.get('ai_analysis', {})
-                                if ai_data and isinstance(ai_data, dict):
-                                     if ai_data.get('is_indicator', False):
-                                         is_indicator = True
-                            
-                            if is_breaking or is_indicator:
-                                urgent_news.append(news)
-                        
-                        if urgent_news:
-                            print(f"\n[URGENT] 🚨 긴급 특보 {len(urgent_news)}건 감지! 즉시 포스팅합니다.")
-                            process_news_batch() # 배치 실행
-                            print(f"[WAIT] 긴급 처리 완료. 다시 모니터링 모드로 복귀합니다.\n")
-                except Exception as e:
-                    print(f"[WARN] 모니터링 중 네트워크 오류 (무시됨): {e}")
-
-
-            # --- 2. 정기 스케줄 체크 (유연한 Catch-up 로직) ---
-            is_schedule_time = False
-            target_slot = None
-            
-            for t_str in SCHEDULE_TIMES:
-                # 스케줄 시간 파싱 (오늘 날짜 기준)
-                sch_hour, sch_minute = map(int, t_str.split(":"))
-                sch_time = now.replace(hour=sch_hour, minute=sch_minute, second=0, microsecond=0)
-                
-                # 만약 스케줄 시간이 미래라면 패스 (아직 때가 아님)
-                if sch_time > now:
-                    continue
-                    
-                # 만약 스케줄 시간이 과거라면, 30분 이내인지 확인 (유효 시간)
-                time_diff = now - sch_time
-                if time_diff.total_seconds() >= 0 and time_diff.total_seconds() < 1800: # 30분(1800초) 이내
-                    # 오늘, 이 시간대에 이미 실행했는지 체크
-                    if last_run_date == current_date_str and last_run_time_slot == t_str:
-                        continue # 이미 함
-                    
-                    is_schedule_time = True
-                    target_slot = t_str
-                    print(f"[CATCH-UP] 늦었지만 '{t_str}' 스케줄을 지금 실행합니다!")
-                    break
-            
-            if is_schedule_time:
-                print(f"\n[SCHEDULE] ⏰ 정기 브리핑 시간입니다 ({target_slot}). 작업을 시작합니다.")
-                process_news_batch()
-                
-                # 실행 기록 업데이트
-                last_run_date = current_date_str
-                last_run_time_slot = target_slot
-                print(f"[DONE] {target_slot} 브리핑 완료. 다음 스케줄을 기다립니다.\n")
-            
-            # CPU부하 방지를 위한 1분 대기
-            # 매분 00초에 맞추기 위해 조금 더 스마트하게 대기
-            time.sleep(60 - datetime.now().second) 
-                
-        except KeyboardInterrupt:
-            print("\n[STOP] 사용자에 의해 작업이 중단되었습니다.")
-            break
-        except Exception as e:
-            print(f"\n[ERROR] 스케줄러 오류: {e}")
-            time.sleep(60)
-
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        print("\n[STOP] 사용자에 의해 작업이 중단되었습니다.")
@@ -0,0 +1,70 @@
+"""
+Persistent Translation Cache
+- GoogleTranslator 앞단에 위치: 이미 번역한 문장은 디스크 캐시에서 즉시 반환
+- 키: (source, target, 원문) sha1 해시 -> 새 문장만 실제 번역 요청
+- LazyGoogleTranslator: deep_translator(requests/bs4 포함)는 첫 캐시 미스 때 로드
+"""
+
+import hashlib
+import os
+import threading
+
+try:
+    from crawler.kv_cache import SqliteCache, CACHE_DIR
+    from crawler.metrics import get_metrics
+except ImportError:
+    from kv_cache import SqliteCache, CACHE_DIR
+    from metrics import get_metrics
+
+
+class LazyGoogleTranslator:
+    """GoogleTranslator와 같은 translate() 인터페이스, 실제 객체는 처음 번역할 때 생성"""
+
+    def __init__(self, source='auto', target='ko'):
+        self.source = source
+        self.target = target
+        self._translator = None
+        self._lock = threading.Lock()
+
+    def translate(self, text):
+        if self._translator is None:
+            with self._lock:
+                if self._translator is None:
+                    from deep_translator import GoogleTranslator
+                    self._translator = GoogleTranslator(source=self.source, target=self.target)
+        return self._translator.translate(text)
+
+
+class CachedTranslator:
+    """translator.translate(text) 와 같은 인터페이스를 제공하는 캐시 래퍼"""
+
+    def __init__(self, translator, cache=None, source='auto', target='ko', rate_limiter=None):
+        self.translator = translator
+        # 실제 번역 요청(캐시 미스)에만 적용되는 속도 제한 (TokenBucket)
+        self.rate_limiter = rate_limiter
+        self.source = source
+        self.target = target
+        self.cache = cache if cache is not None else SqliteCache(
+            os.path.join(CACHE_DIR, 'translations.sqlite3'),
+            ttl=30 * 24 * 3600,     # 30일
+            max_entries=20000,
+        )
+
+    def _key(self, text):
+        return hashlib.sha1(f"{self.source}>{self.target}:{text}".encode('utf-8')).hexdigest()
+
+    def translate(self, text):
+        if not text or not text.strip():
+            return text
+        key = self._key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        with get_metrics().timer('translation_seconds', target=self.target):
+            translated = self.translator.translate(text)
+        get_metrics().inc('translation_chars_total', len(text), target=self.target)
+        if translated:
+            self.cache.set(key, translated)
+        return translated
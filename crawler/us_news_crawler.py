@@ -1,23 +1,101 @@
 """
 US Stock News Crawler (Live & Translated)
-- Source: Yahoo Finance RSS, Investing.com
-- Feature: Korean Translation, Breaking News Detection, 30-min Interval
+- Source: Pluggable registry (news_sources.py) - Yahoo Finance RSS, Investing.com
+- Feature: Korean Translation, Breaking News Detection, Per-source Interval
 """
 
 import sys
 import io
-import requests
-from bs4 import BeautifulSoup
 import json
 import os
 import hashlib
 from datetime import datetime
 import time
 import random
-from deep_translator import GoogleTranslator
-from openai import OpenAI
+import asyncio
+import threading
 from dotenv import load_dotenv
 
+try:
+    from crawler.news_sources import SOURCE_REGISTRY, get_sources
+    from crawler.http_cache import HttpValidatorCache
+    from crawler.translation_cache import CachedTranslator, LazyGoogleTranslator
+    from crawler.kv_cache import SqliteCache, CACHE_DIR
+    from crawler.rate_limit import TokenBucket
+    from crawler.pipeline import Stage, run_stages
+    from crawler.dedupe import NearDuplicateIndex
+    from crawler.news_store import RollingNewsStore
+    from crawler.publisher import get_publisher
+    from crawler.scheduler import Scheduler, MarketHoursTrigger
+    from crawler.metrics import get_metrics
+except ImportError:
+    from news_sources import SOURCE_REGISTRY, get_sources
+    from http_cache import HttpValidatorCache
+    from translation_cache import CachedTranslator, LazyGoogleTranslator
+    from kv_cache import SqliteCache, CACHE_DIR
+    from rate_limit import TokenBucket
+    from pipeline import Stage, run_stages
+    from dedupe import NearDuplicateIndex
+    from news_store import RollingNewsStore
+    from publisher import get_publisher
+    from scheduler import Scheduler, MarketHoursTrigger
+    from metrics import get_metrics
+
+ANALYSIS_MODEL = "gpt-4o-mini"
+
+ANALYSIS_PROMPT = """
+        Analyze this US market news for professional stock traders and retail investors. 
+        Your goal is to provide 'High Value' unique insights that aren't visible from the headline alone.
+        
+        Title: {title}
+        Excerpt: {excerpt}
+        
+        CRITICAL RULES:
+        1. Focus ONLY on things that move STOCK PRICES (Nvidia, Tesla, Apple, etc.) or macro-economic indicators (CPI, Jobs, FOMC, GDP).
+        2. If the news is low-impact, return impact_score: 0.
+        3. For economic indicators, give it a HIGH score (>85).
+        
+        Return JSON format: 
+        {{
+            "impact_score": int (0-100),
+            "summary_kr": "Sharp expert analysis in Korean (Expert Boss style).",
+            "valuable_insight": "A unique, deep financial perspective (3-4 sentences in Korean) that adds significant value beyond basic summary. Mention sector impact, future outlook, and 'Key Data Point'.",
+            "market_sentiment": "BULLISH/BEARISH/NEUTRAL",
+            "is_indicator": boolean (true if this is a macro-economic indicator announcement)
+        }}
+        """
+
+BATCH_ANALYSIS_PROMPT = """
+        Analyze each of the following {count} US market news articles for professional stock traders and retail investors.
+        Your goal is to provide 'High Value' unique insights that aren't visible from the headline alone.
+
+        Articles (JSON):
+        {articles}
+
+        CRITICAL RULES:
+        1. Focus ONLY on things that move STOCK PRICES (Nvidia, Tesla, Apple, etc.) or macro-economic indicators (CPI, Jobs, FOMC, GDP).
+        2. If the news is low-impact, return impact_score: 0.
+        3. For economic indicators, give it a HIGH score (>85).
+        4. Return exactly one result per article and copy its "id" unchanged.
+
+        Return JSON format:
+        {{
+            "results": [
+                {{
+                    "id": "article id",
+                    "impact_score": int (0-100),
+                    "summary_kr": "Sharp expert analysis in Korean (Expert Boss style).",
+                    "valuable_insight": "A unique, deep financial perspective (3-4 sentences in Korean) that adds significant value beyond basic summary. Mention sector impact, future outlook, and 'Key Data Point'.",
+                    "market_sentiment": "BULLISH/BEARISH/NEUTRAL",
+                    "is_indicator": boolean (true if this is a macro-economic indicator announcement)
+                }}
+            ]
+        }}
+        """
+
+# 프롬프트나 모델이 바뀌면 버전이 바뀌어 분석 캐시가 자동으로 무효화됨
+PROMPT_VERSION = hashlib.sha1((ANALYSIS_MODEL + ANALYSIS_PROMPT + BATCH_ANALYSIS_PROMPT).encode('utf-8')).hexdigest()[:10]
+
 # Force UTF-8 encoding for stdout/stderr to avoid CP949 errors on Windows
 if sys.platform == "win32":
     try:
@@ -50,13 +128,45 @@ def robust_load_env():
 robust_load_env()
 
 class StockNewsCrawler:
-    def __init__(self):
+    def __init__(self, publisher=None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/rss+xml, application/xml, text/xml, */*'
         }
         self.output_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'public', 'us-news-realtime.json')
-        self.translator = GoogleTranslator(source='auto', target='ko')
+        # [중복 제거] 소스가 달라도 같은 기사(유사 제목)는 번역/분석 전에 하나로 병합
+        self.dedupe_index = NearDuplicateIndex(threshold=0.5, max_items=500, max_age=6 * 3600)
+
+        # [속도 제한] 고정 sleep 대신 공급자 한도 기반 토큰 버킷 (초당 요청 수, 버스트)
+        self.translate_limiter = TokenBucket(rate=5, capacity=10)
+        self.llm_limiter = TokenBucket(rate=2, capacity=4)
+        # [파이프라인] 단계별 동시 실행 수 (fetch -> dedupe -> translate -> analyze -> assemble)
+        self.translate_concurrency = 4
+        self.analyze_concurrency = 2
+
+        # [번역 캐시] 이미 번역한 문장은 디스크 캐시에서 재사용 (새 문장만 Google 호출)
+        self.translator = CachedTranslator(LazyGoogleTranslator(source='auto', target='ko'), rate_limiter=self.translate_limiter)
+        # [분석 캐시] 기사 id + 프롬프트 버전 -> GPT 분석 결과 (저점수 필터 결과 포함)
+        self.analysis_cache = SqliteCache(
+            os.path.join(CACHE_DIR, 'analysis.sqlite3'),
+            ttl=7 * 24 * 3600,
+            max_entries=20000,
+        )
+        # [배치 분석] 한 번의 GPT 요청에 묶을 기사 수
+        self.analysis_batch_size = 8
+
+        # [소스 레지스트리] 소스별 주기/타임아웃은 news_sources.py에서 선언
+        self.sources = get_sources()
+        # [조건부 GET] ETag/Last-Modified 캐시 - 변경 없는 페이지는 파싱 생략
+        self.http_cache = HttpValidatorCache()
+        # [동시 수집] 전체 수집 마감 시간 (초)
+        self.crawl_deadline = 20
+        # [증분 저장] 기존 목록에 id 기준 병합 (개수/시간 제한 롤링 윈도우)
+        self.store = RollingNewsStore(self.output_path, max_items=100, max_age_hours=48)
+        # 재시작 직후에도 이미 저장된 기사의 다른 출처 버전을 걸러내도록 저장소 기사로 중복 인덱스를 채움
+        self._seed_dedupe_index()
+        # [GitHub 발행] 백그라운드 큐 - 크롤링 루프는 git을 기다리지 않음
+        self.publisher = publisher or get_publisher()
         
         # [중복 방지] 포스팅 기록 관리
         self.history_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tistory_history.json')
@@ -67,22 +177,44 @@ class StockNewsCrawler:
         self.last_post_date = datetime.now().date()
         
         # Environment variables are loaded in global scope
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            print("[ERROR] OPENAI_API_KEY not found in environment!")
-            self.client = None
-        else:
-            try:
-                # Direct initialization without extra parameters to avoid 'proxies' error
-                self.client = OpenAI(api_key=api_key)
-            except Exception as e:
-                print(f"[ERROR] OpenAI Client Init Failed: {e}")
-                self.client = None
-        if self.client:
+        # [지연 로드] openai SDK(import만 ~0.7s)는 첫 분석 요청 때 로드 -> self.client 참고
+        self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        self._client = None
+        self._client_lock = threading.Lock()
+        if self.openai_api_key:
             print("[INFO] OpenAI Intelligence Engine: ACTIVE")
         else:
+            print("[ERROR] OPENAI_API_KEY not found in environment!")
             print("[WARN] OpenAI Key missing. Falling back to Heuristic Reasoning.")
 
+    @property
+    def client(self):
+        """OpenAI 클라이언트 (처음 사용할 때 생성, 키가 없거나 생성 실패 시 None)"""
+        if self._client is None and self.openai_api_key:
+            with self._client_lock:
+                if self._client is None and self.openai_api_key:
+                    try:
+                        from openai import OpenAI
+                        # Direct initialization without extra parameters to avoid 'proxies' error
+                        self._client = OpenAI(api_key=self.openai_api_key)
+                    except Exception as e:
+                        print(f"[ERROR] OpenAI Client Init Failed: {e}")
+                        print("[WARN] Falling back to Heuristic Reasoning.")
+                        self.openai_api_key = None
+        return self._client
+
+    def _seed_dedupe_index(self):
+        """저장소 기사(최신순)를 오래된 것부터 수집 시각 기준으로 인덱스에 추가 (max_age가 지난 기사는 곧바로 만료)"""
+        for item in reversed(self.store.items):
+            title = (item.get('free_tier') or {}).get('title_en')
+            if not title:
+                continue
+            try:
+                added_at = datetime.fromisoformat(item.get('crawled_at') or '').timestamp()
+            except (TypeError, ValueError):
+                added_at = None
+            self.dedupe_index.add(item['id'], title, now=added_at)
+
     def _load_history(self):
         if os.path.exists(self.history_file):
             try:
@@ -96,73 +228,44 @@ class StockNewsCrawler:
         with open(self.history_file, 'w', encoding='utf-8') as f:
             json.dump(list(self.posted_ids), f)
 
-    def fetch_yahoo_finance(self, limit=10):
-        url = "https://finance.yahoo.com/news/rssindex"
-        news_items = []
+    def fetch_source(self, source, limit=10, timeout=None):
+        """
+        등록된 소스 하나를 수집하고 성공/실패에 따라 다음 폴링 시점을 갱신합니다.
+        파이프라인이 시간 초과로 포기한 요청(source.cancel)은 나중에 끝나도 백오프를 건드리지 않음
+        """
+        generation = source.generation
+        started = time.monotonic()
         try:
-            res = requests.get(url, headers=self.headers, timeout=10)
-            soup = BeautifulSoup(res.content, 'xml')
-            items = soup.find_all('item')[:limit]
-            
-            for item in items:
-                title = item.title.text
-                link = item.link.text
-                pub_date = item.pubDate.text
-                description = item.description.text if item.description else ""
-                
-                # Use stable MD5 hash for ID
-                link_hash = hashlib.md5(link.encode()).hexdigest()[:12]
-                
-                # Use stable MD5 hash for ID
-                link_hash = hashlib.md5(link.encode()).hexdigest()[:12]
-                
-                news_items.append({
-                    'id': f"yh_{link_hash}",
-                    'source': 'Yahoo Finance',
-                    'title': title,
-                    'excerpt': description,
-                    'link': link,
-                    'time': pub_date,
-                    'is_breaking': 'breaking' in title.lower() or 'urgent' in title.lower()
-                })
+            items = source.fetch(headers=self.headers, limit=limit, timeout=timeout, cache=self.http_cache)
+            if source.generation != generation:
+                print(f"[WARN] {source.name}: late result after timeout. Ignoring.")
+                return []
+            if source.skipped:
+                # 이전 요청이 아직 진행 중 -> 성공(주기 연장)도 실패(백오프)도 아님
+                return []
+            source.mark_success(now=started)
+            if source.not_modified:
+                print(f"[INFO] {source.name}: not modified since last fetch. Skipping parse.")
+            return items
         except Exception as e:
-            print(f"[ERROR] Yahoo Finance fetch failed: {e}")
-        return news_items
+            print(f"[ERROR] {source.name} fetch failed: {e}")
+            if source.generation == generation:
+                source.mark_failure()
+            return []
 
-    def fetch_investing_com(self, limit=10):
-        url = "https://www.investing.com/news/stock-market-news"
-        news_items = []
-        try:
-            res = requests.get(url, headers=self.headers, timeout=10)
-            soup = BeautifulSoup(res.content, 'html.parser')
-            articles = soup.find_all('article', class_='articleItem')[:limit]
-            
-            for article in articles:
-                text_div = article.find('div', class_='textDiv')
-                if not text_div: continue
-                
-                a_tag = text_div.find('a', class_='title')
-                title = a_tag.text.strip()
-                link = "https://www.investing.com" + a_tag['href']
-                excerpt = text_div.find('p').text.strip()
-                time_span = text_div.find('span', class_='date')
-                pub_time = time_span.text if time_span else ""
-                
-                # Use stable MD5 hash for ID
-                link_hash = hashlib.md5(link.encode()).hexdigest()[:12]
-                
-                news_items.append({
-                    'id': f"iv_{link_hash}",
-                    'source': 'Investing.com',
-                    'title': title,
-                    'excerpt': excerpt,
-                    'link': link,
-                    'time': pub_time,
-                    'is_breaking': False
-                })
-        except Exception as e:
-            print(f"[ERROR] Investing.com fetch failed: {e}")
-        return news_items
+    def fetch_yahoo_finance(self, limit=10, timeout=10):
+        return self.fetch_source(SOURCE_REGISTRY['Yahoo Finance'], limit=limit, timeout=timeout)
+
+    def fetch_investing_com(self, limit=10, timeout=10):
+        return self.fetch_source(SOURCE_REGISTRY['Investing.com'], limit=limit, timeout=timeout)
+
+    def due_sources(self):
+        now = time.monotonic()
+        return [s for s in self.sources if s.is_due(now)]
+
+    def seconds_until_next_due(self):
+        now = time.monotonic()
+        return max(0, min(s.next_due for s in self.sources) - now)
 
     def analyze_with_ai(self, item):
         if not self.client:
@@ -171,120 +274,306 @@ class StockNewsCrawler:
                 'summary_kr': item['excerpt_kr'],
                 'market_sentiment': 'NEUTRAL'
             }
-        
-        prompt = f"""
-        Analyze this US market news for professional stock traders and retail investors. 
-        Your goal is to provide 'High Value' unique insights that aren't visible from the headline alone.
-        
-        Title: {item['title']}
-        Excerpt: {item['excerpt']}
-        
-        CRITICAL RULES:
-        1. Focus ONLY on things that move STOCK PRICES (Nvidia, Tesla, Apple, etc.) or macro-economic indicators (CPI, Jobs, FOMC, GDP).
-        2. If the news is low-impact, return impact_score: 0.
-        3. For economic indicators, give it a HIGH score (>85).
-        
-        Return JSON format: 
-        {{
-            "impact_score": int (0-100),
-            "summary_kr": "Sharp expert analysis in Korean (Expert Boss style).",
-            "valuable_insight": "A unique, deep financial perspective (3-4 sentences in Korean) that adds significant value beyond basic summary. Mention sector impact, future outlook, and 'Key Data Point'.",
-            "market_sentiment": "BULLISH/BEARISH/NEUTRAL",
-            "is_indicator": boolean (true if this is a macro-economic indicator announcement)
-        }}
-        """
-        
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                response_format={ "type": "json_object" }
-            )
-            analysis = json.loads(response.choices[0].message.content)
-            
-            # Filter out "trash" news - strictly require high impact or indicator
-            score = analysis.get('impact_score', 0)
-            is_indicator = analysis.get('is_indicator', False)
-            
-            if score < 60 and not is_indicator:
-                print(f"[DEBUG] Filtering out low impact/irrelevant news: {item['title']} (Score: {score})")
+
+        # [분석 캐시] 같은 기사 + 같은 프롬프트 버전이면 저장된 결과 재사용
+        # (저점수로 걸러진 기사도 원본 결과를 저장해 두므로 다시 전송되지 않음)
+        cache_key = f"{item['id']}:{PROMPT_VERSION}"
+        analysis = self._cached_analysis(item)
+        if analysis is not None:
+            item['analysis_cached'] = True
+        else:
+            try:
+                response = self._chat(ANALYSIS_PROMPT.format(title=item['title'], excerpt=item['excerpt']), mode='single')
+                analysis = json.loads(response.choices[0].message.content)
+            except Exception as e:
+                # 요청 실패 -> 필터링과 구분 (이 기사의 소스는 다음 폴링 때 다시 처리)
+                print(f"[WARN] AI analysis failed for {item['id']}: {e}")
+                item['analysis_failed'] = True
                 return None
-            
-            # If it's an indicator, force it to be breaking news for immediate Tistory posting
-            if is_indicator:
-                item['is_breaking'] = True
-                
-            return analysis
-        except:
+            # 형식이 잘못된 응답은 캐시하지 않음 (캐시되면 7일 동안 같은 오류 결과를 재사용)
+            if not self._valid_analysis(analysis):
+                print(f"[WARN] Invalid AI analysis for {item['id']}. Not caching.")
+                item['analysis_failed'] = True
+                return None
+            self.analysis_cache.set(cache_key, analysis)
+
+        return self._filter_analysis(item, analysis)
+
+    def _chat(self, prompt, mode):
+        """LLM 요청 1회 (속도 제한 + 지연 시간 / 토큰 사용량 계측). mode: single | batch"""
+        metrics = get_metrics()
+        self.llm_limiter.acquire()
+        result = 'error'
+        try:
+            with metrics.span('llm.request', labels={'model': ANALYSIS_MODEL, 'mode': mode}) as attrs:
+                response = self.client.chat.completions.create(
+                    model=ANALYSIS_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    response_format={ "type": "json_object" }
+                )
+                usage = getattr(response, 'usage', None)
+                if usage is not None:
+                    attrs.update(prompt_tokens=usage.prompt_tokens, completion_tokens=usage.completion_tokens)
+                    metrics.inc('llm_tokens_total', usage.prompt_tokens or 0, model=ANALYSIS_MODEL, kind='prompt')
+                    metrics.inc('llm_tokens_total', usage.completion_tokens or 0, model=ANALYSIS_MODEL, kind='completion')
+                result = 'ok'
+                return response
+        finally:
+            metrics.inc('llm_requests_total', model=ANALYSIS_MODEL, mode=mode, result=result)
+
+    def _filter_analysis(self, item, analysis):
+        # Filter out "trash" news - strictly require high impact or indicator
+        score = analysis.get('impact_score', 0)
+        is_indicator = analysis.get('is_indicator', False)
+
+        if score < 60 and not is_indicator:
+            print(f"[DEBUG] Filtering out low impact/irrelevant news: {item['title']} (Score: {score})")
+            get_metrics().inc('news_items_filtered_total', reason='low_impact')
             return None
 
-    def crawl_all_sources(self, limit=10):
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Crawling US Market News...")
-        raw_news = self.fetch_yahoo_finance(limit=limit) + self.fetch_investing_com(limit=limit)
-        
-        processed_news = []
-        for item in raw_news:
+        # If it's an indicator, force it to be breaking news for immediate Tistory posting
+        if is_indicator:
+            item['is_breaking'] = True
+
+        return analysis
+
+    def _cached_analysis(self, item):
+        """캐시된 분석 결과 (형식이 깨진 항목은 없는 것으로 보고 다시 요청 -> 새 결과로 덮어씀)"""
+        cached = self.analysis_cache.get(f"{item['id']}:{PROMPT_VERSION}")
+        if cached is None:
+            return None
+        if not self._valid_analysis(cached):
+            print(f"[WARN] Invalid cached analysis for {item['id']}. Re-requesting.")
+            return None
+        return cached
+
+    def _valid_analysis(self, analysis):
+        if not isinstance(analysis, dict):
+            return False
+        score = analysis.get('impact_score')
+        if isinstance(score, bool) or not isinstance(score, (int, float)) or not 0 <= score <= 100:
+            return False
+        if not isinstance(analysis.get('summary_kr'), str):
+            return False
+        return analysis.get('market_sentiment') in ('BULLISH', 'BEARISH', 'NEUTRAL')
+
+    def _request_batch(self, batch):
+        """기사 N개를 한 번의 요청으로 분석하고 {id: analysis} 로 나눠 반환 (검증 통과분만)"""
+        articles = [{'id': item['id'], 'title': item['title'], 'excerpt': item['excerpt']} for item in batch]
+        response = self._chat(BATCH_ANALYSIS_PROMPT.format(
+            count=len(articles), articles=json.dumps(articles, ensure_ascii=False, indent=1)), mode='batch')
+        payload = json.loads(response.choices[0].message.content)
+        results = payload.get('results', []) if isinstance(payload, dict) else []
+
+        wanted = {item['id'] for item in batch}
+        parsed = {}
+        for result in results:
+            if not isinstance(result, dict) or result.get('id') not in wanted:
+                continue
+            analysis = {k: v for k, v in result.items() if k != 'id'}
+            if self._valid_analysis(analysis):
+                parsed[result['id']] = analysis
+        return parsed
+
+    def analyze_batch(self, items, batch_size=None):
+        """
+        여러 기사를 묶어서 분석합니다 (기사당 1회 왕복 -> 배치당 1회 왕복).
+        - 캐시에 있는 기사는 요청에서 제외
+        - 응답 파싱/검증에 실패한 기사만 단건 요청(analyze_with_ai)으로 재시도
+        Returns: {item_id: analysis 또는 None(필터링됨)}
+        """
+        if not self.client:
+            return {item['id']: self.analyze_with_ai(item) for item in items}
+
+        batch_size = batch_size or self.analysis_batch_size
+        results = {}
+        pending = []
+        for item in items:
+            cached = self._cached_analysis(item)
+            if cached is not None:
+                item['analysis_cached'] = True
+                results[item['id']] = self._filter_analysis(item, cached)
+            else:
+                pending.append(item)
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
             try:
-                # Basic Translation
-                item['excerpt_kr'] = self.translator.translate(item['excerpt'])
-                item['title_kr'] = self.translator.translate(item['title'])
-                
-                # AI Analysis
-                ai_data = self.analyze_with_ai(item)
-                
-                if ai_data:
-                    processed_news.append({
-                        'id': item['id'],
-                        'published_at': item.get('time') or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'crawled_at': datetime.now().isoformat(),
-                        'source': item['source'],
-                        'link': item['link'],
-                        'sentiment': ai_data.get('market_sentiment', 'NEUTRAL'),
-                        'is_breaking': item['is_breaking'],
-                        'free_tier': {
-                            'title': item['title_kr'],
-                            'title_en': item['title'],  # 원문 제목 추가 (UI에서 필요할 수 있음)
-                            'summary_kr': item['excerpt_kr'],
-                            'original_source': item['source']
-                        },
-                        'vip_tier': {
-                            'ai_analysis': {
-                                'impact_score': ai_data.get('impact_score', 50),
-                                'summary_kr': ai_data.get('summary_kr', '분석 중...'),
-                                'valuable_insight': ai_data.get('valuable_insight', ''),
-                                'is_indicator': ai_data.get('is_indicator', False)
-                            }
-                        }
-                    })
-                # Prevent rate limits
-                time.sleep(1)
+                parsed = self._request_batch(batch)
             except Exception as e:
-                print(f"[ERROR] Processing news item failed: {e}")
-                
+                print(f"[WARN] Batch analysis failed ({len(batch)} items): {e}")
+                parsed = {}
+
+            for item in batch:
+                analysis = parsed.get(item['id'])
+                if analysis is not None:
+                    self.analysis_cache.set(f"{item['id']}:{PROMPT_VERSION}", analysis)
+                    results[item['id']] = self._filter_analysis(item, analysis)
+                else:
+                    # 배치 응답에서 빠졌거나 형식이 깨진 기사 -> 단건 재시도
+                    print(f"[INFO] Falling back to single analysis: {item['title']}")
+                    results[item['id']] = self.analyze_with_ai(item)
+
+        print(f"[INFO] AI analysis: {len(items)} items, {len(items) - len(pending)} cached, {len(pending)} requested in {(len(pending) + batch_size - 1) // batch_size} batch(es)")
+        return results
+
+    def crawl_due_sources(self, limit=10):
+        """주기가 돌아온 소스만 수집합니다. 새로 처리된 기사(delta)만 반환 (다른 소스 기사는 store에 유지)"""
+        due = self.due_sources()
+        if not due:
+            return None
+        return self.crawl_all_sources(limit=limit, sources=due)
+
+    def build_news_entry(self, item, ai_data):
+        return {
+            'id': item['id'],
+            'published_at': item.get('time') or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'crawled_at': datetime.now().isoformat(),
+            'source': item['source'],
+            'link': item['link'],
+            'sources': item.get('sources') or [{'source': item['source'], 'link': item['link']}],
+            'sentiment': ai_data.get('market_sentiment', 'NEUTRAL'),
+            'is_breaking': item['is_breaking'],
+            'free_tier': {
+                'title': item['title_kr'],
+                'title_en': item['title'],  # 원문 제목 추가 (UI에서 필요할 수 있음)
+                'summary_kr': item['excerpt_kr'],
+                'original_source': item['source']
+            },
+            'vip_tier': {
+                'ai_analysis': {
+                    'impact_score': ai_data.get('impact_score', 50),
+                    'summary_kr': ai_data.get('summary_kr', '분석 중...'),
+                    'valuable_insight': ai_data.get('valuable_insight', ''),
+                    'is_indicator': ai_data.get('is_indicator', False)
+                }
+            }
+        }
+
+    def crawl_all_sources(self, limit=10, sources=None):
+        with get_metrics().span('news.crawl') as attrs:
+            attrs['sources'] = len(self.sources if sources is None else sources)
+            processed_news = asyncio.run(self.crawl_async(limit=limit, sources=sources))
+            attrs['items'] = len(processed_news)
+            return processed_news
+
+    def _translate_item(self, item):
+        # Basic Translation
+        item['excerpt_kr'] = self.translator.translate(item['excerpt'])
+        item['title_kr'] = self.translator.translate(item['title'])
+        return [item]
+
+    def _analyze_items(self, items):
+        analyses = self.analyze_batch(items)
+        return [(item, analyses[item['id']]) for item in items if analyses.get(item['id'])]
+
+    async def crawl_async(self, limit=10, sources=None):
+        """
+        단계별 비동기 파이프라인: fetch -> dedupe -> translate -> analyze -> assemble
+        - 각 단계는 동시 실행 수 제한을 가지며, 앞 단계 결과가 나오는 즉시 다음 단계가 처리
+        - 요청 속도는 고정 sleep이 아니라 토큰 버킷(translate_limiter, llm_limiter)으로 제어
+        """
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] Crawling US Market News...")
+        sources = self.sources if sources is None else sources
+        started = time.monotonic()
+        deadline = started + self.crawl_deadline
+        run_items = {}
+        order = {}
+        # 이번 사이클에 처리하지 못한 기사(번역/분석 오류, 수집 시간 초과)가 있는 소스
+        # -> 검증 헤더를 기록하지 않아 다음 폴링 때 304/해시로 건너뛰지 않고 다시 처리
+        failed_sources = set()
+
+        known_ids = self.store.known_ids()
+
+        def on_fetch_timeout(source):
+            failed_sources.add(source.name)
+            source.cancel()
+            source.mark_failure()
+
+        def translate(item):
+            try:
+                return self._translate_item(item)
+            except Exception:
+                failed_sources.add(item['source'])
+                raise
+
+        def analyze(items):
+            try:
+                pairs = self._analyze_items(items)
+            except Exception:
+                failed_sources.update(item['source'] for item in items)
+                raise
+            failed_sources.update(item['source'] for item in items if item.get('analysis_failed'))
+            return pairs
+
+        def dedupe(item):
+            # 이미 저장된 기사는 다시 번역/분석하지 않음 (delta만 처리)
+            if item['id'] in run_items or item['id'] in known_ids:
+                get_metrics().inc('news_items_deduplicated_total', reason='known')
+                return []
+            canonical_id = self.dedupe_index.find(item['title'], exclude_id=item['id'])
+            if canonical_id and canonical_id != item['id']:
+                # 같은 기사 -> 대표 기사에 출처만 추가하고 이후 단계는 건너뜀
+                self.dedupe_index.add(item['id'], item['title'], canonical_id=canonical_id)
+                get_metrics().inc('news_items_deduplicated_total', reason='near_duplicate')
+                canonical = run_items.get(canonical_id)
+                if canonical:
+                    canonical['sources'].append({'source': item['source'], 'link': item['link']})
+                    print(f"[INFO] Merged duplicate into {canonical_id}: {item['title']} ({item['source']})")
+                elif self.store.add_source(canonical_id, item['source'], item['link']):
+                    # 이전 사이클에 저장된 기사 -> 저장소의 기사에 출처 추가 (save에서 함께 저장)
+                    print(f"[INFO] Added source to stored item {canonical_id}: {item['title']} ({item['source']})")
+                else:
+                    print(f"[INFO] Skipping duplicate of recent item {canonical_id}: {item['title']} ({item['source']})")
+                return []
+            item['sources'] = [{'source': item['source'], 'link': item['link']}]
+            self.dedupe_index.add(item['id'], item['title'])
+            run_items[item['id']] = item
+            order[item['id']] = len(order)
+            return [item]
+
+        stages = [
+            Stage('fetch', lambda source: self.fetch_source(source, limit=limit, timeout=source.timeout),
+                  concurrency=max(1, len(sources)),
+                  timeout=lambda source: min(source.timeout, deadline - time.monotonic()),
+                  on_timeout=on_fetch_timeout),
+            Stage('dedupe', dedupe, blocking=False),
+            Stage('translate', translate, concurrency=self.translate_concurrency),
+            Stage('analyze', analyze, concurrency=self.analyze_concurrency,
+                  batch_size=self.analysis_batch_size),
+            Stage('assemble', lambda pair: [self.build_news_entry(*pair)], blocking=False),
+        ]
+        processed_news = await run_stages(sources, stages)
+
+        for source in sources:
+            if source.name in failed_sources:
+                source.pending_validators = None
+                print(f"[WARN] {source.name}: some items were not processed. Will re-fetch on the next poll.")
+            else:
+                source.commit_validators(self.http_cache)
+
+        # 수집 순서 유지 (소스 등록 순서 -> 피드 순서)
+        processed_news.sort(key=lambda entry: order.get(entry['id'], 0))
+        print(f"[INFO] Pipeline finished: {len(order)} unique items -> {len(processed_news)} published in {round(time.monotonic() - started, 2)}s")
         return processed_news
 
     def save(self, data):
-        if not data:
+        clean_data = [item for item in data or [] if item is not None]
+        if not clean_data and not self.store.dirty:
             print(f"[{datetime.now().strftime('%H:%M:%S')}] No news data to save.")
             return
-        clean_data = [item for item in data if item is not None]
         print(f"[{datetime.now().strftime('%H:%M:%S')}] Attempting to save {len(clean_data)} items.")
-        os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            json.dump(clean_data, f, ensure_ascii=False, indent=2)
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Saved {len(clean_data)} items to {self.output_path}")
+        added = self.store.merge(clean_data)
+        self.store.save()
+        get_metrics().inc('news_items_published_total', added)
+        get_metrics().set_gauge('news_store_items', len(self.store.items))
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] Merged {added} new items into {self.output_path} (total {len(self.store.items)})")
         
         # ------------------------------------------------------------------
         # [웹사이트 동기화] Vercel 자동 업데이트를 위한 GitHub Push
         # ------------------------------------------------------------------
-        try:
-            print("[INFO] Syncing data to GitHub for Vercel update...")
-            os.system('git add public/us-news-realtime.json')
-            os.system('git commit -m "update: US market news [skip ci]"')
-            os.system('git push origin main')
-            print("[SUCCESS] Data synced to GitHub.")
-        except Exception as e:
-            print(f"[WARN] Git sync failed: {e}")
+        self.publisher.mark_dirty(self.output_path, "US market news")
+        print("[INFO] Queued data for GitHub sync (Vercel update).")
 
         # ------------------------------------------------------------------
         # [자동 포스팅] 티스토리 블로그 발행 (미국 주식 버전)
@@ -380,17 +669,23 @@ class StockNewsCrawler:
             except Exception as e:
                 print(f"[ERROR] US Auto-posting failed: {e}")
 
+# 정규장에는 1분, 프리/애프터마켓 5분, 휴장(야간/주말/NYSE 휴일)에는 30분마다 (소스별 주기는 그대로 하한으로 적용)
+NEWS_TRIGGER = MarketHoursTrigger(regular=60, extended=300, closed=1800)
+
+
+def crawl_once(crawler):
+    news = crawler.crawl_due_sources(limit=15)
+    if news is not None:
+        crawler.save(news)
+
+
 def main():
     crawler = StockNewsCrawler()
-    print("Stock Empire Crawler Started (Interval: 5min)")
-    while True:
-        try:
-            news = crawler.crawl_all_sources(limit=15)
-            crawler.save(news)
-        except Exception as e:
-            print(f"[ERROR] Main loop error: {e}")
-        # Reduce interval to 5 minutes for "real-time" indicator monitoring
-        time.sleep(300)
+    intervals = ", ".join(f"{s.name}: {s.poll_interval}s" for s in crawler.sources)
+    print(f"Stock Empire Crawler Started (Per-source interval - {intervals})")
+    scheduler = Scheduler()
+    scheduler.add("US News Crawler", lambda: crawl_once(crawler), NEWS_TRIGGER, run_at_start=True)
+    scheduler.run_forever()
 
 if __name__ == "__main__":
     main()
@@ -1,49 +1,128 @@
-import subprocess
-import time
-import sys
+"""
+Stock Empire Engine Orchestrator (Single Process)
+- 뉴스 크롤러 / 알파 분석기를 하위 프로세스 대신 한 인터프리터 안의 작업으로 실행
+  -> pandas / bs4 / openai SDK import, HTTP 커넥션 풀, 캐시, Git Publisher를 모든 작업이 공유
+- 실행 루프는 공용 스케줄러(crawler/scheduler.py)의 run_async 하나
+  작업 본문(동기 코드)은 asyncio.to_thread로 실행 -> 한 작업이 오래 걸려도 다른 작업은 계속 진행
+- 실행 주기는 각 엔진의 트리거를 따름 -> 정규장에는 빠르게, 휴장/주말에는 느리게 또는 쉼
+  마지막 실행 시각을 저장해 재시작 후 놓친 실행은 catch-up
+- 장애 격리: 한 작업이 예외로 실패해도 다른 작업은 영향 없음. 실패한 작업만 지수 백오프 + 지터 후 재시도
+- 재시도 시 객체를 다시 만들지 않음 (메모리 캐시 유지, 콜드 스타트 없음). 생성(setup) 자체가 실패한 경우만 다시 생성
+- 작업 회차마다 지표/트레이스를 crawler/cache/metrics/ 에 기록 (crawler/metrics.py)
+"""
+
+import asyncio
 import os
+import sys
+
+from crawler.kv_cache import CACHE_DIR
+from crawler.scheduler import Scheduler
+
+STATE_PATH = os.path.join(CACHE_DIR, 'scheduler_engine.json')
+CATCH_UP = 1800      # 재시작 전 30분 이내에 놓친 실행은 바로 실행
+MIN_BACKOFF = 5
+MAX_BACKOFF = 600
+
+
+class EngineJob:
+    """
+    스케줄러 작업 본문
+    setup(): 작업 객체 생성 (첫 실행 때 작업 스레드에서 1회, 실패하면 다음 재시도 때 다시 생성)
+    tick(instance): 한 번 실행
+    """
+
+    def __init__(self, name, setup, tick):
+        self.name = name
+        self.setup = setup
+        self.tick = tick
+        self.instance = None
+
+    def __call__(self):
+        if self.instance is None:
+            print(f"[INFO] Starting {self.name}...")
+            self.instance = self.setup()
+        self.tick(self.instance)
+
+
+def news_engine():
+    from crawler.us_news_crawler import StockNewsCrawler, NEWS_TRIGGER, crawl_once
+    from crawler.publisher import get_publisher
+    return (lambda: StockNewsCrawler(publisher=get_publisher())), crawl_once, NEWS_TRIGGER
+
+
+def alpha_engine():
+    from crawler.alpha_analyzer import AlphaAnalyzer, ALPHA_TRIGGER
+    from crawler.publisher import get_publisher
+    return (lambda: AlphaAnalyzer(publisher=get_publisher())), (lambda analyzer: analyzer.run_pipeline()), ALPHA_TRIGGER
+
+
+ENGINES = [
+    # 1. US News Crawler (with Tistory Auto-Posting)
+    ("US News Crawler", news_engine),
+    # 2. VVIP Alpha Analyzer (Real-time Signal Detection)
+    ("VVIP Alpha Analyzer", alpha_engine),
+]
+
+
+def build_scheduler(state_path=STATE_PATH):
+    """엔진별 작업 등록. 모듈을 불러오지 못한 엔진은 건너뜀 (다른 엔진은 계속 실행)"""
+    scheduler = Scheduler(state_path=state_path)
+    for name, engine in ENGINES:
+        try:
+            setup, tick, trigger = engine()
+        except Exception as e:
+            print(f"[ERROR] {name} could not be loaded ({type(e).__name__}: {e}). Skipping.")
+            continue
+        scheduler.add(name, EngineJob(name, setup, tick), trigger, catch_up=CATCH_UP, run_at_start=True,
+                      min_backoff=MIN_BACKOFF, max_backoff=MAX_BACKOFF)
+    return scheduler
+
+
+def shutdown():
+    """공유 자원 정리: 대기 중인 발행을 마저 처리하고 커넥션 풀 종료"""
+    try:
+        from crawler.publisher import get_publisher
+        get_publisher().stop()
+    except Exception as e:
+        print(f"[WARN] Publisher shutdown failed: {e}")
+    try:
+        from crawler import http_client
+        if http_client._client is not None:
+            http_client._client.close()
+    except Exception as e:
+        print(f"[WARN] HTTP client shutdown failed: {e}")
 
-def run_process(command, name):
-    print(f"[INFO] Starting {name}...")
-    # -u 옵션을 추가하여 실시간 로그 기록 강제, 인코딩 환경변수 추가
-    env = os.environ.copy()
-    env["PYTHONIOENCODING"] = "utf-8"
-    full_command = command.replace("python3", "python3 -u").replace(sys.executable, f"{sys.executable} -u")
-    return subprocess.Popen(full_command, shell=True, env=env)
 
 def main():
+    # 실시간 로그 기록 (기존 python -u 대신 줄 단위 flush) + Windows CP949 오류 방지
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', line_buffering=True)
+        sys.stderr.reconfigure(encoding='utf-8', line_buffering=True)
+    except Exception:
+        pass
+
     print("=" * 60)
     print("Stock Empire Automated Intelligence System")
     print("Core Engines: US News & Alpha Signals (VVIP)")
     print("=" * 60)
 
-    # 1. US News Crawler (with Tistory Auto-Posting)
-    us_crawler = run_process(f"{sys.executable} crawler/us_news_crawler.py", "US News Crawler")
-    
-    # 2. VVIP Alpha Analyzer (Real-time Signal Detection)
-    alpha_analyzer = run_process(f"{sys.executable} crawler/alpha_analyzer.py", "VVIP Alpha Analyzer")
-    
+    scheduler = build_scheduler()
+    if not scheduler.jobs:
+        print("[ERROR] No engines could be loaded.")
+        sys.exit(1)
     print("\n[SUCCESS] All Engines Launched! 🚀")
     print("The system is now autonomously monitoring the global market.")
     print("Press Ctrl+C to stop all engines.\n")
-    
+
     try:
-        while True:
-            time.sleep(1)
-            # Check if processes are alive
-            if us_crawler.poll() is not None:
-                print("[WARN] US News Crawler stopped. Restarting...")
-                us_crawler = run_process(f"{sys.executable} crawler/us_news_crawler.py", "US News Crawler")
-            
-            if alpha_analyzer.poll() is not None:
-                print("[WARN] VVIP Alpha Analyzer stopped. Restarting...")
-                alpha_analyzer = run_process(f"{sys.executable} crawler/alpha_analyzer.py", "VVIP Alpha Analyzer")
-                
+        asyncio.run(scheduler.run_async())
     except KeyboardInterrupt:
+        # 실행 중인 작업 스레드는 현재 회차가 끝날 때까지 기다린 뒤 종료됨
         print("\n[INFO] Shutting down all engines...")
-        us_crawler.terminate()
-        alpha_analyzer.terminate()
+    finally:
+        shutdown()
         print("[INFO] System offline.")
 
+
 if __name__ == "__main__":
     main()
@@ -1,11 +1,11 @@
-from crawler.us_news_crawler import StockNewsCrawler
-# from crawler.kr_crawler import KRNewsCrawler
-from crawler.alpha_analyzer import AlphaAnalyzer
 import sys
 
+# 각 단계의 모듈은 그 단계를 실행할 때 import (pandas / openai 등 무거운 의존성을 필요한 시점에만 로드)
+
 def run_once():
     try:
         # 1. Update Premium AI News (US)
+        from crawler.us_news_crawler import StockNewsCrawler
         crawler = StockNewsCrawler()
         print("--- [1/3] Updating Premium AI News (US Market) ---")
         news = crawler.crawl_all_sources(limit=30)
@@ -13,11 +13,13 @@ def run_once():
         
         # 2. Update KR Market News
         # print("\n--- [2/3] Updating KR Market News ---")
+        # from crawler.kr_crawler import KRNewsCrawler
         # kr_crawler = KRNewsCrawler()
         # kr_crawler.crawl()
 
         # 3. Update VVIP Alpha Signals
         print("\n--- [3/3] Updating VVIP Alpha Stock Signals ---")
+        from crawler.alpha_analyzer import AlphaAnalyzer
         analyzer = AlphaAnalyzer()
         analyzer.run_pipeline()
         
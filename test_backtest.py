@@ -0,0 +1,70 @@
+"""
+백테스트 손익 검증 (직접 계산한 10봉짜리 시세, 네트워크 불필요)
+- 진입 봉 종가 기준 목표가(ATR x 3) / 손절가(ATR x 1.5) / horizon 만료 청산 수익률
+- 같은 시그널이 이어지면 첫 봉에서만 진입 (every_bar=True면 매 봉 진입)
+- summarize(): 적중률 / 손절률 / 평균 수익률
+
+사용법: python test_backtest.py  (또는 python -m pytest -q test_backtest.py)
+"""
+
+import numpy as np
+import pandas as pd
+
+from crawler.backtest import simulate, summarize
+from crawler.strategies import RsiRebound
+
+HORIZON = 3
+
+# 봉:        0    1    2    3    4    5    6    7    8    9
+CLOSE = [100, 100, 100, 100, 100, 100, 100, 100, 102, 100]
+CODES = [1, 1, 0, 1, 0, 1, 0, 0, 0, 0]      # 1 = RSI 반등
+ATR = 1.0                                    # 목표 +3, 손절 -1.5
+
+
+def series():
+    close = np.array(CLOSE, dtype='float64').reshape(-1, 1)
+    high, low = close + 0.5, close - 0.5
+    high[2] = 103.5     # 0번 진입: 2봉째 목표가(103) 도달
+    low[4] = 98.0       # 3번 진입: 1봉째 손절가(98.5) 이탈
+    # 5번 진입: 목표/손절 모두 미도달 -> 3봉 뒤(8번) 종가 102로 청산
+    features = {'close': pd.DataFrame(close, columns=['AAA']),
+                'atr14': pd.DataFrame(np.full(close.shape, ATR), columns=['AAA'])}
+    return features, high, low, np.array(CODES).reshape(-1, 1)
+
+
+def test_first_bar_entries_pnl():
+    features, high, low, codes = series()
+    result = simulate(features, high, low, codes, [RsiRebound()], horizon=HORIZON)[RsiRebound.name]
+    assert list(result['outcome']) == [1, -1, 0]
+    assert np.allclose(result['returns'], [0.03, -0.015, 0.02])
+    assert list(result['bars_to_target']) == [2]
+
+    report = summarize({RsiRebound.name: result})[RsiRebound.name]
+    assert report['trades'] == 3
+    assert (report['hit_rate'], report['stop_rate'], report['timeout_rate']) == (33.3, 33.3, 33.3)
+    assert report['avg_return_pct'] == 1.17      # (3 - 1.5 + 2) / 3
+    assert report['bars_to_target'] == {'mean': 2.0, 'median': 2.0}
+
+
+def test_every_bar_entries_pnl():
+    features, high, low, codes = series()
+    result = simulate(features, high, low, codes, [RsiRebound()], horizon=HORIZON, every_bar=True)[RsiRebound.name]
+    # 1번 진입: 1봉째(2번 봉) 목표가 도달 (4번 봉의 손절은 그 뒤)
+    assert list(result['outcome']) == [1, 1, -1, 0]
+    assert np.allclose(result['returns'], [0.03, 0.03, -0.015, 0.02])
+    assert list(result['bars_to_target']) == [2, 1]
+
+
+def test_no_entry_without_full_horizon():
+    features, high, low, codes = series()
+    codes[:] = 0
+    codes[7:] = 1       # 7번 이후 진입은 horizon(3봉)을 관찰할 수 없음
+    result = simulate(features, high, low, codes, [RsiRebound()], horizon=HORIZON)[RsiRebound.name]
+    assert len(result['outcome']) == 0
+    assert summarize({RsiRebound.name: result})[RsiRebound.name] == {'trades': 0}
+
+
+if __name__ == "__main__":
+    for test in (test_first_bar_entries_pnl, test_every_bar_entries_pnl, test_no_entry_without_full_horizon):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
@@ -0,0 +1,215 @@
+"""
+캐시 검증 (네트워크 불필요, 가짜 HTTP 클라이언트 / 가짜 시계 사용)
+- HttpValidatorCache: 304 -> 본문 없음, 검증 헤더가 없는 서버는 본문 해시로 변경 판단
+- NewsSource: 검증 헤더는 commit_validators() 때만 기록 (처리 못 한 응답은 다음 폴링 때 다시 받음)
+- SqliteCache: TTL 만료, 최근 사용 순(LRU) 개수 제한
+- CachedTranslator: 같은 문장은 한 번만 번역 요청
+- AI 분석 캐시: 키에 프롬프트 버전 포함 -> 프롬프트/모델이 바뀌면 이전 결과는 사용하지 않음
+
+사용법: python test_caches.py  (또는 python -m pytest -q test_caches.py)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from crawler import http_cache as http_cache_module
+from crawler import kv_cache as kv_cache_module
+from crawler import us_news_crawler
+from crawler.http_cache import HttpValidatorCache
+from crawler.kv_cache import SqliteCache
+from crawler.news_sources import NewsSource
+from crawler.translation_cache import CachedTranslator
+
+URL = 'https://example.com/rss'
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class FakeClient:
+    """응답을 순서대로 돌려주고 요청 헤더를 기록"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+class FakeClock:
+    def __init__(self, start=1_700_000_000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class NullPublisher:
+    def mark_dirty(self, *args, **kwargs):
+        pass
+
+
+def temp_dir():
+    return tempfile.mkdtemp(prefix='cache-test-')
+
+
+def test_not_modified_returns_no_content():
+    root = temp_dir()
+    try:
+        cache = HttpValidatorCache(path=os.path.join(root, 'validators.json'))
+        cache.remember(URL, {'etag': '"v1"', 'last_modified': 'Mon, 02 Mar 2026 14:30:00 GMT',
+                             'content_hash': 'abc'})
+        client = FakeClient(FakeResponse(304))
+        with mock.patch.object(http_cache_module, 'get_client', lambda: client):
+            assert cache.fetch(URL) == (None, None)
+        assert client.requests[0]['If-None-Match'] == '"v1"'
+        assert client.requests[0]['If-Modified-Since'] == 'Mon, 02 Mar 2026 14:30:00 GMT'
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_content_hash_fallback_without_validators():
+    root = temp_dir()
+    try:
+        cache = HttpValidatorCache(path=os.path.join(root, 'validators.json'))
+        client = FakeClient(FakeResponse(200, b'<rss>1</rss>'), FakeResponse(200, b'<rss>1</rss>'),
+                            FakeResponse(200, b'<rss>2</rss>'))
+        with mock.patch.object(http_cache_module, 'get_client', lambda: client):
+            content, validators = cache.fetch(URL)
+            assert content == b'<rss>1</rss>'
+            assert validators['etag'] is None and validators['last_modified'] is None
+            cache.remember(URL, validators)
+
+            # 검증 헤더를 보낼 수 없으니 서버는 항상 200 -> 같은 본문이면 '변경 없음'
+            assert cache.fetch(URL) == (None, None)
+            assert 'If-None-Match' not in client.requests[1]
+            content, _ = cache.fetch(URL)
+            assert content == b'<rss>2</rss>'
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_validators_written_only_on_commit():
+    root = temp_dir()
+    path = os.path.join(root, 'validators.json')
+    try:
+        cache = HttpValidatorCache(path=path)
+        source = NewsSource('Fake', URL, lambda content, limit: [{'id': 'a'}], poll_interval=60)
+        client = FakeClient(FakeResponse(200, b'<rss>1</rss>', {'ETag': '"v1"'}), FakeResponse(304))
+        with mock.patch.object(http_cache_module, 'get_client', lambda: client):
+            assert source.fetch(cache=cache) == [{'id': 'a'}]
+            assert not os.path.exists(path)          # 파싱만 끝난 상태 -> 아직 기록하지 않음
+            assert cache.conditional_headers(URL) == {}
+
+            source.commit_validators(cache)
+            with open(path, 'r', encoding='utf-8') as f:
+                assert json.load(f)[URL]['etag'] == '"v1"'
+
+            assert source.fetch(cache=cache) == []
+            assert source.not_modified
+            assert client.requests[1]['If-None-Match'] == '"v1"'
+
+        # 재시작 후에도 기록된 검증 헤더 사용
+        assert HttpValidatorCache(path=path).conditional_headers(URL) == {'If-None-Match': '"v1"'}
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_sqlite_cache_ttl_expiry():
+    root = temp_dir()
+    clock = FakeClock()
+    try:
+        with mock.patch.object(kv_cache_module.time, 'time', clock):
+            cache = SqliteCache(os.path.join(root, 'kv.sqlite3'), ttl=60)
+            cache.set('k', {'v': 1})
+            clock.now += 59
+            assert cache.get('k') == {'v': 1}
+            clock.now += 2
+            assert cache.get('k') is None
+            assert len(cache) == 0                   # 만료된 항목은 읽을 때 삭제
+            cache.close()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_sqlite_cache_lru_eviction():
+    root = temp_dir()
+    clock = FakeClock()
+    try:
+        with mock.patch.object(kv_cache_module.time, 'time', clock):
+            cache = SqliteCache(os.path.join(root, 'kv.sqlite3'), max_entries=2, evict_every=1)
+            cache.set('a', 1)
+            clock.now += 1
+            cache.set('b', 2)
+            clock.now += 1
+            assert cache.get('a') == 1               # a를 최근에 사용 -> b가 가장 오래 사용되지 않음
+            clock.now += 1
+            cache.set('c', 3)
+            assert len(cache) == 2
+            assert cache.get('b') is None
+            assert (cache.get('a'), cache.get('c')) == (1, 3)
+            cache.close()
+
+            # 디스크에 남아 있어 다시 열어도 유지
+            reopened = SqliteCache(os.path.join(root, 'kv.sqlite3'))
+            assert reopened.get('c') == 3
+            reopened.close()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_translation_is_requested_once():
+    root = temp_dir()
+    try:
+        translator = mock.Mock()
+        translator.translate.side_effect = lambda text: f"KO:{text}"
+        cached = CachedTranslator(translator, cache=SqliteCache(os.path.join(root, 'translations.sqlite3')))
+        assert cached.translate("Fed holds rates") == "KO:Fed holds rates"
+        assert cached.translate("Fed holds rates") == "KO:Fed holds rates"
+        assert cached.translate("  ") == "  "        # 빈 문장은 요청하지 않음
+        assert translator.translate.call_count == 1
+        cached.cache.close()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_prompt_version_invalidates_old_analyses():
+    # 버전 = 모델 + 단건/배치 프롬프트 해시 -> 어느 하나라도 바뀌면 키가 달라짐
+    expected = hashlib.sha1((us_news_crawler.ANALYSIS_MODEL + us_news_crawler.ANALYSIS_PROMPT +
+                             us_news_crawler.BATCH_ANALYSIS_PROMPT).encode('utf-8')).hexdigest()[:10]
+    assert us_news_crawler.PROMPT_VERSION == expected
+
+    root = temp_dir()
+    try:
+        crawler = us_news_crawler.StockNewsCrawler(publisher=NullPublisher())
+        crawler.analysis_cache = SqliteCache(os.path.join(root, 'analysis.sqlite3'))
+        old = {'impact_score': 90, 'summary_kr': '이전 프롬프트 결과', 'market_sentiment': 'BULLISH'}
+        crawler.analysis_cache.set('yh_1:0000000000', old)
+        item = {'id': 'yh_1'}
+        assert crawler._cached_analysis(item) is None
+
+        current = {**old, 'summary_kr': '현재 프롬프트 결과'}
+        crawler.analysis_cache.set(f"yh_1:{us_news_crawler.PROMPT_VERSION}", current)
+        assert crawler._cached_analysis(item) == current
+        crawler.analysis_cache.close()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    for test in (test_not_modified_returns_no_content, test_content_hash_fallback_without_validators,
+                 test_validators_written_only_on_commit, test_sqlite_cache_ttl_expiry,
+                 test_sqlite_cache_lru_eviction, test_translation_is_requested_once,
+                 test_prompt_version_invalidates_old_analyses):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
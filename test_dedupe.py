@@ -0,0 +1,109 @@
+"""
+중복 기사 병합 검증 (네트워크 불필요)
+- 다른 출처가 표현만 바꿔 실은 같은 기사 -> 대표 기사로 병합, 유사도가 임계값 미만이면 별개 기사
+- 최근 기사 윈도우의 개수 / 시간 제한
+- 재시작 후에도 저장소(us-news-realtime.json)에 있는 기사의 다른 출처 버전은 다시 발행하지 않음
+
+사용법: python test_dedupe.py  (또는 python -m pytest -q test_dedupe.py)
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest import mock
+
+from crawler.dedupe import NearDuplicateIndex, jaccard, shingles
+from crawler.news_store import RollingNewsStore
+from crawler.us_news_crawler import StockNewsCrawler
+
+YAHOO_TITLE = "Nvidia shares jump 5% after record quarterly revenue beats estimates"
+INVESTING_TITLE = "Nvidia shares jump 5% as record quarterly revenue beats estimates"
+
+
+class NullPublisher:
+    def mark_dirty(self, *args, **kwargs):
+        pass
+
+
+def test_rewording_is_merged_across_sources():
+    index = NearDuplicateIndex(threshold=0.5)
+    index.add('yh_1', YAHOO_TITLE)
+    assert index.find(INVESTING_TITLE, exclude_id='iv_1') == 'yh_1'
+    # 병합된 기사와 비슷한 세 번째 버전도 최초 대표 기사로
+    index.add('iv_1', INVESTING_TITLE, canonical_id='yh_1')
+    assert index.find("Nvidia shares jump 5% as record quarterly revenue beats forecasts") == 'yh_1'
+
+
+def test_below_threshold_pair_stays_separate():
+    first = "Nvidia shares jump after earnings"
+    second = "Nvidia shares fall after earnings miss"
+    assert 0 < jaccard(shingles(first), shingles(second)) < 0.5
+    index = NearDuplicateIndex(threshold=0.5)
+    index.add('a', first)
+    assert index.find(second) is None
+    assert index.find("Apple unveils new iPhone lineup at September event") is None
+
+
+def test_window_evicts_by_size_and_age():
+    index = NearDuplicateIndex(threshold=0.5, max_items=2, max_age=600)
+    index.add('a', "Fed holds interest rates steady", now=1000)
+    index.add('b', "Oil prices slide on demand worries", now=1001)
+    index.add('c', "Gold hits record high on safe haven buying", now=1002)
+    assert len(index) == 2
+    assert index.find("Fed holds interest rates steady") is None      # 개수 제한으로 가장 오래된 기사 제거
+    assert index.find("Oil prices slide on demand worries") == 'b'
+
+    index.add('d', "Bitcoin rebounds above key level", now=1002 + 600.5)
+    assert index.find("Oil prices slide on demand worries") is None   # 시간 제한 (10분 초과)
+    assert index.find("Bitcoin rebounds above key level") == 'd'
+    assert len(index) == 1
+
+
+def test_stored_item_is_not_republished_after_restart():
+    root = tempfile.mkdtemp(prefix='dedupe-test-')
+    path = os.path.join(root, 'us-news-realtime.json')
+    try:
+        store = RollingNewsStore(path)
+        store.merge([{
+            'id': 'yh_1',
+            'crawled_at': datetime.now().isoformat(),
+            'source': 'Yahoo Finance',
+            'link': 'https://finance.yahoo.com/news/nvidia',
+            'sources': [{'source': 'Yahoo Finance', 'link': 'https://finance.yahoo.com/news/nvidia'}],
+            'free_tier': {'title': '엔비디아 급등', 'title_en': YAHOO_TITLE},
+        }])
+        store.save()
+
+        # 새 프로세스: 같은 저장소 파일에서 시작
+        with mock.patch('crawler.us_news_crawler.RollingNewsStore',
+                        lambda _path, **kwargs: RollingNewsStore(path, **kwargs)):
+            crawler = StockNewsCrawler(publisher=NullPublisher())
+
+        def fetch_source(source, limit=10, timeout=None):
+            return [{'id': 'iv_1', 'source': 'Investing.com', 'title': INVESTING_TITLE, 'excerpt': '',
+                     'link': 'https://www.investing.com/news/nvidia', 'is_breaking': False}]
+
+        def not_reached(*args, **kwargs):
+            raise AssertionError("duplicate should not be translated / analyzed")
+
+        crawler.fetch_source = fetch_source
+        crawler._translate_item = not_reached
+        crawler._analyze_items = not_reached
+        source = crawler.sources[1]
+        published = asyncio.run(crawler.crawl_async(sources=[source]))
+
+        assert published == []
+        links = [entry['link'] for entry in crawler.store.items[0]['sources']]
+        assert links == ['https://finance.yahoo.com/news/nvidia', 'https://www.investing.com/news/nvidia']
+        assert crawler.store.dirty
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    for test in (test_rewording_is_merged_across_sources, test_below_threshold_pair_stays_separate,
+                 test_window_evicts_by_size_and_age, test_stored_item_is_not_republished_after_restart):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
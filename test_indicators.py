@@ -0,0 +1,87 @@
+"""
+증분 지표 상태(IndicatorState) 검증 (네트워크 불필요)
+- compute_indicators(전체 재계산)와 같은 값 (누적 합계 보정 주기 500봉을 넘는 구간 포함)
+- save_states / load_states 후 이어서 갱신해도 끊김 없이 실행한 상태와 값이 비트 단위로 같음
+
+사용법: python test_indicators.py  (또는 python -m pytest -q test_indicators.py)
+"""
+
+import json
+import math
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from crawler.indicators import FEATURES, IndicatorState, compute_indicators, load_states, save_states
+
+DAY = 86400
+START = 1_600_000_000 // DAY * DAY
+BARS = 1300
+
+
+def make_bars(count=BARS, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, count)))
+    high = close * (1 + rng.uniform(0, 0.02, count))
+    low = close * (1 - rng.uniform(0, 0.02, count))
+    volume = rng.integers(1_000_000, 5_000_000, count).astype('float64')
+    volume[count // 3] = np.nan     # 거래량 없는 봉 하나 (z-score는 20봉 동안 없음)
+    ts = START + np.arange(count) * DAY
+    return [(int(t), float(c), float(v), float(h), float(l)) for t, c, v, h, l in zip(ts, close, volume, high, low)]
+
+
+def same(a, b, tolerance=0.0):
+    if isinstance(a, (bool, np.bool_)) or isinstance(b, (bool, np.bool_)):
+        return bool(a) == bool(b)
+    if a != a or b != b:
+        return a != a and b != b
+    return math.isclose(a, b, rel_tol=tolerance, abs_tol=tolerance) if tolerance else a == b
+
+
+def test_matches_compute_indicators():
+    bars = make_bars()
+    frame = lambda column: pd.DataFrame({'AAA': [bar[column] for bar in bars]}, index=[bar[0] for bar in bars])
+    features = compute_indicators(frame(1), volume=frame(2), high=frame(3), low=frame(4))
+
+    state = IndicatorState()
+    for i, bar in enumerate(bars):
+        state.update(*bar)
+        row = state.snapshot()
+        for name in FEATURES:
+            expected = features[name]['AAA'].iloc[i]
+            assert same(row[name], expected, 1e-9), (i, name, row[name], expected)
+    assert row['bars'] == BARS and row['ts'] == bars[-1][0]
+
+
+def test_restored_state_continues_identically():
+    bars = make_bars()
+    uninterrupted = IndicatorState()
+    restarted = IndicatorState()
+    root = tempfile.mkdtemp(prefix='indicator-test-')
+    path = os.path.join(root, 'indicator_state.json')
+    try:
+        for i, bar in enumerate(bars):
+            if i in (250, 777):
+                # 재시작: 디스크에 저장 후 다시 읽어 이어서 갱신 (보정 주기 앞뒤)
+                save_states(path, {'AAA': restarted})
+                restarted = load_states(path)['AAA']
+            uninterrupted.update(*bar)
+            restarted.update(*bar)
+            a, b = uninterrupted.snapshot(), restarted.snapshot()
+            assert all(same(a[name], b[name]) for name in a), i
+
+        # 장중 임시 봉 갱신(같은 ts)도 동일
+        for state in (uninterrupted, restarted):
+            state.update(bars[-1][0], bars[-1][1] * 1.01, bars[-1][2], bars[-1][3] * 1.01, bars[-1][4])
+        assert json.dumps(uninterrupted.to_dict()) == json.dumps(restarted.to_dict())
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    for test in (test_matches_compute_indicators, test_restored_state_continues_identically):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
@@ -0,0 +1,76 @@
+"""
+장중 모드 재생 검증 (네트워크 불필요)
+- crawler/fixtures/intraday_5m.json: LiveChartFeed(record_path=...) 형식의 5분봉 chart 응답 (3종목, 1거래일)
+- 재생 경로: AlphaAnalyzer.run_intraday(ReplayFeed) -> 봉마다 IndicatorState 증분 갱신 + decide_row
+- 일괄 경로: 같은 봉 전체를 compute_indicators + decide 로 한 번에 계산
+- 두 경로가 같은 봉에서 같은 전략 변경을 내고, 시그널 내용(가격/목표가/손절가/id)도 같은지 확인
+
+사용법: python test_intraday_replay.py  (또는 python -m pytest -q test_intraday_replay.py)
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from crawler.alpha_analyzer import AlphaAnalyzer
+from crawler.indicators import FEATURES, compute_indicators
+from crawler.intraday_feed import ReplayFeed, bars_from_intraday_chart
+from crawler.strategies import decide
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'crawler', 'fixtures', 'intraday_5m.json')
+
+
+class NullPublisher:
+    def mark_dirty(self, *args, **kwargs):
+        pass
+
+
+def load_charts():
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        return json.load(f)['charts']
+
+
+def replay_signals(analyzer):
+    return analyzer.run_intraday(ReplayFeed(FIXTURE), output_path=None)
+
+
+def batch_signals(analyzer):
+    """재생과 같은 규칙(최소 봉 수 이후, 전략 코드가 바뀐 봉만)을 일괄 계산 결과에 적용"""
+    events = []
+    for symbol, chart_data in load_charts().items():
+        bars = bars_from_intraday_chart(chart_data)
+        ts, close, volume, high, low = zip(*bars)
+        frame = lambda values: pd.DataFrame({symbol: np.array(values, dtype='float64')})
+        features = compute_indicators(frame(close), volume=frame(volume), high=frame(high), low=frame(low))
+        codes = decide(features)[symbol].to_numpy()
+        prev_code, since_ts = None, None
+        for i in range(analyzer.intraday_min_bars - 1, len(bars)):
+            code = int(codes[i])
+            if code == prev_code:
+                continue
+            prev_code, since_ts = code, ts[i]
+            row = {name: features[name][symbol].iloc[i] for name in FEATURES}
+            row.update(ts=ts[i], strategy=code, strategy_ts=since_ts)
+            events.append((ts[i], symbol, analyzer.build_signal(symbol, row)))
+    return sorted(events, key=lambda event: (event[0], event[1]))
+
+
+def test_replay_matches_batch():
+    analyzer = AlphaAnalyzer(publisher=NullPublisher())
+    replayed = replay_signals(analyzer)
+    batched = batch_signals(analyzer)
+
+    assert replayed, "fixture should produce at least one signal change"
+    strategies = {signal['strategy'] for _, _, signal in replayed}
+    assert len(strategies) > 1, f"fixture should exercise more than one strategy (got {strategies})"
+
+    assert [(ts, symbol) for ts, symbol, _ in replayed] == [(ts, symbol) for ts, symbol, _ in batched]
+    for (ts, symbol, live), (_, _, batch) in zip(replayed, batched):
+        assert live == batch, f"{symbol} @ {ts}: replay {live} != batch {batch}"
+
+
+if __name__ == "__main__":
+    test_replay_matches_batch()
+    print("[SUCCESS] test_replay_matches_batch")
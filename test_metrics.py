@@ -0,0 +1,112 @@
+"""
+지표 내보내기 검증 (네트워크 불필요)
+- render_prometheus(): 접두사 / # TYPE 줄 / service 레이블 / 요약 지표의 _count·_sum·_max / 레이블 이스케이프
+- render_json(): 관리자 대시보드(app/api/admin/stats/route.ts)가 읽는 필드
+  (service, updated_at, counters[name, labels, value], summaries[name, labels, count, sum, avg, max])
+- flush(): metrics-<service>.prom / .json / traces.jsonl 기록, 중첩 span은 trace_id 공유
+
+사용법: python test_metrics.py  (또는 python -m pytest -q test_metrics.py)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from crawler import metrics as metrics_module
+from crawler.metrics import MetricsRegistry
+
+NOW = 1_772_409_600.0
+
+
+def make_registry(directory=None):
+    with mock.patch.object(metrics_module.time, 'time', lambda: NOW):
+        registry = MetricsRegistry('crawler', directory=directory or tempfile.gettempdir())
+    registry.inc('news_fetch_total', source='Yahoo', result='ok')
+    registry.inc('news_fetch_total', source='Yahoo', result='ok')
+    registry.inc('cache_requests_total', cache='analysis', result='hit')
+    registry.inc('cache_requests_total', cache='analysis', result='miss', ignored=None)
+    registry.inc('http_errors_total', host='a"b')
+    registry.set_gauge('alpha_signals', 7)
+    registry.observe('news_fetch_seconds', 0.5, source='Yahoo')
+    registry.observe('news_fetch_seconds', 1.5, source='Yahoo')
+    return registry
+
+
+def test_prometheus_text():
+    registry = make_registry()
+    with mock.patch.object(metrics_module.time, 'time', lambda: NOW):
+        text = registry.render_prometheus()
+    assert text == "\n".join([
+        '# TYPE stock_empire_alpha_signals gauge',
+        'stock_empire_alpha_signals{service="crawler"} 7',
+        '# TYPE stock_empire_cache_requests_total counter',
+        'stock_empire_cache_requests_total{service="crawler",cache="analysis",result="hit"} 1',
+        'stock_empire_cache_requests_total{service="crawler",cache="analysis",result="miss"} 1',
+        '# TYPE stock_empire_http_errors_total counter',
+        'stock_empire_http_errors_total{service="crawler",host="a\\"b"} 1',
+        '# TYPE stock_empire_last_flush_timestamp_seconds gauge',
+        f'stock_empire_last_flush_timestamp_seconds{{service="crawler"}} {NOW}',
+        '# TYPE stock_empire_news_fetch_seconds summary',
+        'stock_empire_news_fetch_seconds_count{service="crawler",source="Yahoo"} 2',
+        'stock_empire_news_fetch_seconds_sum{service="crawler",source="Yahoo"} 2.0',
+        '# TYPE stock_empire_news_fetch_seconds_max gauge',
+        'stock_empire_news_fetch_seconds_max{service="crawler",source="Yahoo"} 1.5',
+        '# TYPE stock_empire_news_fetch_total counter',
+        'stock_empire_news_fetch_total{service="crawler",result="ok",source="Yahoo"} 2',
+    ]) + "\n"
+
+
+def test_json_snapshot_fields():
+    snapshot = make_registry().render_json()
+    assert snapshot['service'] == 'crawler'
+    assert snapshot['started_at'] == '2026-03-02T00:00:00+00:00'
+    assert snapshot['updated_at']
+    assert snapshot['counters'] == [
+        {'name': 'cache_requests_total', 'labels': {'cache': 'analysis', 'result': 'hit'}, 'value': 1},
+        {'name': 'cache_requests_total', 'labels': {'cache': 'analysis', 'result': 'miss'}, 'value': 1},
+        {'name': 'http_errors_total', 'labels': {'host': 'a"b'}, 'value': 1},
+        {'name': 'news_fetch_total', 'labels': {'result': 'ok', 'source': 'Yahoo'}, 'value': 2},
+    ]
+    assert snapshot['gauges'] == [{'name': 'alpha_signals', 'labels': {}, 'value': 7}]
+    assert snapshot['summaries'] == [{'name': 'news_fetch_seconds', 'labels': {'source': 'Yahoo'},
+                                      'count': 2, 'sum': 2.0, 'avg': 1.0, 'max': 1.5}]
+
+
+def test_flush_writes_files_and_traces():
+    root = tempfile.mkdtemp(prefix='metrics-test-')
+    try:
+        registry = make_registry(directory=root)
+        with registry.span('crawl.cycle', labels={'source': 'Yahoo'}) as attrs:
+            attrs['items'] = 3
+            with registry.span('publish'):
+                pass
+        registry.flush()
+
+        with open(os.path.join(root, 'metrics-crawler.json'), 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        names = {summary['name'] for summary in snapshot['summaries']}
+        assert {'crawl_cycle_seconds', 'publish_seconds', 'news_fetch_seconds'} <= names
+        with open(os.path.join(root, 'metrics-crawler.prom'), 'r', encoding='utf-8') as f:
+            assert '# TYPE stock_empire_crawl_cycle_seconds summary' in f.read()
+
+        with open(os.path.join(root, 'traces.jsonl'), 'r', encoding='utf-8') as f:
+            inner, outer = [json.loads(line) for line in f]
+        assert (inner['name'], outer['name']) == ('publish', 'crawl.cycle')
+        assert inner['trace_id'] == outer['trace_id'] and inner['parent_id'] == outer['span_id']
+        assert outer['parent_id'] is None and outer['status'] == 'ok'
+        assert outer['attrs'] == {'source': 'Yahoo', 'items': 3}
+
+        # 이미 기록한 span은 다시 쓰지 않음
+        registry.flush()
+        with open(os.path.join(root, 'traces.jsonl'), 'r', encoding='utf-8') as f:
+            assert len(f.readlines()) == 2
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    for test in (test_prometheus_text, test_json_snapshot_fields, test_flush_writes_files_and_traces):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
@@ -0,0 +1,128 @@
+"""
+뉴스 소스 스케줄 상태 검증 (네트워크 불필요, 가짜 HTTP 클라이언트 사용)
+- 이전 요청이 아직 진행 중이라 건너뛴 회차는 성공(주기 연장)으로도 실패(백오프)로도 세지 않음
+- 연속 실패 시 소스별 백오프가 poll_interval * factor^failures로 늘어나고 max_delay에서 멈춤, 성공하면 초기화
+- 실패하는 소스가 있어도 다른 소스의 기사는 같은 사이클에 발행
+
+사용법: python test_news_sources.py  (또는 python -m pytest -q test_news_sources.py)
+"""
+
+import asyncio
+from unittest import mock
+
+from crawler import news_sources as news_sources_module
+from crawler.metrics import get_metrics
+from crawler.news_sources import BackoffPolicy, NewsSource
+from crawler.us_news_crawler import StockNewsCrawler
+
+
+class NullPublisher:
+    def mark_dirty(self, *args, **kwargs):
+        pass
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b''):
+        self.status_code = status_code
+        self.content = content
+
+
+class FakeClient:
+    """URL별 응답 (예외 객체면 raise)"""
+
+    def __init__(self, responses):
+        self.responses = responses
+
+    def get(self, url, headers=None, timeout=None):
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def counter(name, **labels):
+    counters, _, _ = get_metrics().snapshot()
+    return counters.get((name, tuple(sorted((k, str(v)) for k, v in labels.items()))), 0)
+
+
+def new_crawler(*sources):
+    crawler = StockNewsCrawler(publisher=NullPublisher())
+    crawler.sources = list(sources)
+    crawler.http_cache = None
+    return crawler
+
+
+def test_in_flight_request_is_skipped_without_success_or_backoff():
+    source = NewsSource('Busy', 'https://example.com/busy', lambda content, limit: [], poll_interval=60,
+                        max_concurrency=1)
+    crawler = new_crawler(source)
+    source.failures = 2
+    source.next_due = 1234.0
+    skipped_before = counter('news_fetch_total', source='Busy', result='skipped')
+    errors_before = counter('news_fetch_total', source='Busy', result='error')
+
+    source._slots.acquire()   # 이전 회차 요청이 아직 진행 중
+    try:
+        assert crawler.fetch_source(source) == []
+    finally:
+        source._slots.release()
+
+    assert source.skipped and not source.not_modified
+    assert (source.failures, source.next_due) == (2, 1234.0)
+    assert counter('news_fetch_total', source='Busy', result='skipped') == skipped_before + 1
+    assert counter('news_fetch_total', source='Busy', result='error') == errors_before
+
+
+def test_backoff_grows_and_is_capped():
+    source = NewsSource('Flaky', 'https://example.com/flaky', lambda content, limit: [], poll_interval=60,
+                        backoff=BackoffPolicy(factor=2.0, max_delay=900))
+    delays = []
+    for _ in range(6):
+        source.mark_failure(now=1000.0)
+        delays.append(source.next_due - 1000.0)
+    assert delays == [120, 240, 480, 900, 900, 900]
+    assert source.failures == 6
+    assert not source.is_due(now=1000.0 + 800) and source.is_due(now=1000.0 + 900)
+
+    source.mark_success(now=5000.0)
+    assert (source.failures, source.next_due) == (0, 5060.0)
+    source.mark_failure(now=6000.0)
+    assert source.next_due == 6120.0   # 성공 후에는 처음부터 다시
+
+
+def test_failing_source_does_not_block_others():
+    def parser(content, limit):
+        return [{'id': 'ok_1', 'source': 'Healthy', 'title': "Healthy source headline about chip demand",
+                 'excerpt': '', 'link': content.decode('utf-8'), 'is_breaking': False}]
+
+    healthy = NewsSource('Healthy', 'https://example.com/healthy', parser, poll_interval=60)
+    down = NewsSource('Down', 'https://example.com/down', parser, poll_interval=60,
+                      backoff=BackoffPolicy(factor=2.0, max_delay=900))
+    broken = NewsSource('Broken', 'https://example.com/broken', parser, poll_interval=60)
+    crawler = new_crawler(down, healthy, broken)
+    crawler._translate_item = lambda item: [item]
+    crawler._analyze_items = lambda items: [(item, {'impact_score': 80}) for item in items]
+    crawler.build_news_entry = lambda item, analysis: {'id': item['id']}
+    client = FakeClient({down.url: ConnectionError("connection refused"),
+                         healthy.url: FakeResponse(200, b'https://example.com/healthy/1'),
+                         broken.url: FakeResponse(503)})
+    errors_before = counter('news_fetch_total', source='Down', result='error')
+
+    with mock.patch.object(news_sources_module, 'get_client', lambda: client):
+        published = asyncio.run(crawler.crawl_async())
+        assert [entry['id'] for entry in published] == ['ok_1']
+        assert (down.failures, broken.failures, healthy.failures) == (1, 1, 0)
+        first_delay = down.next_due
+        assert counter('news_fetch_total', source='Down', result='error') == errors_before + 1
+
+        # 다음 사이클에 다시 실패하면 백오프 간격이 늘어남 (120s -> 240s)
+        asyncio.run(crawler.crawl_async(sources=[down]))
+        assert down.failures == 2
+        assert down.next_due > first_delay
+
+
+if __name__ == "__main__":
+    for test in (test_in_flight_request_is_skipped_without_success_or_backoff, test_backoff_grows_and_is_capped,
+                 test_failing_source_does_not_block_others):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
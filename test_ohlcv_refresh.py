@@ -0,0 +1,104 @@
+"""
+일봉 저장소 갱신 검증 (네트워크 불필요, quote / chart 응답을 가짜로 대체)
+- 마지막 봉이 직전 거래일이면 quote 하나로 오늘 봉 병합 (주말은 빈 구간으로 보지 않음)
+- quote가 하루 이상 건너뛰면 병합하지 않고 chart로 빈 구간까지 보충
+- 이력이 없는 종목은 quote 요청 없이 chart로 수집
+
+사용법: python test_ohlcv_refresh.py  (또는 python -m pytest -q test_ohlcv_refresh.py)
+"""
+
+import shutil
+import tempfile
+
+import numpy as np
+
+from crawler.alpha_analyzer import AlphaAnalyzer
+from crawler.ohlcv_store import OHLCV_DTYPE, OhlcvStore
+
+DAY = 86400
+MON = 1_772_409_600     # 2026-03-02 (월) 00:00 UTC
+TUE, WED, THU, FRI = (MON + DAY * i for i in range(1, 5))
+NEXT_MON = MON + DAY * 7
+
+
+class NullPublisher:
+    def mark_dirty(self, *args, **kwargs):
+        pass
+
+
+def bars(*days):
+    return np.array([(day, 10.0, 11.0, 9.0, 10.0 + i, 1000.0) for i, day in enumerate(days)], dtype=OHLCV_DTYPE)
+
+
+def quote(symbol, day, price):
+    # 장중 시각 -> 일봉 타임스탬프(자정)로 맞춰 병합
+    return {'symbol': symbol, 'regularMarketPrice': price, 'regularMarketTime': day + 15 * 3600,
+            'regularMarketOpen': price, 'regularMarketDayHigh': price + 1, 'regularMarketDayLow': price - 1,
+            'regularMarketVolume': 5000}
+
+
+def chart(*days):
+    return {'timestamp': [day + 14 * 3600 for day in days],
+            'indicators': {'quote': [{'open': [20.0] * len(days), 'high': [21.0] * len(days),
+                                      'low': [19.0] * len(days), 'close': [20.0 + i for i in range(len(days))],
+                                      'volume': [2000] * len(days)}]}}
+
+
+def test_quote_gap_falls_back_to_chart_backfill():
+    root = tempfile.mkdtemp(prefix='ohlcv-test-')
+    try:
+        analyzer = AlphaAnalyzer(publisher=NullPublisher())
+        analyzer.store = OhlcvStore(root=root, interval='1d')
+        analyzer.store.append('AAA', bars(MON, TUE, WED, THU))
+        analyzer.store.append('BBB', bars(MON, TUE))                 # 수, 목 봉 없음
+        analyzer.store.append('CCC', bars(MON, TUE, WED, THU, FRI))
+
+        quote_requests, chart_requests = [], []
+
+        def fetch_quotes(symbols):
+            quote_requests.append(list(symbols))
+            return {'AAA': quote('AAA', FRI, 50.0), 'BBB': quote('BBB', FRI, 60.0),
+                    'CCC': quote('CCC', NEXT_MON, 70.0)}
+
+        def fetch_chart(symbol, url=None):
+            chart_requests.append(symbol)
+            return {'BBB': chart(TUE, WED, THU, FRI), 'DDD': chart(THU, FRI)}[symbol]
+
+        analyzer.fetch_quotes = fetch_quotes
+        analyzer.fetch_chart = fetch_chart
+        assert analyzer.refresh_store(['AAA', 'BBB', 'CCC', 'DDD']) == ['AAA', 'BBB', 'CCC', 'DDD']
+
+        assert quote_requests == [['AAA', 'BBB', 'CCC']]
+        assert sorted(chart_requests) == ['BBB', 'DDD']
+
+        aaa = analyzer.store.load('AAA')
+        assert list(aaa['ts']) == [MON, TUE, WED, THU, FRI] and aaa['close'][-1] == 50.0
+        bbb = analyzer.store.load('BBB')
+        assert list(bbb['ts']) == [MON, TUE, WED, THU, FRI]
+        assert list(bbb['close']) == [10.0, 20.0, 21.0, 22.0, 23.0]  # chart 값 (화요일 봉은 확정 값으로 교체)
+        ccc = analyzer.store.load('CCC')
+        assert list(ccc['ts'][-2:]) == [FRI, NEXT_MON] and ccc['close'][-1] == 70.0
+        assert list(analyzer.store.load('DDD')['ts']) == [THU, FRI]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_stale_quote_is_not_merged():
+    root = tempfile.mkdtemp(prefix='ohlcv-test-')
+    try:
+        analyzer = AlphaAnalyzer(publisher=NullPublisher())
+        analyzer.store = OhlcvStore(root=root, interval='1d')
+        analyzer.store.append('AAA', bars(MON, TUE, WED))
+        # quote 시각이 저장된 마지막 봉보다 이전 -> 병합하지 않음
+        assert not analyzer.merge_quote('AAA', quote('AAA', TUE, 99.0))
+        assert not analyzer.merge_quote('AAA', {'symbol': 'AAA'})    # 시세 없음
+        assert analyzer.merge_quote('AAA', quote('AAA', WED, 12.5))   # 같은 날 임시 봉 갱신
+        assert list(analyzer.store.load('AAA')['close']) == [10.0, 11.0, 12.5]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    for test in (test_quote_gap_falls_back_to_chart_backfill, test_stale_quote_is_not_merged):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
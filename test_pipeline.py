@@ -0,0 +1,111 @@
+"""
+단계별 파이프라인 검증 (네트워크 불필요)
+- run_stages: 단계 출력 전달 / 배치 단계 / 오류 난 항목만 제외
+- 수집 단계 시간 초과: 느린 소스는 백오프, 다른 소스 결과는 그대로,
+  포기한 요청이 나중에 끝나도 성공으로 기록하지 않고 검증 헤더도 저장하지 않음
+
+사용법: python test_pipeline.py  (또는 python -m pytest -q test_pipeline.py)
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from crawler import http_cache as http_cache_module
+from crawler.http_cache import HttpValidatorCache
+from crawler.news_sources import BackoffPolicy, NewsSource
+from crawler.pipeline import Stage, run_stages
+from crawler.us_news_crawler import StockNewsCrawler
+
+
+class NullPublisher:
+    def mark_dirty(self, *args, **kwargs):
+        pass
+
+
+class FakeResponse:
+    def __init__(self, content, etag):
+        self.status_code = 200
+        self.content = content
+        self.headers = {'ETag': etag}
+
+
+class RoutingClient:
+    """URL별 지연 시간 후 응답 (느린 소스 흉내)"""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.finished = threading.Event()
+
+    def get(self, url, headers=None, timeout=None):
+        time.sleep(self.delays.get(url, 0))
+        if self.delays.get(url):
+            self.finished.set()
+        return FakeResponse(url.encode('utf-8'), f'"{url}"')
+
+
+def parser_for(name):
+    return lambda content, limit: [{'id': f"{name}-1", 'source': name, 'title': f"{name} headline number one",
+                                    'excerpt': '', 'link': content.decode('utf-8'), 'is_breaking': False}]
+
+
+def test_run_stages_passes_outputs_and_drops_errors():
+    def double(x):
+        if x == 3:
+            raise ValueError("bad item")
+        return [x * 2]
+
+    stages = [
+        Stage('double', double, concurrency=2),
+        Stage('sum', lambda batch: [sum(batch)], batch_size=10),
+    ]
+    assert asyncio.run(run_stages([1, 2, 3, 4], stages)) == [14]
+
+
+def test_timed_out_source_is_backed_off_and_late_result_ignored():
+    root = tempfile.mkdtemp(prefix='pipeline-test-')
+    path = os.path.join(root, 'validators.json')
+    try:
+        fast = NewsSource('Fast', 'https://fast.example.com/rss', parser_for('Fast'), poll_interval=60, timeout=5)
+        slow = NewsSource('Slow', 'https://slow.example.com/rss', parser_for('Slow'), poll_interval=60, timeout=0.2,
+                          backoff=BackoffPolicy(factor=2.0, max_delay=900))
+        crawler = StockNewsCrawler(publisher=NullPublisher())
+        crawler.sources = [fast, slow]
+        crawler.http_cache = HttpValidatorCache(path=path)
+        crawler._translate_item = lambda item: [item]
+        crawler._analyze_items = lambda items: [(item, {'impact_score': 80}) for item in items]
+        crawler.build_news_entry = lambda item, analysis: {'id': item['id']}
+        client = RoutingClient({slow.url: 0.8})
+
+        with mock.patch.object(http_cache_module, 'get_client', lambda: client):
+            started = time.monotonic()
+            published = asyncio.run(crawler.crawl_async())
+            assert [entry['id'] for entry in published] == ['Fast-1']
+
+            # 느린 소스: 시간 초과 -> 실패 1회 + 백오프 (poll_interval * 2)
+            assert slow.failures == 1
+            backed_off_until = slow.next_due
+            assert backed_off_until - started >= 120 - 1
+            assert fast.failures == 0
+
+            # 포기한 요청이 나중에 끝나도 성공으로 기록하지 않음
+            assert client.finished.wait(3)
+            time.sleep(0.1)
+        assert slow.failures == 1
+        assert slow.next_due == backed_off_until
+        slow.commit_validators(crawler.http_cache)
+        assert list(crawler.http_cache.entries) == [fast.url]
+        assert 'If-None-Match' not in crawler.http_cache.conditional_headers(slow.url)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    for test in (test_run_stages_passes_outputs_and_drops_errors,
+                 test_timed_out_source_is_backed_off_and_late_result_ignored):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
@@ -0,0 +1,145 @@
+"""
+GitPublisher 로컬 검증 (네트워크 불필요)
+- 로컬 bare 저장소를 원격(origin) 대신 사용
+- 정상 발행 / 원격이 같은 파일을 먼저 커밋한 경우(rebase) / 해결 불가 충돌(abort) / detached HEAD(발행 보류)
+
+사용법: python test_publisher.py  (또는 python -m pytest -q test_publisher.py)
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+
+from crawler.publisher import GitPublisher
+
+TARGET = os.path.join('public', 'alpha-signals.json')
+
+
+def git(cwd, *args):
+    res = subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True)
+    if res.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {res.stderr.strip()}")
+    return res.stdout.strip()
+
+
+def clone(remote, path):
+    git(os.path.dirname(path), 'clone', '--quiet', '--branch', 'main', remote, path)
+    git(path, 'config', 'user.name', 'publisher-test')
+    git(path, 'config', 'user.email', 'publisher-test@example.com')
+    return path
+
+
+def write(repo, content, rel_path=TARGET):
+    path = os.path.join(repo, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+def remote_file(remote, rel_path=TARGET):
+    return git(remote, 'show', f"main:{rel_path.replace(os.sep, '/')}")
+
+
+def make_repos():
+    """bare 원격 + 초기 커밋 + 작업 클론(publisher용) + 다른 작성자 클론(GitHub Actions 역할)"""
+    root = tempfile.mkdtemp(prefix='publisher-test-')
+    remote = os.path.join(root, 'remote.git')
+    git(root, 'init', '--quiet', '--bare', '--initial-branch=main', remote)
+    seed = os.path.join(root, 'seed')
+    git(root, 'init', '--quiet', '--initial-branch=main', seed)
+    git(seed, 'config', 'user.name', 'publisher-test')
+    git(seed, 'config', 'user.email', 'publisher-test@example.com')
+    write(seed, '{"v": 0}\n')
+    write(seed, 'seed\n', 'README.md')
+    git(seed, 'add', '-A')
+    git(seed, 'commit', '--quiet', '-m', 'seed')
+    git(seed, 'push', '--quiet', remote, 'main:main')
+    return root, remote, clone(remote, os.path.join(root, 'work')), clone(remote, os.path.join(root, 'other'))
+
+
+def new_publisher(work):
+    return GitPublisher(repo_dir=work, debounce=0, max_delay=0, max_retries=1)
+
+
+def test_publish_pushes_commit():
+    root, remote, work, _ = make_repos()
+    try:
+        publisher = new_publisher(work)
+        publisher._publish({TARGET: "Alpha signals"})
+        assert remote_file(remote) == '{"v": 0}'   # 내용이 같으면 커밋하지 않음
+
+        write(work, '{"v": 1}\n')
+        publisher._publish({TARGET: "Alpha signals"})
+        assert remote_file(remote) == '{"v": 1}'
+        assert not publisher._unpushed
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_conflicting_remote_commit_is_rebased():
+    root, remote, work, other = make_repos()
+    try:
+        # 다른 작성자(워크플로)가 같은 파일을 먼저 푸시
+        write(other, '{"v": "workflow"}\n')
+        git(other, 'commit', '--quiet', '-am', 'workflow update')
+        git(other, 'push', '--quiet', 'origin', 'main')
+
+        publisher = new_publisher(work)
+        write(work, '{"v": "crawler"}\n')
+        publisher._publish({TARGET: "Alpha signals"})
+
+        assert remote_file(remote) == '{"v": "crawler"}'   # 새로 만든 데이터가 우선
+        assert 'workflow update' in git(remote, 'log', '--format=%s', 'main')
+        assert git(work, 'symbolic-ref', '--short', 'HEAD') == 'main'
+        assert not publisher._unpushed
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_unresolvable_conflict_is_aborted():
+    root, remote, work, other = make_repos()
+    try:
+        # 원격에서 파일 삭제 vs 로컬 수정 -> rebase로 해결 불가
+        git(other, 'rm', '--quiet', TARGET)
+        git(other, 'commit', '--quiet', '-m', 'remove signals')
+        git(other, 'push', '--quiet', 'origin', 'main')
+        remote_head = git(remote, 'rev-parse', 'main')
+
+        publisher = new_publisher(work)
+        write(work, '{"v": "crawler"}\n')
+        publisher._publish({TARGET: "Alpha signals"})
+
+        git_dir = os.path.join(work, '.git')
+        assert not os.path.exists(os.path.join(git_dir, 'rebase-merge'))
+        assert not os.path.exists(os.path.join(git_dir, 'rebase-apply'))
+        assert git(work, 'symbolic-ref', '--short', 'HEAD') == 'main'
+        assert git(remote, 'rev-parse', 'main') == remote_head
+        assert publisher._unpushed                      # 로컬 커밋은 다음 발행 때 다시 시도
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_detached_head_is_not_published():
+    root, remote, work, _ = make_repos()
+    try:
+        remote_head = git(remote, 'rev-parse', 'main')
+        git(work, 'checkout', '--quiet', '--detach')
+
+        publisher = new_publisher(work)
+        write(work, '{"v": "detached"}\n')
+        publisher._publish({TARGET: "Alpha signals"})
+
+        assert git(remote, 'rev-parse', 'main') == remote_head
+        assert git(work, 'rev-parse', 'HEAD') == remote_head   # detached HEAD에 커밋하지 않음
+        assert TARGET in publisher._dirty                      # 다시 대기열에 들어감
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    for test in (test_publish_pushes_commit, test_conflicting_remote_commit_is_rebased,
+                 test_unresolvable_conflict_is_aborted, test_detached_head_is_not_published):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
@@ -0,0 +1,202 @@
+"""
+스케줄러 / 소스별 주기 검증 (네트워크 불필요, 가짜 시계 사용)
+- MarketHoursTrigger: 서머타임 전환 주말 / NYSE 휴일 / 조기 폐장일 (zoneinfo 없이 직접 계산하는 경로 포함)
+- CronExpression.next_after / CronTrigger(뉴욕 시간)
+- 재시작 후 저장된 상태로 놓친 실행 catch-up, 같은 작업이 아직 실행 중이면 그 회차는 건너뜀
+- 스케줄러 틱(NEWS_TRIGGER 간격)과 소스 poll_interval이 같을 때 매 틱마다 수집되는지 (틱 하나씩 건너뛰지 않음)
+
+사용법: python test_scheduler.py  (또는 python -m pytest -q test_scheduler.py)
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+from datetime import date, datetime, timezone
+from unittest import mock
+
+from crawler import scheduler as scheduler_module
+from crawler.news_sources import NewsSource
+from crawler.scheduler import (MARKET_CLOCK, CronExpression, CronTrigger, IntervalTrigger, MarketHoursTrigger,
+                               Scheduler, is_trading_day, market_session)
+from crawler.us_news_crawler import StockNewsCrawler
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+class FakeClock:
+    """time.time / time.monotonic 대체 (sleep 없이 시각을 직접 진행)"""
+
+    def __init__(self, start=1_700_000_000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    def patch(self):
+        return mock.patch.multiple('time', time=self, monotonic=self)
+
+
+class SlowCache:
+    """조건부 GET 대신 사용: 요청마다 시계를 duration만큼 진행하고 시작 시각을 기록"""
+
+    def __init__(self, clock, duration):
+        self.clock = clock
+        self.duration = duration
+        self.fetched_at = []
+
+    def fetch(self, url, headers=None, timeout=None):
+        self.fetched_at.append(self.clock.now)
+        self.clock.advance(self.duration)
+        return b'<rss/>', None
+
+    def remember(self, url, validators):
+        pass
+
+
+def test_market_hours_across_dst_switch():
+    trigger = MarketHoursTrigger(regular=60, extended=300, closed=None)
+    # 2026-03-06(금) 애프터마켓 마지막 1분 (EST, UTC-5) -> 5분 간격이지만 20:00 경계에서 멈춤
+    assert trigger.next_time(utc(2026, 3, 7, 0, 59)) == utc(2026, 3, 7, 1, 0)
+    # 주말 휴장 -> 서머타임 시작(3/8) 이후 월요일 04:00 EDT = 08:00 UTC (EST였다면 09:00 UTC)
+    assert trigger.next_time(utc(2026, 3, 7, 1, 0)) == utc(2026, 3, 9, 8, 0)
+    # 월요일 09:30 EDT 정규장 -> 16:00 EDT(20:00 UTC)까지
+    assert market_session(utc(2026, 3, 9, 13, 30)) == ('regular', utc(2026, 3, 9, 20, 0))
+    # 11/1 서머타임 해제 이후 금요일 09:30 EST = 14:30 UTC
+    assert market_session(utc(2026, 11, 6, 14, 29))[0] == 'pre'
+    assert market_session(utc(2026, 11, 6, 14, 30))[0] == 'regular'
+
+
+def test_market_hours_without_tzdata():
+    # zoneinfo가 없을 때(Windows 등) 직접 계산한 서머타임 규칙도 같은 결과
+    with mock.patch.object(scheduler_module, 'MARKET_TZ', None):
+        trigger = MarketHoursTrigger(regular=60, extended=300, closed=None)
+        assert trigger.next_time(utc(2026, 3, 7, 1, 0)) == utc(2026, 3, 9, 8, 0)
+        assert MARKET_CLOCK.to_local(utc(2026, 11, 2, 14, 30)) == datetime(2026, 11, 2, 9, 30)
+
+
+def test_market_hours_skip_holiday_and_early_close():
+    trigger = MarketHoursTrigger(regular=60, extended=300, closed=None)
+    # 2026-04-03 Good Friday 휴장 -> 목요일 애프터마켓이 끝나면 다음 실행은 월요일 프리마켓
+    assert not is_trading_day(date(2026, 4, 3))
+    assert trigger.next_time(utc(2026, 4, 3, 0, 0)) == utc(2026, 4, 6, 8, 0)
+    # 추수감사절 다음날(11/27) 13:00 EST 조기 폐장
+    assert market_session(utc(2026, 11, 27, 17, 59)) == ('regular', utc(2026, 11, 27, 18, 0))
+    assert market_session(utc(2026, 11, 27, 18, 0))[0] == 'post'
+    # 휴장 구간에도 주기가 있으면 그 주기로 실행
+    closed = MarketHoursTrigger(regular=60, extended=300, closed=1800)
+    assert closed.next_time(utc(2026, 4, 3, 12, 0)) == utc(2026, 4, 3, 12, 30)
+
+
+def test_cron_next_after():
+    # 평일 9~16시 15분마다 -> 금요일 16:50 다음은 월요일 09:00
+    assert CronExpression('*/15 9-16 * * 1-5').next_after(datetime(2026, 3, 6, 16, 50)) == datetime(2026, 3, 9, 9, 0)
+    assert CronExpression('*/15 9-16 * * 1-5').next_after(datetime(2026, 3, 9, 9, 0)) == datetime(2026, 3, 9, 9, 15)
+    # 일/요일을 둘 다 지정하면 둘 중 하나만 맞아도 실행 (2/1 다음은 첫 일요일 2/8)
+    assert CronExpression('0 12 1 * 0').next_after(datetime(2026, 2, 2)) == datetime(2026, 2, 8, 12, 0)
+    # 요일 7 = 일요일
+    assert CronExpression('0 12 * * 7').next_after(datetime(2026, 2, 2)) == datetime(2026, 2, 8, 12, 0)
+    # 윤년에만 있는 날짜
+    assert CronExpression('0 0 29 2 *').next_after(datetime(2026, 1, 1)) == datetime(2028, 2, 29, 0, 0)
+    # 뉴욕 시간 기준 -> 서머타임 전후로 UTC 시각이 달라짐
+    trigger = CronTrigger('30 9 * * 1-5', clock=MARKET_CLOCK)
+    assert trigger.next_time(utc(2026, 3, 6, 13, 0)) == utc(2026, 3, 6, 14, 30)
+    assert trigger.next_time(utc(2026, 3, 6, 15, 0)) == utc(2026, 3, 9, 13, 30)
+
+
+def test_catch_up_after_restart():
+    root = tempfile.mkdtemp(prefix='scheduler-test-')
+    state_path = os.path.join(root, 'state.json')
+    clock = FakeClock()
+    runs = []
+    try:
+        with clock.patch():
+            first = Scheduler(state_path=state_path)
+            first.add('job', lambda: runs.append(clock.now), IntervalTrigger(600), catch_up=1800, run_at_start=True)
+            first.start()
+            first.run_pending()
+            assert runs == [clock.now]
+            last_run = clock.now
+
+            # 15분 꺼져 있다가 재시작 -> 10분 시점 실행을 놓침 (catch_up 이내) -> 바로 실행
+            clock.advance(900)
+            restarted = Scheduler(state_path=state_path)
+            restarted.add('job', lambda: runs.append(clock.now), IntervalTrigger(600), catch_up=1800)
+            restarted.start()
+            assert restarted.jobs[0].last_run == last_run
+            assert restarted.jobs[0].next_run == clock.now
+            restarted.run_pending()
+            assert len(runs) == 2
+
+            # 한참 뒤(catch_up 초과) 재시작 -> 놓친 실행은 버리고 다음 예정 시각부터
+            clock.advance(7200)
+            late = Scheduler(state_path=state_path)
+            late.add('job', lambda: runs.append(clock.now), IntervalTrigger(600), catch_up=1800)
+            late.start()
+            assert late.jobs[0].next_run == clock.now + 600
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_overlapping_run_is_skipped():
+    release = threading.Event()
+    calls = []
+
+    def slow_job():
+        calls.append(1)
+        release.wait(5)
+
+    async def run():
+        scheduler = Scheduler()
+        scheduler.add('slow', slow_job, IntervalTrigger(0.1), run_at_start=True)
+        stop = asyncio.Event()
+        task = asyncio.create_task(scheduler.run_async(stop))
+        # 0.1초 간격 실행이 여러 번 돌아오는 동안 첫 실행이 끝나지 않음
+        await asyncio.sleep(0.6)
+        stop.set()
+        release.set()
+        await task
+        return scheduler.jobs[0]
+
+    job = asyncio.run(run())
+    assert calls == [1]
+    assert not job.running
+
+
+def test_source_is_fetched_on_every_tick():
+    clock = FakeClock()
+    with clock.patch():
+        crawler = StockNewsCrawler()
+        source = NewsSource('Fast', 'https://example.com/rss', lambda content, limit: [], poll_interval=60)
+        crawler.sources = [source]
+        crawler.http_cache = SlowCache(clock, duration=0.4)
+
+        def crawl():
+            for due in crawler.due_sources():
+                crawler.fetch_source(due)
+
+        scheduler = Scheduler()
+        scheduler.add('news', crawl, IntervalTrigger(60), run_at_start=True)
+        scheduler.start()
+        started = clock.now
+        for _ in range(10):
+            # 스케줄러가 예정 시각보다 조금 늦게 깨어나는 경우 (이벤트 루프 / sleep 지연)
+            clock.now = scheduler.jobs[0].next_run + 0.05
+            scheduler.run_pending()
+
+    offsets = [round(ts - started) for ts in crawler.http_cache.fetched_at]
+    assert offsets == [0, 60, 120, 180, 240, 300, 360, 420, 480, 540], offsets
+
+
+if __name__ == "__main__":
+    for test in (test_market_hours_across_dst_switch, test_market_hours_without_tzdata,
+                 test_market_hours_skip_holiday_and_early_close, test_cron_next_after, test_catch_up_after_restart,
+                 test_overlapping_run_is_skipped, test_source_is_fetched_on_every_tick):
+        test()
+        print(f"[SUCCESS] {test.__name__}")
@@ -0,0 +1,56 @@
+"""
+알파 시그널 변경 감지 검증
+- 같은 전략이 이어지는 동안 시세만 바뀌면 이벤트 없음 (Neutral 종목이 0% 부근을 오가도 changed 없음)
+- 전략이 바뀌면 changed, 사라진 종목은 expired
+
+사용법: python test_signal_log.py  (또는 python -m pytest -q test_signal_log.py)
+"""
+
+from crawler.alpha_analyzer import AlphaAnalyzer
+from crawler.signal_log import diff_signals
+from crawler.strategies import STRATEGY_NEUTRAL, STRATEGY_RSI_REBOUND
+
+DAY = 86400
+START = 1_772_409_600   # 2026-03-02 00:00 UTC
+
+
+class NullPublisher:
+    def mark_dirty(self, *args, **kwargs):
+        pass
+
+
+def row(close, change_pct, ts, strategy=STRATEGY_NEUTRAL, since_ts=START, rsi=50.0):
+    return {'close': close, 'prev_close': close / (1 + change_pct / 100), 'change_pct': change_pct, 'rsi': rsi,
+            'sma5': close, 'sma20': close, 'sma50': close, 'sma200': close, 'golden_cross': 0.0,
+            'atr14': 2.0, 'volume_z': 0.5, 'ts': ts, 'strategy': strategy, 'strategy_ts': since_ts}
+
+
+def test_neutral_drift_across_zero_is_not_a_change():
+    analyzer = AlphaAnalyzer(publisher=NullPublisher())
+    up = analyzer.build_signal('AAA', row(100.0, 0.4, START))
+    previous, events = diff_signals([], [up])
+    assert [kind for kind, _ in events] == ['new']
+
+    down = analyzer.build_signal('AAA', row(99.5, -0.5, START + DAY))
+    assert down['sentiment'] == up['sentiment'] == 'NEUTRAL'
+    current, events = diff_signals(previous, [down])
+    assert events == []
+    assert current[0]['id'] == up['id']
+    assert (current[0]['target_price'], current[0]['stop_loss']) == (up['target_price'], up['stop_loss'])
+
+
+def test_strategy_change_and_expiry_are_reported():
+    analyzer = AlphaAnalyzer(publisher=NullPublisher())
+    previous = [analyzer.build_signal('AAA', row(100.0, 0.4, START)),
+                analyzer.build_signal('BBB', row(50.0, 0.1, START))]
+    rebound = analyzer.build_signal('AAA', row(96.0, -2.0, START + DAY, strategy=STRATEGY_RSI_REBOUND,
+                                                since_ts=START + DAY, rsi=28.0))
+    _, events = diff_signals(previous, [rebound])
+    assert sorted((kind, signal['ticker']) for kind, signal in events) == [
+        ('expired', 'AAA'), ('expired', 'BBB'), ('new', 'AAA')]
+
+
+if __name__ == "__main__":
+    for test in (test_neutral_drift_across_zero_is_not_a_change, test_strategy_change_and_expiry_are_reported):
+        test()
+        print(f"[SUCCESS] {test.__name__}")